@@ -0,0 +1,73 @@
+"""Benchmark `safetywrap.iter.amap` against `Result.gather`.
+
+Runs 100,000 async calls, each wrapped in a Result, and counts the Oks.
+It is run once with `amap()`, which keeps at most `CONCURRENCY` calls in
+flight, and once with `Result.gather()` in `collect_all` mode, which
+starts a Task for every call at once, and the peak memory and time of
+each are reported.
+"""
+
+import asyncio
+import tracemalloc
+import typing as t
+
+from timeit import timeit
+
+from safetywrap import Result
+from safetywrap.iter import amap
+
+
+SIZE = 100_000
+CONCURRENCY = 100
+
+
+async def _work(val: int) -> int:
+    await asyncio.sleep(0)
+    return val
+
+
+async def _with_gather() -> int:
+    result = await Result.gather(
+        *(Result.of_async(_work, idx) for idx in range(SIZE)),
+        mode="collect_all",
+    )
+    return len(result.unwrap())
+
+
+async def _with_amap() -> int:
+    count = 0
+    async for result in amap(_work, range(SIZE), concurrency=CONCURRENCY):
+        count += result.is_ok()
+    return count
+
+
+def with_gather() -> int:
+    """Run every call at once with `Result.gather()`."""
+    return asyncio.run(_with_gather())
+
+
+def with_amap() -> int:
+    """Run the calls with bounded concurrency with `amap()`."""
+    return asyncio.run(_with_amap())
+
+
+def _peak(fn: t.Callable[[], t.Any]) -> int:
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    assert with_gather() == with_amap() == SIZE
+    print("{:<8} {:>18} {:>10}".format("", "peak memory (MiB)", "time (s)"))
+    for name, fn in (("gather", with_gather), ("amap", with_amap)):
+        peak = _peak(fn)
+        taken = timeit(fn, number=3) / 3
+        print("{:<8} {:>18.2f} {:>10.3f}".format(name, peak / 2 ** 20, taken))
+
+
+if __name__ == "__main__":
+    main()
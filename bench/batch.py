@@ -0,0 +1,104 @@
+"""Benchmark ResultBatch against a list of Results.
+
+Holds one million results (90% Ok) both as a list of `Ok`/`Err` instances
+and as a `ResultBatch`, and reports the memory each takes, along with the
+time taken by `map`, `collect`, and `partition` in each representation.
+"""
+
+import gc
+import tracemalloc
+import typing as t
+
+from timeit import timeit
+
+from safetywrap import Ok, Err, Result, ResultBatch
+
+
+SIZE = 1_000_000
+
+
+def _values() -> t.List[int]:
+    # Payloads are built up front so only the containers are measured
+    return list(range(1000, SIZE + 1000))
+
+
+def as_list(values: t.List[int]) -> t.List[Result[int, int]]:
+    """Wrap every value in an Ok or Err."""
+    return [Err(v) if v % 10 == 0 else Ok(v) for v in values]
+
+
+def as_batch(values: t.List[int]) -> ResultBatch[int, int]:
+    """Wrap every value in a batch."""
+    return ResultBatch.err_if(lambda v: v % 10 == 0, values)
+
+
+def _memory(build: t.Callable[[t.List[int]], t.Any]) -> int:
+    values = _values()
+    gc.collect()
+    tracemalloc.start()
+    built = build(values)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return size
+
+
+def _time(fn: t.Callable[[], t.Any], number: int = 5) -> float:
+    return timeit(fn, number=number) / number
+
+
+def _inc(val: int) -> int:
+    return val + 1
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    list_mem = _memory(as_list)
+    batch_mem = _memory(as_batch)
+    print("memory (MiB)")
+    print("  list of results  {:>8.1f}".format(list_mem / 2 ** 20))
+    print(
+        "  ResultBatch      {:>8.1f} ({:.1f}x smaller)".format(
+            batch_mem / 2 ** 20, list_mem / batch_mem
+        )
+    )
+
+    values = _values()
+    results = as_list(values)
+    batch = as_batch(values)
+    # Collecting stops at the first Err, so collect all-Ok inputs
+    ok_results: t.List[Result[int, int]] = [Ok(v) for v in values]
+    ok_batch = ResultBatch(ok_results)
+    cases = (
+        (
+            "map",
+            lambda: [r.map(_inc) for r in results],
+            lambda: batch.map(_inc),
+        ),
+        (
+            "collect",
+            lambda: Result.collect(ok_results),
+            ok_batch.collect,
+        ),
+        (
+            "partition",
+            lambda: (
+                [r.unwrap() for r in results if r.is_ok()],
+                [r.unwrap_err() for r in results if r.is_err()],
+            ),
+            batch.partition,
+        ),
+    )
+    print("time per operation (s)")
+    for name, on_list, on_batch in cases:
+        list_time = _time(on_list)
+        batch_time = _time(on_batch)
+        print(
+            "  {:<10} list={:.4f} batch={:.4f} ({:.1f}x faster)".format(
+                name, list_time, batch_time, list_time / batch_time
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
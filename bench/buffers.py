@@ -0,0 +1,103 @@
+"""Benchmark `ResultBuffers` against unwrapping Results in a Python loop.
+
+For one million numeric Results (10% Err), times:
+
+- exporting columns (a validity mask, values, and error codes) for a
+  columnar consumer, by unwrapping each Result in a loop, and with
+  `ResultBuffers.from_results()` on a list and on a `ResultBatch`
+- summing the Ok values from each, including with NumPy if installed
+- importing existing columns, as a list of Results and with
+  `ResultBuffers.from_buffers()`
+"""
+
+import timeit
+import typing as t
+from array import array
+from itertools import compress
+
+from safetywrap import Err, Ok, Result, ResultBatch
+from safetywrap.buffers import ResultBuffers
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+SIZE = 1_000_000
+NUMBER = 5
+
+
+def _unwrap(
+    results: t.List[Result[float, int]]
+) -> t.Tuple[t.List[bool], "array[float]", "array[int]"]:
+    mask = []
+    values = array("d")
+    errors = array("q")
+    for res in results:
+        if res.is_ok():
+            mask.append(True)
+            values.append(res.unwrap())
+            errors.append(0)
+        else:
+            mask.append(False)
+            values.append(0.0)
+            errors.append(res.unwrap_err())
+    return mask, values, errors
+
+
+def _sum_numpy(buffers: ResultBuffers[float, int]) -> float:
+    bits = np.frombuffer(buffers.validity, dtype=np.uint8)
+    mask = np.unpackbits(bits, bitorder="little")[: len(buffers)]
+    return float(np.frombuffer(buffers.values)[mask.view(bool)].sum())
+
+
+def _time(fn: t.Callable[[], t.Any]) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=NUMBER))
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    results: t.List[Result[float, int]] = [
+        Err(idx) if idx % 10 == 0 else Ok(float(idx)) for idx in range(SIZE)
+    ]
+    batch = ResultBatch(results)
+    mask, values, errors = _unwrap(results)
+    buffers = ResultBuffers.from_results(batch)
+    validity = bytes(buffers.validity)
+    expected = sum(compress(values, mask))
+
+    print("{:<34} {:>10}".format("", "time (s)"))
+    cases: t.List[t.Tuple[str, t.Callable[[], t.Any]]] = [
+        ("export: unwrap loop", lambda: _unwrap(results)),
+        ("export: from_results(list)", lambda: ResultBuffers.from_results(
+            results
+        )),
+        ("export: from_results(batch)", lambda: ResultBuffers.from_results(
+            batch
+        )),
+        ("sum: Results", lambda: sum(
+            res.unwrap() for res in results if res.is_ok()
+        )),
+        ("sum: buffers", lambda: sum(
+            compress(buffers.values, buffers.tags())
+        )),
+    ]
+    if np is not None:
+        assert _sum_numpy(buffers) == expected
+        cases.append(("sum: buffers via numpy", lambda: _sum_numpy(buffers)))
+    cases += [
+        ("import: list of Results", lambda: [
+            Ok(val) if ok else Err(err)
+            for ok, val, err in zip(mask, values, errors)
+        ]),
+        ("import: from_buffers", lambda: ResultBuffers.from_buffers(
+            SIZE, validity, values, errors
+        )),
+    ]
+    for name, fn in cases:
+        print("{:<34} {:>10.4f}".format(name, _time(fn)))
+
+
+if __name__ == "__main__":
+    main()
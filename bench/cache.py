@@ -0,0 +1,74 @@
+"""Benchmark `result_cache()` on a cascade of lookups in data stores.
+
+As in `sample.py`, a key is looked up in several `MonadicDataStore`s in
+turn, and only the last has it. Each `get()` is a stand-in for a call to a
+backend, taking at least 10us. 20,000 lookups of 1,000 keys, half of
+which exist, are made with each store's `get()` uncached, wrapped in
+`functools.lru_cache`, and wrapped in `result_cache()`, which caches
+`Nothing()` misses for a shorter time (unlike `lru_cache`, whose entries
+never expire). The number of backend calls and the time taken are
+reported.
+"""
+
+import functools
+import time
+import typing as t
+
+from sample import MonadicDataStore
+
+from safetywrap import Option
+from safetywrap.cache import result_cache
+
+
+KEYS = 1_000
+LOOKUPS = 20_000
+STORES = 4
+LATENCY = 10e-6
+
+
+class CountingStore(MonadicDataStore):
+    """A data store counting calls to its backend."""
+
+    calls = 0
+
+    def get(self, key: str) -> Option[t.Any]:
+        """Return a value from the store."""
+        CountingStore.calls += 1
+        deadline = time.perf_counter() + LATENCY
+        while time.perf_counter() < deadline:
+            pass
+        return super().get(key)
+
+
+def _run(wrap: t.Callable[[t.Any], t.Any]) -> t.Tuple[int, float]:
+    stores = [CountingStore() for _ in range(STORES - 1)]
+    stores.append(CountingStore({str(idx): idx for idx in range(0, KEYS, 2)}))
+    getters = [wrap(store.get) for store in stores]
+    CountingStore.calls = 0
+    start = time.perf_counter()
+    for idx in range(LOOKUPS):
+        key = str(idx % KEYS)
+        for get in getters:
+            if get(key).is_some():
+                break
+    return CountingStore.calls, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    cases: t.Tuple[t.Tuple[str, t.Callable[[t.Any], t.Any]], ...] = (
+        ("uncached", lambda fn: fn),
+        ("lru_cache", functools.lru_cache(maxsize=KEYS)),
+        (
+            "result_cache",
+            result_cache(maxsize=KEYS, ttl=300, nothing_ttl=30),
+        ),
+    )
+    print("{:<14} {:>14} {:>10}".format("", "backend calls", "time (s)"))
+    for name, wrap in cases:
+        calls, taken = _run(wrap)
+        print("{:<14} {:>14} {:>10.3f}".format(name, calls, taken))
+
+
+if __name__ == "__main__":
+    main()
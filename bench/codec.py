@@ -0,0 +1,95 @@
+"""Benchmark `safetywrap.codec` against ad-hoc dict encoding.
+
+Encodes 200,000 Results (10% Err) to an in-memory file and decodes them
+again, in three ways: a hand-rolled `{"ok": ...}` or `{"err": ...}` dict
+per line of JSON, `codec.write_json_lines()` and `read_json_lines()`, and
+`codec.write_frames()` and `read_frames()`. The encoded size and the
+encode and decode throughput of each are reported.
+"""
+
+import io
+import json
+import time
+import typing as t
+
+from safetywrap import Err, Ok, Result
+from safetywrap import codec
+
+
+SIZE = 200_000
+
+ITEMS: t.List[Result[t.Any, str]] = [
+    Err("invalid record") if idx % 10 == 0 else Ok({"id": idx, "v": 1.5})
+    for idx in range(SIZE)
+]
+
+
+def adhoc_encode(items: t.Iterable[Result[t.Any, str]], fp: t.TextIO) -> None:
+    """Write a dict per Result, by hand."""
+    for item in items:
+        if item.is_ok():
+            fp.write(json.dumps({"ok": item.unwrap()}) + "\n")
+        else:
+            fp.write(json.dumps({"err": item.unwrap_err()}) + "\n")
+
+
+def adhoc_decode(fp: t.TextIO) -> t.List[Result[t.Any, str]]:
+    """Read a dict per Result, by hand."""
+    results: t.List[Result[t.Any, str]] = []
+    for line in fp:
+        obj = json.loads(line)
+        results.append(Ok(obj["ok"]) if "ok" in obj else Err(obj["err"]))
+    return results
+
+
+def _run(
+    name: str,
+    buf: t.Union[io.StringIO, io.BytesIO],
+    encode: t.Callable[[t.Any], t.Any],
+    decode: t.Callable[[t.Any], t.Iterable[t.Any]],
+) -> None:
+    start = time.perf_counter()
+    encode(buf)
+    encoded = time.perf_counter() - start
+    size = buf.tell()
+    buf.seek(0)
+    start = time.perf_counter()
+    decoded = list(decode(buf))
+    taken = time.perf_counter() - start
+    assert decoded == ITEMS
+    print(
+        "{:<12} {:>10} {:>14.2f} {:>14.2f}".format(
+            name, size, SIZE / encoded / 1e6, SIZE / taken / 1e6
+        )
+    )
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    print(
+        "{:<12} {:>10} {:>14} {:>14}".format(
+            "", "bytes", "encode (M/s)", "decode (M/s)"
+        )
+    )
+    _run(
+        "ad hoc",
+        io.StringIO(),
+        lambda fp: adhoc_encode(ITEMS, fp),
+        adhoc_decode,
+    )
+    _run(
+        "json lines",
+        io.StringIO(),
+        lambda fp: codec.write_json_lines(ITEMS, fp),
+        codec.read_json_lines,
+    )
+    _run(
+        "frames",
+        io.BytesIO(),
+        lambda fp: codec.write_frames(ITEMS, fp),
+        codec.read_frames,
+    )
+
+
+if __name__ == "__main__":
+    main()
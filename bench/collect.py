@@ -0,0 +1,63 @@
+"""Scaling benchmark for Result.collect and Option.collect.
+
+Collects iterables of 10, 10,000, and 1,000,000 items, both when every
+item is a success and when the only failure is the final item, and
+reports the average time per call and per item. Per-item times should
+stay roughly flat as the size grows.
+"""
+
+import sys
+import typing as t
+
+from timeit import timeit
+
+from safetywrap import Some, Nothing, Ok, Err, Option, Result
+
+
+SIZES = (10, 10_000, 1_000_000)
+
+
+def _number(size: int) -> int:
+    """Return a number of runs giving roughly constant total work."""
+    return max(1, 1_000_000 // size)
+
+
+def _results(size: int, fail: bool) -> t.List[Result[int, str]]:
+    results: t.List[Result[int, str]] = [Ok(i) for i in range(size)]
+    if fail:
+        results[-1] = Err("no")
+    return results
+
+
+def _options(size: int, fail: bool) -> t.List[Option[int]]:
+    options: t.List[Option[int]] = [Some(i) for i in range(size)]
+    if fail:
+        options[-1] = Nothing()
+    return options
+
+
+def run(kind: str) -> None:
+    """Time collecting `kind` ("result" or "option") at each size."""
+    build, collect = {
+        "result": (_results, Result.collect),
+        "option": (_options, Option.collect),
+    }[kind]
+    for fail in (False, True):
+        for size in SIZES:
+            items = build(size, fail)
+            number = _number(size)
+            taken = timeit(lambda: collect(items), number=number) / number
+            print(
+                "{:<7} size={:<9,} fail_last={!s:<5} "
+                "{:.3e} s/call {:.3e} s/item".format(
+                    kind, size, fail, taken, taken / size
+                )
+            )
+
+
+if __name__ == "__main__":
+    kinds = sys.argv[1:] or ["result", "option"]
+    for to_run in kinds:
+        if to_run not in ("result", "option"):
+            raise RuntimeError("No such benchmark: {}".format(to_run))
+        run(to_run)
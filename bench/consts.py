@@ -0,0 +1,81 @@
+"""Allocation benchmark for interned constants.
+
+Builds one million common results, once by calling the constructors and
+once via `of_const()`, and reports the memory allocated, the number of
+allocated blocks still live, the number of generation-0 garbage
+collections triggered, and the time taken.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+import typing as t
+
+from safetywrap import Some, Ok, Err
+
+
+NUMBER = 1_000_000
+
+PAYLOADS = (None, True, False, 0, None)
+
+
+def constructed() -> t.List[t.Any]:
+    """Build results using the constructors."""
+    out = []
+    for i in range(NUMBER):
+        payload = PAYLOADS[i % 5]
+        out.append(Ok(payload))
+        out.append(Err(payload))
+        out.append(Some(payload))
+    return out
+
+
+def interned() -> t.List[t.Any]:
+    """Build results using the interned constants."""
+    out = []
+    for i in range(NUMBER):
+        payload = PAYLOADS[i % 5]
+        out.append(Ok.of_const(payload))
+        out.append(Err.of_const(payload))
+        out.append(Some.of_const(payload))
+    return out
+
+
+def run(name: str, fn: t.Callable[[], t.List[t.Any]]) -> None:
+    """Measure allocations, collections, and time for `fn`."""
+    gc.collect()
+    collections = gc.get_stats()[0]["collections"]
+    start = time.perf_counter()
+    result = fn()
+    taken = time.perf_counter() - start
+    collections = gc.get_stats()[0]["collections"] - collections
+    del result
+    gc.collect()
+
+    # Trace memory separately, since tracing slows down allocation.
+    tracemalloc.start()
+    result = fn()
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    print(
+        "{:<12} peak={:>7.1f} MiB live_blocks={:>9,} gen0_gcs={:>6,} "
+        "time={:.3f} s".format(
+            name, peak / 2 ** 20, blocks, collections, taken
+        )
+    )
+    del result
+
+
+if __name__ == "__main__":
+    switch: t.Dict[str, t.Callable[[], t.List[t.Any]]] = {
+        "constructed": constructed,
+        "interned": interned,
+    }
+    to_run = sys.argv[1:] or list(switch)
+    for name in to_run:
+        if name not in switch:
+            raise RuntimeError("No such method: {}".format(name))
+        run(name, switch[name])
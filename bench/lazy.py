@@ -0,0 +1,67 @@
+"""Benchmark the lazy adapters in `safetywrap.iter` against lists.
+
+Runs the same pipeline over a stream of one million Results (10% Err):
+map the Ok values, drop the small ones, and sum what remains. It is run
+once with the lazy adapters, and once building a list at each step, and
+the peak memory and time of each are reported.
+"""
+
+import tracemalloc
+import typing as t
+
+from timeit import timeit
+
+from safetywrap import Err, Ok, Result
+from safetywrap.iter import filter_ok, map_ok, oks
+
+
+SIZE = 1_000_000
+
+
+def _stream() -> t.Iterator[Result[int, int]]:
+    # A generator, as records read from a file or socket would be
+    for idx in range(SIZE):
+        yield Err(idx) if idx % 10 == 0 else Ok(idx)
+
+
+def _double(val: int) -> int:
+    return val * 2
+
+
+def _big(val: int) -> bool:
+    return val > SIZE
+
+
+def with_lists() -> int:
+    """Run the pipeline, building a list at each step."""
+    results = list(_stream())
+    mapped = [r.map(_double) for r in results]
+    kept = [r for r in mapped if r.is_err() or _big(r.unwrap())]
+    return sum([r.unwrap() for r in kept if r.is_ok()])
+
+
+def with_iter() -> int:
+    """Run the pipeline lazily."""
+    return sum(oks(filter_ok(_big, map_ok(_double, _stream()))))
+
+
+def _peak(fn: t.Callable[[], t.Any]) -> int:
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    assert with_lists() == with_iter()
+    print("{:<8} {:>18} {:>10}".format("", "peak memory (MiB)", "time (s)"))
+    for name, fn in (("lists", with_lists), ("lazy", with_iter)):
+        peak = _peak(fn)
+        taken = timeit(fn, number=3) / 3
+        print("{:<8} {:>18.2f} {:>10.3f}".format(name, peak / 2 ** 20, taken))
+
+
+if __name__ == "__main__":
+    main()
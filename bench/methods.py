@@ -0,0 +1,118 @@
+"""Per-method microbenchmark for Ok, Err, Some, and Nothing.
+
+Times each public method (and the magic methods used most often) on each
+concrete type, reporting the average time per call in nanoseconds. Pass
+one or more type names to limit the run, e.g. `python methods.py ok err`.
+"""
+
+import sys
+import typing as t
+
+from timeit import Timer
+
+from safetywrap import Some, Nothing, NOTHING, Ok, Err
+
+
+NUMBER = 200_000
+
+# Each entry is a statement to time, run with `obj`, `other`, `fn`, and
+# `opt_fn` in scope.
+RESULT_METHODS = (
+    "obj.and_(other)",
+    "obj.or_(other)",
+    "obj.and_then(fn)",
+    "obj.flatmap(fn)",
+    "obj.or_else(fn)",
+    "obj.err()",
+    "obj.ok()",
+    "obj.is_err()",
+    "obj.is_ok()",
+    "obj.iter()",
+    "obj.map(ident)",
+    "obj.map_err(ident)",
+    "obj.match(ident, ident)",
+    "obj.unwrap_or(1)",
+    "obj.unwrap_or_else(ident)",
+    "obj == other",
+    "obj != other",
+    "repr(obj)",
+    "for _ in obj: pass",
+)
+OK_ONLY = ("obj.expect('m')", "obj.raise_if_err('m')", "obj.unwrap()")
+ERR_ONLY = ("obj.expect_err('m')", "obj.unwrap_err()")
+
+OPTION_METHODS = (
+    "obj.and_(other)",
+    "obj.or_(other)",
+    "obj.xor(other)",
+    "obj.and_then(opt_fn)",
+    "obj.flatmap(opt_fn)",
+    "obj.or_else(lambda: other)",
+    "obj.filter(truthy)",
+    "obj.is_nothing()",
+    "obj.is_some()",
+    "obj.iter()",
+    "obj.map(ident)",
+    "obj.map_or(1, ident)",
+    "obj.map_or_else(lambda: 1, ident)",
+    "obj.match(ident, lambda: 1)",
+    "obj.ok_or(1)",
+    "obj.ok_or_else(lambda: 1)",
+    "obj.unwrap_or(1)",
+    "obj.unwrap_or_else(lambda: 1)",
+    "obj == other",
+    "obj != other",
+    "repr(obj)",
+    "for _ in obj: pass",
+)
+SOME_ONLY = (
+    "obj.expect('m')",
+    "obj.raise_if_nothing('m')",
+    "obj.unwrap()",
+)
+NOTHING_ONLY = ("Nothing()", "NOTHING")
+
+
+def ident(val: t.Any) -> t.Any:
+    """Return the value."""
+    return val
+
+
+def truthy(val: t.Any) -> bool:
+    """Return True."""
+    return True
+
+
+CASES: t.Dict[str, t.Tuple[t.Any, t.Any, t.Tuple[str, ...]]] = {
+    "ok": (Ok(1), Ok(1), RESULT_METHODS + OK_ONLY),
+    "err": (Err(1), Err(1), RESULT_METHODS + ERR_ONLY),
+    "some": (Some(1), Some(1), OPTION_METHODS + SOME_ONLY),
+    "nothing": (Nothing(), Nothing(), OPTION_METHODS + NOTHING_ONLY),
+}
+
+
+def run(name: str) -> None:
+    """Time every method for the named type."""
+    obj, other, stmts = CASES[name]
+    scope = {
+        "obj": obj,
+        "other": other,
+        "fn": lambda _: obj,
+        "opt_fn": lambda _: obj,
+        "ident": ident,
+        "truthy": truthy,
+        "Nothing": Nothing,
+        "NOTHING": NOTHING,
+    }
+    for stmt in stmts:
+        timer = Timer(stmt, globals=scope)
+        taken = min(timer.repeat(repeat=3, number=NUMBER)) / NUMBER
+        print("{:<8} {:<36} {:>8.1f} ns".format(name, stmt, taken * 1e9))
+
+
+if __name__ == "__main__":
+    to_run = sys.argv[1:] or list(CASES)
+    for case in to_run:
+        if case not in CASES:
+            raise RuntimeError("No such type: {}".format(case))
+        run(case)
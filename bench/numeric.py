@@ -0,0 +1,64 @@
+"""Benchmark the NumPy-backed ResultArray against a list of Results.
+
+Requires NumPy. Holds one million numeric results (90% Ok) both as a list
+of `Ok`/`Err` instances and as a `ResultArray`, and times `map`,
+`unwrap_or`, `collect`, and summing the Ok values in each.
+"""
+
+import math
+import typing as t
+
+from timeit import timeit
+
+import numpy as np
+
+from safetywrap import Ok, Err, Result
+from safetywrap.numeric import ResultArray
+
+
+SIZE = 1_000_000
+
+
+def _time(fn: t.Callable[[], t.Any], number: int = 5) -> float:
+    return timeit(fn, number=number) / number
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    results: t.List[Result[float, int]] = [
+        Err(i % 7) if i % 10 == 0 else Ok(float(i)) for i in range(SIZE)
+    ]
+    arr = ResultArray.from_results(results)
+    ok_results: t.List[Result[float, int]] = [Ok(float(i)) for i in range(SIZE)]
+    ok_arr = ResultArray.from_results(ok_results)
+    cases = (
+        (
+            "map",
+            lambda: [r.map(math.sqrt) for r in results],
+            lambda: arr.map(np.sqrt),
+        ),
+        (
+            "unwrap_or",
+            lambda: [r.unwrap_or(0.0) for r in results],
+            lambda: arr.unwrap_or(0.0),
+        ),
+        ("collect", lambda: Result.collect(ok_results), ok_arr.collect),
+        (
+            "sum",
+            lambda: sum(r.unwrap() for r in results if r.is_ok()),
+            arr.sum,
+        ),
+    )
+    print("time per operation (s)")
+    for name, on_list, on_array in cases:
+        list_time = _time(on_list)
+        array_time = _time(on_array)
+        print(
+            "  {:<10} list={:.4f} array={:.4f} ({:.0f}x faster)".format(
+                name, list_time, array_time, list_time / array_time
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark `Result.collect_parallel` against `Result.collect`.
+
+Validates 1,000 items with an I/O-bound function, which sleeps for a
+millisecond, as a network check might. It is run serially, with
+`Result.collect()` over a generator, and in parallel, with
+`Result.collect_parallel()` over 16 threads, once where every item is
+valid, and once where the 10th item is not, to show the cost of stopping
+early.
+"""
+
+import time
+import typing as t
+
+from timeit import timeit
+
+from safetywrap import Err, Ok, Result
+
+
+SIZE = 1_000
+WORKERS = 16
+
+
+def _validate(val: int, bad: int) -> Result[int, str]:
+    time.sleep(0.001)
+    return Err(f"invalid: {val}") if val == bad else Ok(val)
+
+
+def serial(bad: int) -> Result[t.Tuple[int, ...], str]:
+    """Validate every item in turn."""
+    return Result.collect(_validate(val, bad) for val in range(SIZE))
+
+
+def parallel(bad: int) -> Result[t.Tuple[int, ...], str]:
+    """Validate items in a thread pool."""
+    return Result.collect_parallel(
+        lambda val: _validate(val, bad), range(SIZE), max_workers=WORKERS
+    )
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    print("{:<10} {:>12} {:>14}".format("", "all Ok (s)", "early Err (s)"))
+    for name, fn in (("serial", serial), ("parallel", parallel)):
+        assert fn(-1) == Ok(tuple(range(SIZE)))
+        assert fn(9) == Err("invalid: 9")
+        all_ok = timeit(lambda: fn(-1), number=1)
+        early_err = timeit(lambda: fn(9), number=10) / 10
+        print("{:<10} {:>12.3f} {:>14.4f}".format(name, all_ok, early_err))
+
+
+if __name__ == "__main__":
+    main()
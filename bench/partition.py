@@ -0,0 +1,60 @@
+"""Benchmark Result.partition and Option.partition.
+
+Splits 100,000 Results (90% Ok) and Options (90% Some) with `partition()`,
+and compares the time taken with the two passes of `is_ok()` and
+`unwrap()` / `unwrap_err()` (or `is_some()` and `unwrap()`) it replaces.
+"""
+
+import typing as t
+
+from timeit import timeit
+
+from safetywrap import Err, Nothing, Ok, Option, Result, Some
+
+
+SIZE = 100_000
+NUMBER = 20
+
+RESULTS: t.List[Result[int, int]] = [
+    Err(i) if i % 10 == 0 else Ok(i) for i in range(SIZE)
+]
+OPTIONS: t.List[Option[int]] = [
+    Nothing() if i % 10 == 0 else Some(i) for i in range(SIZE)
+]
+
+
+def results_by_method() -> t.Any:
+    """Partition Results by calling methods on each one."""
+    return (
+        tuple(r.unwrap() for r in RESULTS if r.is_ok()),
+        tuple(r.unwrap_err() for r in RESULTS if r.is_err()),
+    )
+
+
+def options_by_method() -> t.Any:
+    """Partition Options by calling methods on each one."""
+    return (
+        tuple(o.unwrap() for o in OPTIONS if o.is_some()),
+        sum(1 for o in OPTIONS if o.is_nothing()),
+    )
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    cases = (
+        ("Result", results_by_method, lambda: Result.partition(RESULTS)),
+        ("Option", options_by_method, lambda: Option.partition(OPTIONS)),
+    )
+    for name, by_method, partition in cases:
+        assert by_method() == partition()
+        method_time = timeit(by_method, number=NUMBER) / NUMBER
+        partition_time = timeit(partition, number=NUMBER) / NUMBER
+        print(
+            "{:<7} methods={:.4f}s partition={:.4f}s ({:.1f}x faster)".format(
+                name, method_time, partition_time, method_time / partition_time
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark `persistent_cache()` for a restarted job.
+
+A job calls a function taking 2ms per call on 1,000 inputs, 10% of which
+fail. It is run cold, computing and storing every result, then as if
+restarted, with a new store on the same file, reading each result from
+disk as it is needed, and reading them all up front with `warm()`. Errs
+are not stored, so they are recomputed each time.
+"""
+
+import os
+import tempfile
+import time
+import typing as t
+
+from safetywrap import Err, Ok, Result
+from safetywrap.persist import ResultStore, persistent_cache
+
+
+INPUTS = 1_000
+COST = 0.002
+
+
+def lookup(val: int) -> Result[t.Dict[str, int], str]:
+    """A stand-in for an expensive, fallible call."""
+    time.sleep(COST)
+    if val % 10 == 0:
+        return Err(f"no record for {val}")
+    return Ok({"id": val, "score": val * 7 % 100})
+
+
+def _uncached() -> float:
+    start = time.perf_counter()
+    for val in range(INPUTS):
+        lookup(val)
+    return time.perf_counter() - start
+
+
+def _run(path: str, warm: bool) -> float:
+    start = time.perf_counter()
+    cached = persistent_cache(ResultStore(path))(lookup)
+    if warm:
+        cached.warm((val,) for val in range(INPUTS))  # type: ignore
+    for val in range(INPUTS):
+        cached(val)
+    cached.store.close()  # type: ignore
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    path = os.path.join(tempfile.mkdtemp(), "results.db")
+    print("{:<20} {:>10}".format("", "time (s)"))
+    print("{:<20} {:>10.3f}".format("uncached", _uncached()))
+    print("{:<20} {:>10.3f}".format("cold", _run(path, warm=False)))
+    print("{:<20} {:>10.3f}".format("restarted", _run(path, warm=False)))
+    print("{:<20} {:>10.3f}".format("restarted, warm()", _run(path, True)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Benchmark pickling Results and Options.
+
+Pickles one million mixed Results and Options (a quarter each of `Ok`,
+`Err`, `Some`, and `Nothing`) with the highest protocol, and reports the
+pickled size and the dumps and loads throughput of:
+
+- a list of the library's types, which pickle as a call to their
+  constructor, or for `Nothing()`, by reference to the singleton
+- a list of equivalent slotted classes without `__reduce__()`, holding
+  the same values, which take Python's generic path for objects with
+  `__slots__`, as Results did before they defined `__reduce__()`
+- `ResultBatch` and `OptionBatch` of the same items
+"""
+
+import pickle
+import time
+import typing as t
+
+from safetywrap import (
+    NOTHING,
+    Err,
+    Nothing,
+    Ok,
+    Option,
+    OptionBatch,
+    Result,
+    ResultBatch,
+    Some,
+)
+
+
+SIZE = 1_000_000
+
+
+class _Slotted:
+    """A slotted wrapper pickled with Python's generic machinery."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: t.Any) -> None:
+        self._value = value
+
+
+class SlottedOk(_Slotted):
+    """An Ok without `__reduce__()`."""
+
+    __slots__ = ()
+
+
+class SlottedErr(_Slotted):
+    """An Err without `__reduce__()`."""
+
+    __slots__ = ()
+
+
+class SlottedSome(_Slotted):
+    """A Some without `__reduce__()`."""
+
+    __slots__ = ()
+
+
+class SlottedNothing(_Slotted):
+    """A Nothing without `__reduce__()`, holding None."""
+
+    __slots__ = ()
+
+
+_SLOTTED = {Ok: SlottedOk, Err: SlottedErr, Some: SlottedSome}
+
+
+def _items() -> t.List[t.Any]:
+    items: t.List[t.Any] = []
+    for idx in range(SIZE):
+        kind = idx % 4
+        if kind == 0:
+            items.append(Ok(idx))
+        elif kind == 1:
+            items.append(Err("invalid"))
+        elif kind == 2:
+            items.append(Some(idx))
+        else:
+            items.append(NOTHING)
+    return items
+
+
+def _measure(name: str, obj: t.Any) -> None:
+    protocol = pickle.HIGHEST_PROTOCOL
+    start = time.perf_counter()
+    data = pickle.dumps(obj, protocol)
+    dumped = time.perf_counter() - start
+    start = time.perf_counter()
+    pickle.loads(data)
+    loaded = time.perf_counter() - start
+    print(
+        "{:<10} {:>12} {:>12.2f} {:>12.2f}".format(
+            name, len(data), SIZE / dumped / 1e6, SIZE / loaded / 1e6
+        )
+    )
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    items = _items()
+    slotted = [
+        SlottedNothing(None)
+        if isinstance(item, Nothing)
+        else _SLOTTED[type(item)](item.value)
+        for item in items
+    ]
+    batches = (
+        ResultBatch(item for item in items if isinstance(item, Result)),
+        OptionBatch(item for item in items if isinstance(item, Option)),
+    )
+    assert pickle.loads(pickle.dumps(items))[3] is NOTHING
+    print(
+        "{:<10} {:>12} {:>12} {:>12}".format(
+            "", "bytes", "dumps (M/s)", "loads (M/s)"
+        )
+    )
+    _measure("list", items)
+    _measure("slotted", slotted)
+    _measure("batches", batches)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark `safetywrap.futures.process_map` against naive process pools.
+
+Parses 100,000 strings (10% invalid) as integers with `Result.of(int,
+...)` in a pool of worker processes, in three ways: submitting a task per
+item, returning a Result per item through `ProcessPoolExecutor.map()` with
+a chunk size, and with `process_map()`, which returns each chunk as a
+`ResultBatch`. The time for each, and the pickled size of one chunk of
+Results as a list and as a `ResultBatch`, are reported.
+"""
+
+import pickle
+import time
+import typing as t
+
+from concurrent.futures import ProcessPoolExecutor
+
+from safetywrap import Result, ResultBatch
+from safetywrap.futures import process_map
+
+
+SIZE = 100_000
+CHUNKSIZE = 256
+WORKERS = 2
+
+ITEMS = [("x" if idx % 10 == 0 else str(idx)) for idx in range(SIZE)]
+
+
+def _parse(val: str) -> Result[int, Exception]:
+    return Result.of(int, val)
+
+
+def per_item(pool: ProcessPoolExecutor) -> int:
+    """Submit a task per item."""
+    futures = [pool.submit(_parse, val) for val in ITEMS]
+    return sum(fut.result().is_ok() for fut in futures)
+
+
+def results_map(pool: ProcessPoolExecutor) -> int:
+    """Return a Result per item, in chunks."""
+    return sum(
+        res.is_ok() for res in pool.map(_parse, ITEMS, chunksize=CHUNKSIZE)
+    )
+
+
+def batches(pool: ProcessPoolExecutor) -> int:
+    """Return a ResultBatch per chunk."""
+    return sum(
+        batch.count_ok()
+        for batch in process_map(
+            int, ITEMS, chunksize=CHUNKSIZE, executor=pool
+        )
+    )
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    chunk = [_parse(val) for val in ITEMS[:CHUNKSIZE]]
+    as_list = len(pickle.dumps(chunk, pickle.HIGHEST_PROTOCOL))
+    as_batch = len(pickle.dumps(ResultBatch(chunk), pickle.HIGHEST_PROTOCOL))
+    print(f"Pickled chunk of {CHUNKSIZE}: {as_list} bytes as a list of "
+          f"Results, {as_batch} bytes as a ResultBatch")
+    print()
+    fns: t.Tuple[t.Tuple[str, t.Callable[[ProcessPoolExecutor], int]], ...]
+    fns = (
+        ("per item", per_item),
+        ("map", results_map),
+        ("process_map", batches),
+    )
+    print("{:<12} {:>10}".format("", "time (s)"))
+    with ProcessPoolExecutor(WORKERS) as pool:
+        for name, fn in fns:
+            start = time.perf_counter()
+            assert fn(pool) == SIZE - SIZE // 10
+            taken = time.perf_counter() - start
+            print("{:<12} {:>10.3f}".format(name, taken))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Compare candidate memory layouts for Ok, Err, Some, and Nothing.
+
+The shipped types are slotted classes whose `__init__()` stores the value
+through the slot descriptor, since `__setattr__()` is overridden to keep
+instances immutable. This benchmark times that layout against the
+alternatives that also keep instances immutable:
+
+- a `tuple` subclass, which is immutable for free but must build its
+  one-item tuple in a Python-level `__new__()`, and which reads its value
+  through an `itemgetter` property
+- a slotted class that sets its value in `__new__()` instead of
+  `__init__()`
+- a slotted class whose metaclass `__call__()` builds the instance,
+  skipping `type.__call__()` entirely
+
+A mutable slotted class with a plain `self._value = value` assignment is
+included as a floor: it is what construction would cost with no
+immutability at all.
+
+Each layout is timed on construction, reading the value, and `map()`,
+which constructs a new instance from the value of the old one.
+"""
+
+import typing as t
+
+from operator import itemgetter
+from timeit import repeat
+
+from safetywrap import Ok
+
+
+NUMBER = 500_000
+
+
+class TupleOk(tuple):
+    """An Ok stored as a one-item tuple."""
+
+    __slots__ = ()
+
+    def __new__(cls, value: t.Any) -> "TupleOk":
+        """Wrap the value."""
+        return tuple.__new__(cls, (value,))
+
+    value = property(itemgetter(0))
+
+    def map(self, fn: t.Callable[[t.Any], t.Any]) -> "TupleOk":
+        """Map a function onto the value."""
+        return TupleOk(fn(self[0]))
+
+
+class NewOk:
+    """An Ok whose value is set in `__new__()`."""
+
+    __slots__ = ("_value",)
+
+    def __new__(cls, value: t.Any) -> "NewOk":
+        """Wrap the value."""
+        inst = _new(cls)
+        _set_new_value(inst, value)
+        return inst
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        """Instances are immutable."""
+        raise AttributeError("immutable")
+
+    def map(self, fn: t.Callable[[t.Any], t.Any]) -> "NewOk":
+        """Map a function onto the value."""
+        return NewOk(fn(self._value))
+
+
+class _Meta(type):
+    def __call__(cls, value: t.Any) -> t.Any:
+        inst = _new(cls)
+        _set_meta_value(inst, value)
+        return inst
+
+
+class MetaOk(metaclass=_Meta):
+    """An Ok constructed by its metaclass."""
+
+    __slots__ = ("_value",)
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        """Instances are immutable."""
+        raise AttributeError("immutable")
+
+    def map(self, fn: t.Callable[[t.Any], t.Any]) -> "MetaOk":
+        """Map a function onto the value."""
+        return MetaOk(fn(self._value))
+
+
+class MutableOk:
+    """A mutable Ok, as a lower bound on construction cost."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: t.Any) -> None:
+        """Wrap the value."""
+        self._value = value
+
+    def map(self, fn: t.Callable[[t.Any], t.Any]) -> "MutableOk":
+        """Map a function onto the value."""
+        return MutableOk(fn(self._value))
+
+
+_new = object.__new__
+_set_new_value = NewOk.__dict__["_value"].__set__
+_set_meta_value = MetaOk.__dict__["_value"].__set__
+NewOk.value = NewOk.__dict__["_value"]  # type: ignore
+MetaOk.value = MetaOk.__dict__["_value"]  # type: ignore
+MutableOk.value = MutableOk.__dict__["_value"]  # type: ignore
+
+LAYOUTS = (
+    ("slots (shipped)", Ok),
+    ("tuple", TupleOk),
+    ("slots, __new__", NewOk),
+    ("slots, metaclass", MetaOk),
+    ("slots, mutable", MutableOk),
+)
+STATEMENTS = (
+    ("construct", "cls(1)"),
+    ("read value", "obj.value"),
+    ("map", "obj.map(ident)"),
+)
+
+
+def ident(val: t.Any) -> t.Any:
+    """Return the value."""
+    return val
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    header = "".join("{:>12}".format(name) for name, _ in STATEMENTS)
+    print("{:<18}{}".format("ns per op", header))
+    for name, cls in LAYOUTS:
+        scope = {"cls": cls, "obj": cls(1), "ident": ident}
+        times = (
+            min(repeat(stmt, globals=scope, number=NUMBER, repeat=9)) / NUMBER
+            for _, stmt in STATEMENTS
+        )
+        print(
+            "{:<18}".format(name)
+            + "".join("{:>12.1f}".format(taken * 1e9) for taken in times)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,3 +17,105 @@ python "$DIR/sample.py" classical timeit
 
 echo "Monadic"
 python "$DIR/sample.py" monadic timeit
+
+echo
+echo "Collect scaling (per-item time should stay flat as size grows)"
+echo
+
+python "$DIR/collect.py"
+
+echo
+echo "Allocations for common constants, constructed vs. interned"
+echo
+
+python "$DIR/consts.py"
+
+echo
+echo "Per-method timings"
+echo
+
+python "$DIR/methods.py"
+
+echo
+echo "ResultBatch vs. a list of Results"
+echo
+
+python "$DIR/batch.py"
+
+echo
+echo "SparseOptionVector vs. a list of Options"
+echo
+
+python "$DIR/sparse.py"
+
+echo
+echo "Candidate layouts for the wrapper types"
+echo
+
+python "$DIR/representation.py"
+
+echo
+echo "Partitioning in one pass vs. method calls"
+echo
+
+python "$DIR/partition.py"
+
+echo
+echo "Lazy iterator adapters vs. building lists"
+echo
+
+python "$DIR/lazy.py"
+
+echo
+echo "Bounded async streams vs. gathering every call"
+echo
+
+python "$DIR/astream.py"
+
+echo
+echo "Parallel vs. serial collection of I/O-bound Results"
+echo
+
+python "$DIR/parallel.py"
+
+echo
+echo "Chunked process pool execution vs. a Result per item"
+echo
+
+python "$DIR/processes.py"
+
+echo
+echo "Shared memory batches vs. pickling Results between processes"
+echo
+
+python "$DIR/shared.py"
+
+echo
+echo "Pickling Results and Options"
+echo
+
+python "$DIR/pickling.py"
+
+echo
+echo "Codecs vs. ad-hoc dict encoding"
+echo
+
+python "$DIR/codec.py"
+
+echo
+echo "Arrow-style buffers vs. unwrapping Results"
+echo
+
+python "$DIR/buffers.py"
+
+echo
+echo "Caching lookups with result_cache vs. lru_cache"
+echo
+
+python "$DIR/cache.py"
+
+echo
+echo "Persistent caching of expensive calls"
+echo
+
+python "$DIR/persist.py"
@@ -0,0 +1,62 @@
+"""Benchmark `SharedResultBatch` against pickling Results between processes.
+
+Sends one million numeric Results (10% Err) to a worker process, which
+sums the Ok values, as a list of Results, as a `ResultBatch`, and as a
+`SharedResultBatch`. The size of each payload as pickled, and the time to
+send it and get the sum back, are reported. Building the batches is not
+timed.
+"""
+
+import pickle
+import time
+import typing as t
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+
+from safetywrap import Err, Ok, Result, ResultBatch
+from safetywrap.shared import SharedResultBatch
+
+
+SIZE = 1_000_000
+
+
+def _sum_results(results: t.List[Result[float, int]]) -> float:
+    return sum(res.unwrap() for res in results if res.is_ok())
+
+
+def _sum_batch(batch: ResultBatch[float, int]) -> float:
+    return sum(batch.oks())
+
+
+def _sum_shared(batch: SharedResultBatch[float, int]) -> float:
+    with batch:
+        return sum(compress(batch.values, batch.tags))
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    results: t.List[Result[float, int]] = [
+        Err(idx) if idx % 10 == 0 else Ok(float(idx)) for idx in range(SIZE)
+    ]
+    batch = ResultBatch(results)
+    shared = SharedResultBatch.from_results(results)
+    cases: t.Tuple[t.Tuple[str, t.Callable[[t.Any], float], t.Any], ...] = (
+        ("list", _sum_results, results),
+        ("ResultBatch", _sum_batch, batch),
+        ("shared", _sum_shared, shared),
+    )
+    print("{:<12} {:>16} {:>10}".format("", "pickled (bytes)", "time (s)"))
+    with shared, ProcessPoolExecutor(max_workers=1) as pool:
+        pool.submit(len, ()).result()  # Start the worker
+        expected = _sum_results(results)
+        for name, fn, payload in cases:
+            size = len(pickle.dumps(payload, pickle.HIGHEST_PROTOCOL))
+            start = time.perf_counter()
+            assert pool.submit(fn, payload).result() == expected
+            taken = time.perf_counter() - start
+            print("{:<12} {:>16} {:>10.3f}".format(name, size, taken))
+
+
+if __name__ == "__main__":
+    main()
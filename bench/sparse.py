@@ -0,0 +1,102 @@
+"""Benchmark SparseOptionVector against a dense list of Options.
+
+Holds one million options (1% Some) both as a list of `Some`/`Nothing`
+instances and as a `SparseOptionVector`, and reports the memory each takes,
+along with the time taken by `map`, `filter`, and summing present values.
+"""
+
+import gc
+import tracemalloc
+import typing as t
+
+from timeit import timeit
+
+from safetywrap import Nothing, Option, Some, SparseOptionVector
+
+
+SIZE = 1_000_000
+
+
+def _values() -> t.List[t.Optional[int]]:
+    # Payloads are built up front so only the containers are measured
+    return [v if v % 100 == 0 else None for v in range(1000, SIZE + 1000)]
+
+
+def as_list(values: t.List[t.Optional[int]]) -> t.List[Option[int]]:
+    """Wrap every value in a Some or Nothing."""
+    return [Nothing() if v is None else Some(v) for v in values]
+
+
+def as_sparse(values: t.List[t.Optional[int]]) -> SparseOptionVector[int]:
+    """Store only the present values."""
+    return SparseOptionVector.of(values)
+
+
+def _memory(build: t.Callable[[t.List[t.Optional[int]]], t.Any]) -> int:
+    values = _values()
+    gc.collect()
+    tracemalloc.start()
+    built = build(values)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return size
+
+
+def _time(fn: t.Callable[[], t.Any], number: int = 5) -> float:
+    return timeit(fn, number=number) / number
+
+
+def _inc(val: int) -> int:
+    return val + 1
+
+
+def _big(val: int) -> bool:
+    return val > SIZE // 2
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    list_mem = _memory(as_list)
+    sparse_mem = _memory(as_sparse)
+    print("memory (MiB)")
+    print("  list of options     {:>8.1f}".format(list_mem / 2 ** 20))
+    print(
+        "  SparseOptionVector  {:>8.1f} ({:.1f}x smaller)".format(
+            sparse_mem / 2 ** 20, list_mem / sparse_mem
+        )
+    )
+
+    values = _values()
+    options = as_list(values)
+    sparse = as_sparse(values)
+    cases = (
+        (
+            "map",
+            lambda: [o.map(_inc) for o in options],
+            lambda: sparse.map(_inc),
+        ),
+        (
+            "filter",
+            lambda: [o.filter(_big) for o in options],
+            lambda: sparse.filter(_big),
+        ),
+        (
+            "sum",
+            lambda: sum(o.unwrap_or(0) for o in options),
+            lambda: sum(sparse.values()),
+        ),
+    )
+    print("time per operation (s)")
+    for name, on_list, on_sparse in cases:
+        list_time = _time(on_list)
+        sparse_time = _time(on_sparse)
+        print(
+            "  {:<10} list={:.4f} sparse={:.4f} ({:.1f}x faster)".format(
+                name, list_time, sparse_time, list_time / sparse_time
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""Pytest configuration."""
+
+import sys
+
+collect_ignore = []
+
+if sys.version_info < (3, 10):
+    # Structural pattern matching is a syntax error before Python 3.10
+    collect_ignore.append("tests/test_pattern_matching.py")
+
+try:
+    import numpy  # noqa: F401  # pylint: disable=unused-import
+except ImportError:
+    # The numeric module requires numpy, an optional dependency
+    collect_ignore.append("src/safetywrap/numeric.py")
+
+if sys.version_info < (3, 8):
+    # The shared module requires multiprocessing.shared_memory
+    collect_ignore.append("src/safetywrap/shared.py")
@@ -66,7 +66,6 @@ CLASSIFIERS = [
     "Operating System :: Microsoft :: Windows",
     "Programming Language :: Python",
     "Programming Language :: Python :: 3 :: Only",
-    "Programming Language :: Python :: 3.6",
     "Programming Language :: Python :: 3.7",
     "Programming Language :: Python :: 3.8",
     # 'Programming Language :: Python :: Implementation :: PyPy',
@@ -77,7 +76,7 @@ CLASSIFIERS = [
 # Dependency Specification
 ########################################################################
 
-PYTHON_REQUIRES = ">=3.6"
+PYTHON_REQUIRES = ">=3.7"
 PACKAGE_DEPENDENCIES: t.Tuple[str, ...] = ()
 SETUP_DEPENDENCIES: t.Tuple[str, ...] = ()
 TEST_DEPENDENCIES: t.Tuple[str, ...] = ()
@@ -100,7 +99,8 @@ EXTRAS_DEPENDENCIES: t.Dict[str, t.Sequence[str]] = {
             "typeguard",
             "wheel",
         )
-    )
+    ),
+    "numpy": ("numpy>=1.19",),
 }
 
 
@@ -1,8 +1,33 @@
 """Typesafe python versions of Rust-inspired result types."""
 
-__all__ = ("Option", "Result", "Ok", "Err", "Some", "Nothing")
+__all__ = (
+    "Option",
+    "Result",
+    "Ok",
+    "Err",
+    "Some",
+    "Nothing",
+    "NOTHING",
+    "ResultBatch",
+    "OptionBatch",
+    "SparseOptionVector",
+    "AsyncResult",
+    "intern_consts",
+)
 __version__ = "1.5.0"
 __version_info__ = tuple(map(int, __version__.split(".")))
 
 
-from ._impl import Option, Result, Ok, Err, Some, Nothing
+from ._impl import (
+    Option,
+    Result,
+    Ok,
+    Err,
+    Some,
+    Nothing,
+    NOTHING,
+    intern_consts,
+)
+from ._async import AsyncResult
+from ._batch import OptionBatch, ResultBatch
+from ._sparse import SparseOptionVector
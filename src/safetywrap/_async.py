@@ -0,0 +1,241 @@
+"""Awaitable Results, for use with asyncio."""
+
+import asyncio
+import functools
+import typing as t
+from inspect import isawaitable
+
+from ._impl import Err, Ok, Result
+
+T = t.TypeVar("T", covariant=True)
+E = t.TypeVar("E", covariant=True)
+U = t.TypeVar("U")
+F = t.TypeVar("F")
+
+ExcType = t.TypeVar("ExcType", bound=Exception)
+
+# Modes for `Result.gather()`
+GATHER_MODES = ("short_circuit", "collect_all", "first_ok")
+
+# Kinds of step in a chain. Steps before the Err kinds apply to Ok values.
+_MAP = 0
+_AND_THEN = 1
+_MAP_ERR = 2
+_OR_ELSE = 3
+
+
+class AsyncResult(t.Generic[T, E]):
+    """A Result that is not available yet, and the steps to apply to it.
+
+    Await an AsyncResult to get its Result. Chained calls to `map()`,
+    `map_err()`, `and_then()`, and `or_else()` accept both sync and async
+    functions, and are recorded rather than run, so however long the chain
+    is, it is resolved in a single await, without a Task per step.
+
+    Like a coroutine, an AsyncResult may only be awaited once, unless it
+    was created from an awaitable that may be awaited more than once, such
+    as a Future.
+
+    Example:
+    ```py
+
+    >>> async def fetch(key: str) -> int:
+    ...     return {"a": 1}[key]
+    >>> async def double(val: int) -> int:
+    ...     return val * 2
+    >>> async def fetch_doubled(key: str) -> Result[str, Exception]:
+    ...     return await Result.of_async(fetch, key).map(double).map(str)
+    >>> asyncio.run(fetch_doubled("a"))
+    Ok('2')
+    >>> asyncio.run(fetch_doubled("b"))
+    Err(KeyError('b'))
+
+    ```
+    """
+
+    __slots__ = ("_source", "_steps")
+
+    def __init__(self, source: t.Awaitable[Result[T, E]]) -> None:
+        """Create an AsyncResult resolving to the Result `source` returns."""
+        self._source = source
+        self._steps: t.Tuple[t.Tuple[int, t.Callable[..., t.Any]], ...] = ()
+
+    def _then(
+        self, kind: int, fn: t.Callable[..., t.Any]
+    ) -> "AsyncResult[t.Any, t.Any]":
+        """Return a new AsyncResult with an extra step."""
+        chained: AsyncResult[t.Any, t.Any] = AsyncResult(self._source)
+        chained._steps = self._steps + ((kind, fn),)
+        return chained
+
+    @t.overload
+    def map(self, fn: t.Callable[..., t.Awaitable[U]]) -> "AsyncResult[U, E]":
+        """Map an async function onto an okay result."""
+
+    @t.overload
+    def map(self, fn: t.Callable[..., U]) -> "AsyncResult[U, E]":
+        """Map a sync function onto an okay result."""
+
+    def map(self, fn: t.Callable[..., t.Any]) -> "AsyncResult[t.Any, E]":
+        """Map a sync or async function onto an okay result."""
+        return self._then(_MAP, fn)
+
+    @t.overload
+    def map_err(
+        self, fn: t.Callable[..., t.Awaitable[F]]
+    ) -> "AsyncResult[T, F]":
+        """Map an async function onto an error."""
+
+    @t.overload
+    def map_err(self, fn: t.Callable[..., F]) -> "AsyncResult[T, F]":
+        """Map a sync function onto an error."""
+
+    def map_err(self, fn: t.Callable[..., t.Any]) -> "AsyncResult[T, t.Any]":
+        """Map a sync or async function onto an error."""
+        return self._then(_MAP_ERR, fn)
+
+    @t.overload
+    def and_then(
+        self, fn: t.Callable[..., t.Awaitable[Result[U, E]]]
+    ) -> "AsyncResult[U, E]":
+        """Chain an async function returning a Result onto Ok."""
+
+    @t.overload
+    def and_then(
+        self, fn: t.Callable[..., Result[U, E]]
+    ) -> "AsyncResult[U, E]":
+        """Chain a sync function returning a Result onto Ok."""
+
+    def and_then(self, fn: t.Callable[..., t.Any]) -> "AsyncResult[t.Any, E]":
+        """Chain a sync or async function returning a Result onto Ok."""
+        return self._then(_AND_THEN, fn)
+
+    @t.overload
+    def or_else(
+        self, fn: t.Callable[..., t.Awaitable[Result[T, F]]]
+    ) -> "AsyncResult[T, F]":
+        """Chain an async function returning a Result onto Err."""
+
+    @t.overload
+    def or_else(self, fn: t.Callable[..., Result[T, F]]) -> "AsyncResult[T, F]":
+        """Chain a sync function returning a Result onto Err."""
+
+    def or_else(self, fn: t.Callable[..., t.Any]) -> "AsyncResult[T, t.Any]":
+        """Chain a sync or async function returning a Result onto Err."""
+        return self._then(_OR_ELSE, fn)
+
+    async def _resolve(self) -> Result[T, E]:
+        """Await the source Result, then apply each step in turn."""
+        result: Result[t.Any, t.Any] = await self._source
+        for kind, fn in self._steps:
+            if result.__class__ is not Ok and isinstance(result, Err):
+                if kind < _MAP_ERR:
+                    continue
+            elif kind >= _MAP_ERR:
+                continue
+            out = fn(result.value)
+            if isawaitable(out):
+                out = await out
+            if kind == _MAP:
+                result = Ok(out)
+            elif kind == _MAP_ERR:
+                result = Err(out)
+            else:
+                result = out
+        return result
+
+    def __await__(self) -> t.Generator[t.Any, None, Result[T, E]]:
+        """Resolve the chain."""
+        return self._resolve().__await__()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the AsyncResult."""
+        return f"AsyncResult({self._source!r}, steps={len(self._steps)})"
+
+
+async def _call_async(
+    fn: t.Callable[..., t.Awaitable[T]],
+    args: t.Tuple[t.Any, ...],
+    kwargs: t.Dict[str, t.Any],
+    catch: t.Type[ExcType],
+) -> Result[T, ExcType]:
+    """Await `fn(*args, **kwargs)`, wrapping the outcome in a Result."""
+    try:
+        return Ok(await fn(*args, **kwargs))
+    except catch as exc:  # pylint: disable=broad-except
+        return Err(exc)
+
+
+async def _to_thread(fn: t.Callable[..., T], *args: t.Any) -> T:
+    """Run `fn` in the default executor.
+
+    A fallback for `asyncio.to_thread()`, which was added in Python 3.9.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, fn, *args)
+
+
+def of_async(
+    fn: t.Callable[..., t.Awaitable[T]],
+    args: t.Tuple[t.Any, ...],
+    kwargs: t.Dict[str, t.Any],
+    catch: t.Type[ExcType],
+) -> AsyncResult[T, ExcType]:
+    """Await `fn` in an AsyncResult, as for `Result.of_async`."""
+    return AsyncResult(_call_async(fn, args, kwargs, catch))
+
+
+def of_in_thread(
+    fn: t.Callable[..., T],
+    args: t.Tuple[t.Any, ...],
+    kwargs: t.Dict[str, t.Any],
+    catch: t.Type[ExcType],
+) -> AsyncResult[T, ExcType]:
+    """Run `fn` in a thread in an AsyncResult, as for `Result.of_in_thread`."""
+    to_thread = getattr(asyncio, "to_thread", _to_thread)
+    call = functools.partial(fn, *args, **kwargs)
+    return AsyncResult(_call_async(to_thread, (call,), {}, catch))
+
+
+async def gather(
+    awaitables: t.Sequence[t.Awaitable[Result[t.Any, t.Any]]], mode: str
+) -> Result[t.Any, t.Any]:
+    """Await every Result, combining them as for `Result.gather`.
+
+    Every awaitable is run as a Task. However this returns, including by
+    being cancelled, every Task that has not finished is cancelled and
+    waited for before it does, so that no Tasks outlive the call.
+    """
+    if mode not in GATHER_MODES:
+        raise ValueError(f"mode must be one of {GATHER_MODES}, not {mode!r}")
+    tasks = [asyncio.ensure_future(aw) for aw in awaitables]
+    index = {task: idx for idx, task in enumerate(tasks)}
+    results: t.List[t.Any] = [None] * len(tasks)
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            # Tasks finishing together are handled in the order given
+            for task in sorted(done, key=index.__getitem__):
+                result = task.result()
+                is_err = result.__class__ is not Ok and isinstance(result, Err)
+                if is_err and mode == "short_circuit":
+                    return result
+                if not is_err and mode == "first_ok":
+                    return result
+                results[index[task]] = result
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        for task in tasks:
+            # Mark any other exceptions as retrieved, since only the first
+            # is raised
+            if task.done() and not task.cancelled():
+                task.exception()
+    if mode == "first_ok":
+        return Err(tuple(result.value for result in results))
+    return Result.collect_all(results)
@@ -0,0 +1,426 @@
+"""Columnar containers for many Results or Options at once."""
+
+import typing as t
+from itertools import compress, repeat
+from operator import index, is_not
+
+from ._impl import NOTHING, Err, Ok, Option, Result, Some
+
+try:
+    from pickle import PickleBuffer
+except ImportError:  # pragma: no cover
+    # Python < 3.8, which has no pickle protocol 5
+    PickleBuffer = None  # type: ignore
+
+
+T = t.TypeVar("T", covariant=True)
+E = t.TypeVar("E", covariant=True)
+U = t.TypeVar("U")
+F = t.TypeVar("F")
+
+# Tags are stored one byte per item: 1 for Ok/Some, 0 for Err/Nothing
+_INVERT = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+
+class ResultBatch(t.Generic[T, E]):
+    """A sequence of Results, stored as a tag per item plus a value list.
+
+    Rather than an `Ok` or `Err` instance per item, a batch stores one byte
+    per item recording whether it is `Ok`, alongside a list of the wrapped
+    values. Bulk operations run in a single loop over the columns, and
+    individual `Ok` and `Err` instances are only created when iterating or
+    indexing.
+
+    Batches are immutable: every operation returns a new batch.
+
+    Example:
+    ```py
+
+    >>> batch = ResultBatch([Ok(1), Err("no"), Ok(3)])
+    >>> batch.map(lambda x: x * 2).partition()
+    ((2, 6), ('no',))
+
+    ```
+    """
+
+    __slots__ = ("_tags", "_values")
+
+    def __init__(self, results: t.Iterable[Result[T, E]] = ()) -> None:
+        """Create a batch from an iterable of Results."""
+        tags = bytearray()
+        values: t.List[t.Any] = []
+        tag = tags.append
+        append = values.append
+        for result in results:
+            tag(result.__class__ is Ok or isinstance(result, Ok))
+            append(result.value)
+        self._tags = bytes(tags)
+        self._values = values
+
+    @classmethod
+    def _from_columns(
+        cls, tags: bytes, values: t.List[t.Any]
+    ) -> "ResultBatch[t.Any, t.Any]":
+        """Create a batch directly from its columns, without copying."""
+        batch: ResultBatch[t.Any, t.Any] = cls.__new__(cls)
+        batch._tags = tags
+        batch._values = values
+        return batch
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def ok_if(
+        cls, predicate: t.Callable[[U], bool], values: t.Iterable[U]
+    ) -> "ResultBatch[U, U]":
+        """Return a batch of `Ok(val)` where predicate(val) is True, else Err.
+
+        The bulk version of `Result.ok_if()`.
+        """
+        values = list(values)
+        tags = bytes(map(bool, map(predicate, values)))
+        return cls._from_columns(tags, values)
+
+    @classmethod
+    def err_if(
+        cls, predicate: t.Callable[[U], bool], values: t.Iterable[U]
+    ) -> "ResultBatch[U, U]":
+        """Return a batch of `Err(val)` where predicate(val) is True, else Ok.
+
+        The bulk version of `Result.err_if()`.
+        """
+        values = list(values)
+        tags = bytes(map(bool, map(predicate, values))).translate(_INVERT)
+        return cls._from_columns(tags, values)
+
+    # ------------------------------------------------------------------
+    # Methods
+    # ------------------------------------------------------------------
+
+    def and_then(
+        self, fn: t.Callable[[T], Result[U, E]]
+    ) -> "ResultBatch[U, E]":
+        """Call `fn` on every `Ok` value, keeping every `Err` as-is."""
+        tags = bytearray(self._tags)
+        values = list(self._values)
+        for idx in compress(range(len(tags)), tags):
+            result = fn(values[idx])
+            if not isinstance(result, Ok):
+                tags[idx] = 0
+            values[idx] = result.value
+        return self._from_columns(bytes(tags), values)
+
+    def collect(self) -> Result[t.Tuple[T, ...], E]:
+        """Return `Ok` of all values, or the first `Err`.
+
+        Equivalent to `Result.collect()` on the batch's items.
+        """
+        idx = self._tags.find(0)
+        if idx == -1:
+            return Ok(tuple(self._values))
+        return Err(self._values[idx])
+
+    def count_ok(self) -> int:
+        """Return the number of `Ok` items."""
+        return self._tags.count(1)
+
+    def count_err(self) -> int:
+        """Return the number of `Err` items."""
+        return self._tags.count(0)
+
+    def map(self, fn: t.Callable[[T], U]) -> "ResultBatch[U, E]":
+        """Map a function onto every `Ok` value, ignoring errors."""
+        return self._from_columns(
+            self._tags,
+            [
+                fn(val) if tag else val
+                for tag, val in zip(self._tags, self._values)
+            ],
+        )
+
+    def map_err(self, fn: t.Callable[[E], F]) -> "ResultBatch[T, F]":
+        """Map a function onto every `Err` value, ignoring successes."""
+        return self._from_columns(
+            self._tags,
+            [
+                val if tag else fn(val)
+                for tag, val in zip(self._tags, self._values)
+            ],
+        )
+
+    def oks(self) -> t.Tuple[T, ...]:
+        """Return the `Ok` values, in order."""
+        return tuple(compress(self._values, self._tags))
+
+    def errs(self) -> t.Tuple[E, ...]:
+        """Return the `Err` values, in order."""
+        return tuple(compress(self._values, self._tags.translate(_INVERT)))
+
+    def partition(self) -> t.Tuple[t.Tuple[T, ...], t.Tuple[E, ...]]:
+        """Return a tuple of the `Ok` values and a tuple of the `Err` values."""
+        return self.oks(), self.errs()
+
+    def __len__(self) -> int:
+        """Return the number of items in the batch."""
+        return len(self._values)
+
+    def __iter__(self) -> t.Iterator[Result[T, E]]:
+        """Iterate over the items as `Ok` and `Err` instances."""
+        for tag, val in zip(self._tags, self._values):
+            yield Ok(val) if tag else Err(val)
+
+    @t.overload
+    def __getitem__(self, idx: int) -> Result[T, E]:
+        """Return the item at `idx` as an `Ok` or `Err`."""
+
+    @t.overload
+    def __getitem__(self, idx: slice) -> "ResultBatch[T, E]":
+        """Return the items in `idx` as a sub-batch."""
+
+    def __getitem__(
+        self, idx: t.Union[int, slice]
+    ) -> t.Union[Result[T, E], "ResultBatch[T, E]"]:
+        """Return the item at `idx` as an `Ok` or `Err`, or a sub-batch."""
+        if isinstance(idx, slice):
+            return self._from_columns(self._tags[idx], self._values[idx])
+        val = self._values[idx]
+        return Ok(val) if self._tags[idx] else Err(val)
+
+    def __eq__(self, other: t.Any) -> bool:
+        """Batches are equal if their items are equal."""
+        if not isinstance(other, ResultBatch):
+            return False
+        eq: bool = self._tags == other._tags and self._values == other._values
+        return eq
+
+    def __ne__(self, other: t.Any) -> bool:
+        """Batches are equal if their items are equal."""
+        return not self == other
+
+    def __reduce_ex__(self, protocol: t.SupportsIndex) -> t.Tuple[t.Any, ...]:
+        """Pickle as the batch's columns.
+
+        With protocol 5, the tags are wrapped in a `pickle.PickleBuffer`,
+        so they may be passed out-of-band.
+        """
+        tags = PickleBuffer(self._tags) if index(protocol) >= 5 else self._tags
+        return (_unpickle, (self.__class__, tags, self._values))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the batch."""
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+class OptionBatch(t.Generic[T]):
+    """A sequence of Options, stored as a tag per item plus a value list.
+
+    Rather than a `Some` instance per item, a batch stores one byte per
+    item recording whether it is `Some`, alongside a list of the wrapped
+    values (None for `Nothing`). Bulk operations run in a single loop over
+    the columns, and individual `Some` instances are only created when
+    iterating or indexing.
+
+    Batches are immutable: every operation returns a new batch.
+
+    Example:
+    ```py
+
+    >>> batch = OptionBatch.of([1, None, 3])
+    >>> batch.filter(lambda x: x > 1).collect()
+    Nothing()
+    >>> batch.map(lambda x: x * 2).partition()
+    ((2, 6), 1)
+
+    ```
+    """
+
+    __slots__ = ("_tags", "_values")
+
+    def __init__(self, options: t.Iterable[Option[T]] = ()) -> None:
+        """Create a batch from an iterable of Options."""
+        tags = bytearray()
+        values: t.List[t.Any] = []
+        tag = tags.append
+        append = values.append
+        for option in options:
+            tag(option.__class__ is Some or isinstance(option, Some))
+            append(option.value)
+        self._tags = bytes(tags)
+        self._values = values
+
+    @classmethod
+    def _from_columns(
+        cls, tags: bytes, values: t.List[t.Any]
+    ) -> "OptionBatch[t.Any]":
+        """Create a batch directly from its columns, without copying."""
+        batch: OptionBatch[t.Any] = cls.__new__(cls)
+        batch._tags = tags
+        batch._values = values
+        return batch
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def of(cls, values: t.Iterable[t.Optional[U]]) -> "OptionBatch[U]":
+        """Return a batch of `Nothing()` for each None, else `Some(val)`.
+
+        The bulk version of `Option.of()`.
+        """
+        values = list(values)
+        tags = bytes(map(is_not, values, repeat(None)))
+        return cls._from_columns(tags, values)
+
+    @classmethod
+    def some_if(
+        cls, predicate: t.Callable[[U], bool], values: t.Iterable[U]
+    ) -> "OptionBatch[U]":
+        """Return a batch of `Some(val)` where predicate(val) is True.
+
+        Other values become `Nothing()`. The bulk version of
+        `Option.some_if()`.
+        """
+        values = list(values)
+        tags = bytes(map(bool, map(predicate, values)))
+        return cls._from_columns(tags, _clear(tags, values))
+
+    @classmethod
+    def nothing_if(
+        cls, predicate: t.Callable[[U], bool], values: t.Iterable[U]
+    ) -> "OptionBatch[U]":
+        """Return a batch of `Nothing()` where predicate(val) is True.
+
+        Other values become `Some(val)`. The bulk version of
+        `Option.nothing_if()`.
+        """
+        values = list(values)
+        tags = bytes(map(bool, map(predicate, values))).translate(_INVERT)
+        return cls._from_columns(tags, _clear(tags, values))
+
+    # ------------------------------------------------------------------
+    # Methods
+    # ------------------------------------------------------------------
+
+    def and_then(self, fn: t.Callable[[T], Option[U]]) -> "OptionBatch[U]":
+        """Call `fn` on every `Some` value, keeping every `Nothing`."""
+        tags = bytearray(self._tags)
+        values = list(self._values)
+        for idx in compress(range(len(tags)), tags):
+            option = fn(values[idx])
+            if not isinstance(option, Some):
+                tags[idx] = 0
+            values[idx] = option.value
+        return self._from_columns(bytes(tags), values)
+
+    def collect(self) -> Option[t.Tuple[T, ...]]:
+        """Return `Some` of all values, or `Nothing()` if any are `Nothing`.
+
+        Equivalent to `Option.collect()` on the batch's items.
+        """
+        if 0 in self._tags:
+            return NOTHING
+        return Some(tuple(self._values))
+
+    def count_some(self) -> int:
+        """Return the number of `Some` items."""
+        return self._tags.count(1)
+
+    def count_nothing(self) -> int:
+        """Return the number of `Nothing` items."""
+        return self._tags.count(0)
+
+    def filter(self, predicate: t.Callable[[T], bool]) -> "OptionBatch[T]":
+        """Replace every `Some` for which `predicate` is False with Nothing."""
+        tags = bytes(
+            [
+                1 if tag and predicate(val) else 0
+                for tag, val in zip(self._tags, self._values)
+            ]
+        )
+        return self._from_columns(tags, _clear(tags, self._values))
+
+    def map(self, fn: t.Callable[[T], U]) -> "OptionBatch[U]":
+        """Apply `fn` to every `Some` value."""
+        return self._from_columns(
+            self._tags,
+            [
+                fn(val) if tag else None
+                for tag, val in zip(self._tags, self._values)
+            ],
+        )
+
+    def somes(self) -> t.Tuple[T, ...]:
+        """Return the `Some` values, in order."""
+        return tuple(compress(self._values, self._tags))
+
+    def partition(self) -> t.Tuple[t.Tuple[T, ...], int]:
+        """Return a tuple of the `Some` values and the count of `Nothing`."""
+        return self.somes(), self._tags.count(0)
+
+    def __len__(self) -> int:
+        """Return the number of items in the batch."""
+        return len(self._values)
+
+    def __iter__(self) -> t.Iterator[Option[T]]:
+        """Iterate over the items as `Some` and `Nothing` instances."""
+        nothing: Option[T] = NOTHING
+        for tag, val in zip(self._tags, self._values):
+            yield Some(val) if tag else nothing
+
+    @t.overload
+    def __getitem__(self, idx: int) -> Option[T]:
+        """Return the item at `idx` as a `Some` or `Nothing`."""
+
+    @t.overload
+    def __getitem__(self, idx: slice) -> "OptionBatch[T]":
+        """Return the items in `idx` as a sub-batch."""
+
+    def __getitem__(
+        self, idx: t.Union[int, slice]
+    ) -> t.Union[Option[T], "OptionBatch[T]"]:
+        """Return the item at `idx` as a `Some` or `Nothing`, or a sub-batch."""
+        if isinstance(idx, slice):
+            return self._from_columns(self._tags[idx], self._values[idx])
+        val = self._values[idx]
+        return Some(val) if self._tags[idx] else NOTHING
+
+    def __eq__(self, other: t.Any) -> bool:
+        """Batches are equal if their items are equal."""
+        if not isinstance(other, OptionBatch):
+            return False
+        eq: bool = self._tags == other._tags and self._values == other._values
+        return eq
+
+    def __ne__(self, other: t.Any) -> bool:
+        """Batches are equal if their items are equal."""
+        return not self == other
+
+    def __reduce_ex__(self, protocol: t.SupportsIndex) -> t.Tuple[t.Any, ...]:
+        """Pickle as the batch's columns.
+
+        With protocol 5, the tags are wrapped in a `pickle.PickleBuffer`,
+        so they may be passed out-of-band.
+        """
+        tags = PickleBuffer(self._tags) if index(protocol) >= 5 else self._tags
+        return (_unpickle, (self.__class__, tags, self._values))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the batch."""
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+def _unpickle(cls: t.Type[t.Any], tags: t.Any, values: t.List[t.Any]) -> t.Any:
+    """Rebuild a pickled batch, copying out-of-band tags into bytes."""
+    if tags.__class__ is not bytes:
+        tags = bytes(tags)
+    return cls._from_columns(tags, values)
+
+
+def _clear(tags: bytes, values: t.List[t.Any]) -> t.List[t.Any]:
+    """Return `values` with every untagged value replaced by None."""
+    if 0 not in tags:
+        return list(values)
+    return [val if tag else None for tag, val in zip(tags, values)]
@@ -0,0 +1,96 @@
+"""Typed columns of numeric Results and Options.
+
+Shared by the modules which store items as a tag per item plus flat,
+fixed-width arrays of values and error codes, typed by `array` module
+typecodes.
+"""
+
+import typing as t
+from array import array
+from itertools import compress, repeat
+from operator import attrgetter
+
+from ._batch import _INVERT, OptionBatch, ResultBatch
+from ._impl import Ok, Option, Result, Some
+
+
+_VALUE = attrgetter("_value")
+
+
+def itemsize(typecode: str) -> int:
+    """Return the size in bytes of an item of type `typecode`."""
+    return array(typecode).itemsize
+
+
+def zeros(typecode: str, length: int) -> "array[t.Any]":
+    """Return an array of `length` zeros."""
+    arr = array(typecode)
+    arr.frombytes(bytes(length * arr.itemsize))
+    return arr
+
+
+def cast(buf: t.Any, typecode: str) -> memoryview:
+    """Return a one-dimensional view of `buf` as `typecode` items."""
+    view = memoryview(buf)
+    if view.format != typecode or view.ndim != 1:
+        view = view.cast("B").cast(typecode)  # type: ignore
+    return view
+
+
+def readonly(view: memoryview) -> memoryview:
+    """Return a read-only version of `view`, where supported.
+
+    `memoryview.toreadonly()` was added in Python 3.8.
+    """
+    return view.toreadonly() if hasattr(view, "toreadonly") else view
+
+
+def readonly_copy(arr: "array[t.Any]") -> memoryview:
+    """Return a read-only typed view of a copy of `arr`."""
+    return memoryview(arr.tobytes()).cast(arr.typecode)  # type: ignore
+
+
+def split_results(
+    results: t.Iterable[Result[t.Any, t.Any]],
+    value_type: str,
+    error_type: str,
+) -> t.Tuple[bytes, "array[t.Any]", "array[t.Any]"]:
+    """Split Results, or a `ResultBatch`, into typed columns.
+
+    Return a tag per item, 1 for `Ok`, and arrays of the values and error
+    codes, each holding 0 where the item is of the other variant.
+    """
+    if isinstance(results, ResultBatch):
+        tags = results._tags
+        values = list(results._values)
+    else:
+        values = list(results)
+        tags = bytes(map(isinstance, values, repeat(Ok)))
+        values = list(map(_VALUE, values))
+    errors = zeros(error_type, len(tags))
+    # Errs are moved from the values to the errors one at a time, which is
+    # cheap, since they are usually few
+    for idx in compress(range(len(tags)), tags.translate(_INVERT)):
+        errors[idx] = values[idx]
+        values[idx] = 0
+    return tags, array(value_type, values), errors
+
+
+def split_options(
+    options: t.Iterable[Option[t.Any]], value_type: str
+) -> t.Tuple[bytes, "array[t.Any]"]:
+    """Split Options, or an `OptionBatch`, into typed columns.
+
+    Return a tag per item, 1 for `Some`, and an array of the values,
+    holding 0 for `Nothing()`.
+    """
+    if isinstance(options, OptionBatch):
+        tags = options._tags
+        values = list(options._values)
+    else:
+        values = list(options)
+        tags = bytes(map(isinstance, values, repeat(Some)))
+        values = list(map(_VALUE, values))
+    for idx in compress(range(len(tags)), tags.translate(_INVERT)):
+        values[idx] = 0
+    return tags, array(value_type, values)
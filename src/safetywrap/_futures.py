@@ -0,0 +1,348 @@
+"""Results from `concurrent.futures` Futures and executors."""
+
+import os
+import pickle
+import typing as t
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import as_completed, wait
+from functools import partial
+from itertools import islice
+
+from ._batch import ResultBatch
+from ._impl import NOTHING, Err, Ok, Option, Result, Some
+
+
+T = t.TypeVar("T")
+K = t.TypeVar("K")
+U = t.TypeVar("U")
+
+ExcType = t.TypeVar("ExcType", bound=Exception)
+
+
+def from_future(
+    fut: "Future[T]", timeout: t.Optional[float], catch: t.Type[ExcType]
+) -> Result[T, ExcType]:
+    """Wrap the outcome of `fut` in a Result, for `Result.from_future`."""
+    try:
+        # Checking the exception first avoids raising it only to catch it
+        exc = fut.exception(timeout)
+    except catch as err:  # pylint: disable=broad-except
+        # Timed out or cancelled
+        return Err(err)
+    if exc is None:
+        return Ok(fut.result())
+    if isinstance(exc, catch):
+        return Err(exc)
+    raise exc
+
+
+def option_from_future(
+    fut: "Future[T]", timeout: t.Optional[float]
+) -> Option[T]:
+    """Implement `Option.from_future()`."""
+    try:
+        return Some(fut.result(timeout))
+    except FutureTimeoutError:
+        return NOTHING
+
+
+# A mapping is also an iterable, of its keys. Any mapping is treated as
+# one, so the first overload wins even if its keys are futures.
+@t.overload
+def as_completed_results(  # type: ignore[overload-overlap]
+    futures: t.Mapping[K, "Future[T]"],
+    *,
+    timeout: t.Optional[float] = None,
+    catch: t.Type[ExcType] = Exception,  # type: ignore
+) -> t.Iterator[t.Tuple[K, Result[T, ExcType]]]:
+    """Yield `(key, Result)` pairs as futures finish, keyed as mapped."""
+
+
+@t.overload
+def as_completed_results(
+    futures: t.Iterable["Future[T]"],
+    *,
+    timeout: t.Optional[float] = None,
+    catch: t.Type[ExcType] = Exception,  # type: ignore
+) -> t.Iterator[t.Tuple[int, Result[T, ExcType]]]:
+    """Yield `(index, Result)` pairs as futures finish."""
+
+
+def as_completed_results(
+    futures: t.Union[t.Mapping[t.Any, "Future[T]"], t.Iterable["Future[T]"]],
+    *,
+    timeout: t.Optional[float] = None,
+    catch: t.Type[ExcType] = Exception,  # type: ignore
+) -> t.Iterator[t.Tuple[t.Any, Result[T, ExcType]]]:
+    """Yield `(key, Result)` pairs as futures finish.
+
+    If `futures` is a mapping, each key is the future's key in it;
+    otherwise, it is the future's position in the iterable. Each Result is
+    `Result.from_future()` of a finished future, so exceptions of type
+    `catch` become Errs. As with `concurrent.futures.as_completed()`, a
+    `TimeoutError` is raised if `timeout` seconds pass before every
+    future has finished.
+
+    Example:
+    ```py
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> with ThreadPoolExecutor() as pool:
+    ...     futures = {val: pool.submit(int, val) for val in ("1", "x")}
+    ...     results = dict(as_completed_results(futures))
+    >>> results["1"]
+    Ok(1)
+    >>> results["x"]
+    Err(ValueError("invalid literal for int() with base 10: 'x'"))
+
+    ```
+    """
+    if isinstance(futures, t.Mapping):
+        keys = {fut: key for key, fut in futures.items()}
+    else:
+        keys = {fut: idx for idx, fut in enumerate(futures)}
+    for fut in as_completed(keys, timeout):
+        yield keys[fut], from_future(fut, None, catch)
+
+
+def _call(
+    fn: t.Callable[[U], t.Any], catch: t.Type[ExcType], item: U
+) -> Result[t.Any, t.Any]:
+    """Call `fn(item)`, returning its Result, or wrapping its outcome."""
+    try:
+        out = fn(item)
+    except catch as exc:  # pylint: disable=broad-except
+        return Err(exc)
+    if isinstance(out, Result):
+        return out
+    return Ok(out)
+
+
+def _default_workers() -> int:
+    """Return the default `max_workers` of a `ThreadPoolExecutor`."""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def collect_parallel(
+    fn: t.Callable[[U], t.Any],
+    iterable: t.Iterable[U],
+    executor: t.Optional[Executor],
+    max_workers: t.Optional[int],
+    window: t.Optional[int],
+    catch: t.Type[ExcType],
+) -> Result[t.Tuple[t.Any, ...], t.Any]:
+    """Apply `fn` to each item in a pool, for `Result.collect_parallel`.
+
+    At most `window` futures are in flight, and the input is read no
+    further ahead than that. When an Err is found, no more work is
+    submitted and every later future is cancelled, but earlier futures
+    are still waited for, since one of them may be an earlier Err. That
+    way, the Err returned is the one `Result.collect()` would return.
+    """
+    if window is None:
+        window = 2 * (max_workers or _default_workers())
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    own_executor = executor is None
+    pool = ThreadPoolExecutor(max_workers) if executor is None else executor
+    call = partial(_call, fn, catch)
+    items = iter(iterable)
+    values: t.List[t.Any] = []
+    in_flight: t.Dict["Future[Result[t.Any, t.Any]]", int] = {}
+    err: t.Optional[Result[t.Any, t.Any]] = None
+    err_idx = -1
+    exhausted = False
+    try:
+        while True:
+            while err is None and not exhausted and len(in_flight) < window:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                else:
+                    in_flight[pool.submit(call, item)] = len(values)
+                    values.append(None)
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                idx = in_flight.pop(fut)
+                result = fut.result()
+                if result.__class__ is not Ok and isinstance(result, Err):
+                    if err is None or idx < err_idx:
+                        err, err_idx = result, idx
+                elif err is None:
+                    values[idx] = result._value  # type: ignore
+            if err is not None:
+                values.clear()
+                for fut, idx in list(in_flight.items()):
+                    if idx > err_idx:
+                        fut.cancel()
+                        del in_flight[fut]
+    finally:
+        for fut in in_flight:
+            fut.cancel()
+        if own_executor:
+            pool.shutdown(wait=True)
+    if err is not None:
+        return err
+    return Ok(tuple(values))
+
+
+class ExceptionRecord(Exception):
+    """A picklable stand-in for an exception that could not be pickled.
+
+    Returned in place of an exception caught in a worker process that
+    could not be sent back to the parent, recording its type's name and
+    its message.
+    """
+
+    def __init__(self, type_name: str, message: str) -> None:
+        """Record an exception of type `type_name`."""
+        super().__init__(type_name, message)
+        self.type_name = type_name
+        self.message = message
+
+    @classmethod
+    def from_exception(cls, exc: BaseException) -> "ExceptionRecord":
+        """Record `exc`'s fully qualified type name and message."""
+        exc_type = type(exc)
+        return cls(f"{exc_type.__module__}.{exc_type.__qualname__}", str(exc))
+
+    def __str__(self) -> str:
+        """Return the original exception's type name and message."""
+        return f"{self.type_name}: {self.message}"
+
+
+def _sendable(exc: Exception) -> Exception:
+    """Return `exc` if it survives pickling, or else an ExceptionRecord.
+
+    Exceptions that pickle but fail to unpickle, such as those whose
+    `__init__()` takes arguments other than their `args`, would otherwise
+    break the process pool when their chunk is unpickled in the parent.
+    """
+    try:
+        pickle.loads(pickle.dumps(exc, pickle.HIGHEST_PROTOCOL))
+    except Exception:  # pylint: disable=broad-except
+        return ExceptionRecord.from_exception(exc)
+    return exc
+
+
+def _run_chunk(
+    fn: t.Callable[[U], T],
+    catch: t.Type[ExcType],
+    stop_on_err: bool,
+    items: t.Sequence[U],
+) -> "ResultBatch[T, ExcType]":
+    """Call `fn` on each item, returning the outcomes as a ResultBatch.
+
+    Errs are of type `catch`, or are an `ExceptionRecord` standing in for
+    one that could not be pickled.
+    """
+    tags = bytearray()
+    values: t.List[t.Any] = []
+    tag = tags.append
+    append = values.append
+    for item in items:
+        try:
+            append(fn(item))
+        except catch as exc:  # pylint: disable=broad-except
+            tag(0)
+            append(_sendable(exc))
+            if stop_on_err:
+                break
+        else:
+            tag(1)
+    return ResultBatch._from_columns(bytes(tags), values)
+
+
+def process_map(
+    fn: t.Callable[[U], T],
+    items: t.Iterable[U],
+    *,
+    chunksize: int = 256,
+    executor: t.Optional[Executor] = None,
+    max_workers: t.Optional[int] = None,
+    window: t.Optional[int] = None,
+    stop_on_err: bool = False,
+    catch: t.Type[ExcType] = Exception,  # type: ignore
+) -> t.Iterator["ResultBatch[T, ExcType]"]:
+    """Call `fn` on items in worker processes, yielding ResultBatches.
+
+    Items are sent to the workers in chunks of `chunksize`, and each chunk
+    comes back as a `ResultBatch` of `Result.of(fn, item, catch=catch)`
+    for its items, in order. Shipping a chunk's tags and values, rather
+    than an Ok or Err per item, keeps the cost of pickling down. Caught
+    exceptions that cannot be pickled are replaced by an
+    `ExceptionRecord` of their type and message.
+
+    Chunks run in `executor`, or else in a new `ProcessPoolExecutor` of
+    `max_workers` processes, which is shut down when iteration stops. At
+    most `window` chunks are queued or running at once, by default twice
+    the number of workers. `fn` and the items must be picklable.
+
+    If `stop_on_err` is True, iteration stops after the first batch
+    containing an Err, which ends at that Err, and later chunks are
+    cancelled.
+
+    Example:
+    ```py
+
+    >>> batches = process_map(int, ["1", "x", "3"], chunksize=2)
+    >>> [list(batch) for batch in batches]  # doctest: +ELLIPSIS
+    [[Ok(1), Err(ValueError(...))], [Ok(3)]]
+
+    ```
+    """
+    # Checked here, rather than in the generator, so that bad arguments
+    # raise when called, not on the first `next()`
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if window is None:
+        window = 2 * (max_workers or os.cpu_count() or 1)
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    return _process_map(
+        fn, items, chunksize, executor, max_workers, window, stop_on_err, catch
+    )
+
+
+def _process_map(
+    fn: t.Callable[[U], T],
+    items: t.Iterable[U],
+    chunksize: int,
+    executor: t.Optional[Executor],
+    max_workers: t.Optional[int],
+    window: int,
+    stop_on_err: bool,
+    catch: t.Type[ExcType],
+) -> t.Iterator["ResultBatch[T, ExcType]"]:
+    """Yield the ResultBatch of each chunk, for `process_map()`."""
+    own_executor = executor is None
+    pool = ProcessPoolExecutor(max_workers) if executor is None else executor
+    run = partial(_run_chunk, fn, catch, stop_on_err)
+    chunks = iter(items)
+    in_flight: t.Deque["Future[ResultBatch[T, ExcType]]"] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(in_flight) < window:
+                chunk = list(islice(chunks, chunksize))
+                if chunk:
+                    in_flight.append(pool.submit(run, chunk))
+                else:
+                    exhausted = True
+            if not in_flight:
+                return
+            batch = in_flight.popleft().result()
+            yield batch
+            if stop_on_err and batch.count_err():
+                return
+    finally:
+        for fut in in_flight:
+            fut.cancel()
+        if own_executor:
+            pool.shutdown(wait=True)
@@ -2,10 +2,15 @@
 
 import typing as t
 import warnings
-from functools import reduce
+from copy import deepcopy
 
 from ._interface import _Option, _Result
 
+if t.TYPE_CHECKING:
+    # pylint: disable=unused-import
+    from concurrent.futures import Executor, Future
+    from ._async import AsyncResult
+
 
 T = t.TypeVar("T", covariant=True)
 E = t.TypeVar("E", covariant=True)
@@ -29,6 +34,14 @@ class Result(_Result[T, E]):
 
     __slots__ = ()
 
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        """Results are immutable."""
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Results are immutable."""
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
     @staticmethod
     def of(
         fn: t.Callable[..., T],
@@ -47,6 +60,97 @@ class Result(_Result[T, E]):
         except catch as exc:  # pylint: disable=broad-except
             return Err(exc)
 
+    @staticmethod
+    def of_async(
+        fn: t.Callable[..., t.Awaitable[T]],
+        *args: t.Any,
+        catch: t.Type[ExcType] = Exception,  # type: ignore
+        **kwargs: t.Any,
+    ) -> "AsyncResult[T, ExcType]":
+        """Await `fn(*args, **kwargs)` and wrap its result in an `Ok()`.
+
+        Return an `AsyncResult`, which resolves to `Ok(value)`, or to
+        `Err(exception)` if an exception of type `catch` is raised. Steps
+        may be chained onto it before it is awaited.
+        """
+        from ._async import of_async  # pylint: disable=import-outside-toplevel
+
+        return of_async(fn, args, kwargs, catch)
+
+    @staticmethod
+    def of_in_thread(
+        fn: t.Callable[..., T],
+        *args: t.Any,
+        catch: t.Type[ExcType] = Exception,  # type: ignore
+        **kwargs: t.Any,
+    ) -> "AsyncResult[T, ExcType]":
+        """Call blocking `fn` in a thread and wrap its result in an `Ok()`.
+
+        Return an `AsyncResult`, which resolves to `Ok(value)`, or to
+        `Err(exception)` if an exception of type `catch` is raised. The
+        function is run in the event loop's default executor.
+        """
+        # pylint: disable=import-outside-toplevel
+        from ._async import of_in_thread
+
+        return of_in_thread(fn, args, kwargs, catch)
+
+    @staticmethod
+    def from_future(
+        fut: "Future[T]",
+        timeout: t.Optional[float] = None,
+        *,
+        catch: t.Type[ExcType] = Exception,  # type: ignore
+    ) -> "Result[T, ExcType]":
+        """Wait for a `concurrent.futures.Future`, wrapping its outcome.
+
+        Return `Ok(value)`, or `Err(exception)` if the future raised an
+        exception of type `catch`. Waiting for longer than `timeout`
+        seconds, or for a cancelled future, also returns an Err when
+        `catch` matches the `TimeoutError` or `CancelledError` raised.
+        """
+        # pylint: disable=import-outside-toplevel
+        from ._futures import from_future
+
+        return from_future(fut, timeout, catch)
+
+    @staticmethod
+    def gather(
+        *awaitables: t.Awaitable["Result[t.Any, t.Any]"],
+        mode: str = "short_circuit",
+    ) -> t.Coroutine[t.Any, t.Any, "Result[t.Any, t.Any]"]:
+        """Run awaitables of Results concurrently, combining their Results.
+
+        Each awaitable is run as a Task. With the default `mode`,
+        "short_circuit", return `Ok` of every value in order, or the first
+        Err to finish, cancelling the remaining Tasks. With "collect_all",
+        wait for every Task, and return as `Result.collect_all()` does.
+        With "first_ok", return the first Ok to finish, cancelling the
+        remaining Tasks, or Err of every error in order.
+
+        No Tasks outlive the call: if it returns early, raises, or is
+        cancelled, all unfinished Tasks are cancelled and waited for.
+
+        Example:
+        ```py
+
+        >>> import asyncio
+        >>> async def fetch(val: int) -> Result[int, str]:
+        ...     return Ok(val) if val > 0 else Err("negative")
+        >>> asyncio.run(Result.gather(fetch(1), fetch(2)))
+        Ok((1, 2))
+        >>> asyncio.run(Result.gather(fetch(1), fetch(-1)))
+        Err('negative')
+        >>> asyncio.run(Result.gather(fetch(-1), fetch(2), mode="first_ok"))
+        Ok(2)
+
+        ```
+        """
+        # pylint: disable=import-outside-toplevel
+        from ._async import gather
+
+        return gather(awaitables, mode)
+
     @staticmethod
     def collect(
         iterable: t.Iterable["Result[U, F]"],
@@ -71,12 +175,184 @@ class Result(_Result[T, E]):
         hinted, either by a variable annotation or a return type.
         """
         # Non-functional code here to enable true short-circuiting.
-        ok_vals: t.Tuple[U, ...] = ()
+        # Values are appended to a list (amortized O(1)) and converted to
+        # a tuple once at the end. The identity check keeps the common
+        # case free of method calls.
+        ok_vals: t.List[U] = []
+        append = ok_vals.append
+        for result in iterable:
+            if result.__class__ is not Ok and isinstance(result, Err):
+                return result
+            append(result._value)  # type: ignore
+        return Ok(tuple(ok_vals))
+
+    @staticmethod
+    def collect_parallel(
+        fn: t.Callable[[t.Any], t.Union["Result[U, F]", U]],
+        iterable: t.Iterable[t.Any],
+        *,
+        executor: t.Optional["Executor"] = None,
+        max_workers: t.Optional[int] = None,
+        window: t.Optional[int] = None,
+        catch: t.Type[ExcType] = Exception,  # type: ignore
+    ) -> "Result[t.Tuple[U, ...], t.Union[F, ExcType]]":
+        """Apply `fn` to each item in a pool, collecting the Results.
+
+        `fn` may return a Result, or a plain value, which is wrapped in Ok,
+        with exceptions of type `catch` becoming Errs, as in `Result.of()`.
+        Return what `Result.collect()` would for the Results in order: Ok
+        of every value, or the first Err. Once an Err is found, no more
+        work is submitted, and unstarted calls for later items are
+        cancelled.
+
+        Calls run in `executor`, or else in a new `ThreadPoolExecutor` of
+        `max_workers` threads, which is shut down before returning. At
+        most `window` calls are queued or running at once, by default
+        twice the number of workers, so memory use does not grow with the
+        number of items in flight.
+
+        Example:
+        ```py
+
+        >>> Result.collect_parallel(int, ["1", "2"])
+        Ok((1, 2))
+        >>> Result.collect_parallel(int, ["1", "x"], catch=ValueError)
+        Err(ValueError("invalid literal for int() with base 10: 'x'"))
+
+        ```
+        """
+        # pylint: disable=import-outside-toplevel
+        from ._futures import collect_parallel
+
+        return collect_parallel(
+            fn, iterable, executor, max_workers, window, catch
+        )
+
+    @t.overload
+    @staticmethod
+    def collect_all(
+        iterable: t.Iterable["Result[U, F]"],
+        *,
+        max_errors: t.Optional[int] = None,
+        group: None = None,
+    ) -> "Result[t.Tuple[U, ...], t.Tuple[F, ...]]":
+        """Collect every value, or a tuple of every error."""
+
+    @t.overload
+    @staticmethod
+    def collect_all(
+        iterable: t.Iterable["Result[U, F]"],
+        *,
+        max_errors: t.Optional[int] = None,
+        group: str,
+    ) -> "Result[t.Tuple[U, ...], Exception]":
+        """Collect every value, or an ExceptionGroup of every error."""
+
+    @staticmethod
+    def collect_all(
+        iterable: t.Iterable["Result[U, F]"],
+        *,
+        max_errors: t.Optional[int] = None,
+        group: t.Optional[str] = None,
+    ) -> "Result[t.Tuple[U, ...], t.Any]":
+        """Convert an iterable of Results into a Result of every value.
+
+        Unlike `collect()`, do not stop at the first Err. If all items are
+        Ok, return Ok of a tuple of their values. Otherwise, return Err of
+        a tuple of every error, in order. If `max_errors` is given, stop
+        once that many errors have been found. If `group` is given, the
+        errors must be exceptions, and are returned as an ExceptionGroup
+        with `group` as its message.
+
+        Example:
+        ```py
+
+        >>> Result.collect_all([Ok(1), Err("a"), Ok(3), Err("b")])
+        Err(('a', 'b'))
+        >>> Result.collect_all([Ok(1), Ok(2)])
+        Ok((1, 2))
+
+        ```
+        """
+        if max_errors is not None and max_errors < 1:
+            raise ValueError("max_errors must be at least 1")
+        ok_vals: t.List[U] = []
+        err_vals: t.List[F] = []
+        ok_append = ok_vals.append
+        err_append = err_vals.append
         for result in iterable:
-            if result.is_err():
-                return result.map(lambda _: ())
-            ok_vals += (result.unwrap(),)
-        return Ok(ok_vals)
+            if result.__class__ is not Ok and isinstance(result, Err):
+                if not err_vals:
+                    # Ok values can no longer be returned, so free them
+                    ok_vals.clear()
+                err_append(result._value)
+                if len(err_vals) == max_errors:
+                    break
+            elif not err_vals:
+                ok_append(result._value)  # type: ignore
+        if not err_vals:
+            return Ok(tuple(ok_vals))
+        if group is None:
+            return Err(tuple(err_vals))
+        return Err(_exception_group(group, err_vals))
+
+    @staticmethod
+    def partition(
+        iterable: t.Iterable["Result[U, F]"],
+    ) -> t.Tuple[t.Tuple[U, ...], t.Tuple[F, ...]]:
+        """Split an iterable of Results into its Ok and Err values.
+
+        Return a tuple of `(ok_values, err_values)`, each in their
+        original order.
+
+        Example:
+        ```py
+
+        >>> Result.partition([Ok(1), Err("a"), Ok(3)])
+        ((1, 3), ('a',))
+
+        ```
+        """
+        # One pass, reading values directly, with the same class check as
+        # `collect()`
+        ok_vals: t.List[U] = []
+        err_vals: t.List[F] = []
+        ok_append = ok_vals.append
+        err_append = err_vals.append
+        for result in iterable:
+            if result.__class__ is not Ok and isinstance(result, Err):
+                err_append(result._value)
+            else:
+                ok_append(result._value)  # type: ignore
+        return tuple(ok_vals), tuple(err_vals)
+
+    @staticmethod
+    def partition_indexed(
+        iterable: t.Iterable["Result[U, F]"],
+    ) -> t.Tuple[t.Tuple[t.Tuple[int, U], ...], t.Tuple[t.Tuple[int, F], ...]]:
+        """Split an iterable of Results, keeping each value's index.
+
+        Like `partition()`, but each value is an `(index, value)` pair,
+        where `index` is the Result's position in the iterable.
+
+        Example:
+        ```py
+
+        >>> Result.partition_indexed([Ok(1), Err("a"), Ok(3)])
+        (((0, 1), (2, 3)), ((1, 'a'),))
+
+        ```
+        """
+        oks: t.List[t.Tuple[int, U]] = []
+        errs: t.List[t.Tuple[int, F]] = []
+        ok_append = oks.append
+        err_append = errs.append
+        for idx, result in enumerate(iterable):
+            if result.__class__ is not Ok and isinstance(result, Err):
+                err_append((idx, result._value))
+            else:
+                ok_append((idx, result._value))  # type: ignore
+        return tuple(oks), tuple(errs)
 
     @staticmethod
     def err_if(predicate: t.Callable[[U], bool], value: U) -> "Result[U, U]":
@@ -98,6 +374,14 @@ class Option(_Option[T]):
 
     __slots__ = ()
 
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        """Options are immutable."""
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Options are immutable."""
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
     @staticmethod
     def of(value: t.Optional[T]) -> "Option[T]":
         """Construct an Option[T] from an Optional[T].
@@ -106,14 +390,42 @@ class Option(_Option[T]):
         not None, Some(value) is returned.
         """
         if value is None:
-            return Nothing()
+            return NOTHING
         return Some(value)
 
+    @staticmethod
+    def from_future(
+        fut: "Future[T]", timeout: t.Optional[float] = None
+    ) -> "Option[T]":
+        """Wait for a `concurrent.futures.Future`, without raising on timeout.
+
+        Return `Some(value)` if the future finishes within `timeout`
+        seconds, or `Nothing()` if it does not. If the future raised an
+        exception, it is raised here, as by `future.result()`.
+
+        Example:
+        ```py
+
+        >>> from concurrent.futures import Future
+        >>> fut = Future()
+        >>> Option.from_future(fut, timeout=0)
+        Nothing()
+        >>> fut.set_result(1)
+        >>> Option.from_future(fut, timeout=0)
+        Some(1)
+
+        ```
+        """
+        # pylint: disable=import-outside-toplevel
+        from ._futures import option_from_future
+
+        return option_from_future(fut, timeout)
+
     @staticmethod
     def nothing_if(predicate: t.Callable[[U], bool], value: U) -> "Option[U]":
         """Return Nothing() if predicate(val) is True, else Some(val)."""
         if predicate(value):
-            return Nothing()
+            return NOTHING
         return Some(value)
 
     @staticmethod
@@ -121,7 +433,7 @@ class Option(_Option[T]):
         """Return Some(val) if predicate(val) is True, else Nothing()."""
         if predicate(value):
             return Some(value)
-        return Nothing()
+        return NOTHING
 
     @staticmethod
     def collect(options: t.Iterable["Option[T]"]) -> "Option[t.Tuple[T, ...]]":
@@ -130,15 +442,69 @@ class Option(_Option[T]):
         If all options are `Some[T]`, the result is `Some[Tuple[T]]`. If
         any options are `Nothing`, the result is `Nothing`.
         """
-        accumulator: Option[t.Tuple[T, ...]] = Some(())
-        try:
-            return reduce(
-                lambda acc, i: acc.map(lambda somes: (*somes, i.unwrap())),
-                options,
-                accumulator,
-            )
-        except RuntimeError:
-            return Nothing()
+        some_vals: t.List[T] = []
+        append = some_vals.append
+        for option in options:
+            if option.__class__ is not Some and isinstance(option, Nothing):
+                return NOTHING
+            append(option._value)  # type: ignore
+        return Some(tuple(some_vals))
+
+    @staticmethod
+    def partition(
+        options: t.Iterable["Option[T]"],
+    ) -> t.Tuple[t.Tuple[T, ...], int]:
+        """Split an iterable of Options into its Some values and Nothings.
+
+        Return a tuple of `(some_values, nothing_count)`, with the values
+        in their original order.
+
+        Example:
+        ```py
+
+        >>> Option.partition([Some(1), Nothing(), Some(3)])
+        ((1, 3), 1)
+
+        ```
+        """
+        some_vals: t.List[T] = []
+        append = some_vals.append
+        nothing_count = 0
+        for option in options:
+            if option.__class__ is not Some and isinstance(option, Nothing):
+                nothing_count += 1
+            else:
+                append(option._value)  # type: ignore
+        return tuple(some_vals), nothing_count
+
+    @staticmethod
+    def partition_indexed(
+        options: t.Iterable["Option[T]"],
+    ) -> t.Tuple[t.Tuple[t.Tuple[int, T], ...], t.Tuple[int, ...]]:
+        """Split an iterable of Options, keeping each item's index.
+
+        Return a tuple of `(some_pairs, nothing_indices)`, where each of
+        `some_pairs` is an `(index, value)` pair, and `index` is always
+        the Option's position in the iterable.
+
+        Example:
+        ```py
+
+        >>> Option.partition_indexed([Some(1), Nothing(), Some(3)])
+        (((0, 1), (2, 3)), (1,))
+
+        ```
+        """
+        somes: t.List[t.Tuple[int, T]] = []
+        nothings: t.List[int] = []
+        some_append = somes.append
+        nothing_append = nothings.append
+        for idx, option in enumerate(options):
+            if option.__class__ is not Some and isinstance(option, Nothing):
+                nothing_append(idx)
+            else:
+                some_append((idx, option._value))  # type: ignore
+        return tuple(somes), tuple(nothings)
 
 
 # pylint: enable=abstract-method
@@ -148,10 +514,23 @@ class Ok(Result[T, E]):
     """Standard wrapper for results."""
 
     __slots__ = ("_value",)
+    __match_args__ = ("value",)
+
+    _value: T
 
     def __init__(self, result: T) -> None:
         """Wrap a result."""
-        self._value: T = result
+        _set_ok_value(self, result)
+
+    @classmethod
+    def of_const(cls, value: U) -> "Result[U, t.Any]":
+        """Return a shared `Ok()` wrapping `value` if it is interned."""
+        try:
+            const = _CONSTS[cls].get(_const_key(value))
+        except KeyError:
+            # A subclass, which has no interned instances
+            const = None
+        return cls(value) if const is None else const  # type: ignore
 
     def and_(self, res: "Result[U, E]") -> "Result[U, E]":
         """Return `res` if the result is `Ok`, otherwise return `self`."""
@@ -159,7 +538,7 @@ class Ok(Result[T, E]):
 
     def or_(self, res: "Result[T, F]") -> "Result[T, F]":
         """Return `res` if the result is `Err`, otherwise `self`."""
-        return t.cast(Result[T, F], self)
+        return self  # type: ignore
 
     def and_then(self, fn: t.Callable[[T], "Result[U, E]"]) -> "Result[U, E]":
         """Call `fn` if Ok, or ignore an error.
@@ -173,15 +552,15 @@ class Ok(Result[T, E]):
 
         This can be used to chain functions that return results.
         """
-        return self.and_then(fn)
+        return fn(self._value)
 
     def or_else(self, fn: t.Callable[[E], "Result[T, F]"]) -> "Result[T, F]":
         """Return `self` if `Ok`, or call `fn` with `self` if `Err`."""
-        return t.cast(Result[T, F], self)
+        return self  # type: ignore
 
     def err(self) -> Option[E]:
         """Return Err value if result is Err."""
-        return Nothing()
+        return NOTHING
 
     def ok(self) -> Option[T]:
         """Return OK value if result is Ok."""
@@ -205,7 +584,7 @@ class Ok(Result[T, E]):
 
         Alias for `Ok.expect`.
         """
-        return self.expect(msg, exc_cls=exc_cls)
+        return self._value
 
     def expect_err(
         self, msg: str, exc_cls: t.Type[Exception] = RuntimeError
@@ -234,7 +613,7 @@ class Ok(Result[T, E]):
 
         If the result is `Err`, the iterator will contain no items.
         """
-        return iter(self)
+        return iter((self._value,))
 
     def map(self, fn: t.Callable[[T], U]) -> "Result[U, E]":
         """Map a function onto an okay result, or ignore an error."""
@@ -242,7 +621,11 @@ class Ok(Result[T, E]):
 
     def map_err(self, fn: t.Callable[[E], F]) -> "Result[T, F]":
         """Map a function onto an error, or ignore a success."""
-        return t.cast(Result[T, F], self)
+        return self  # type: ignore
+
+    def match(self, ok: t.Callable[[T], U], err: t.Callable[[E], U]) -> U:
+        """Call `ok` with the `Ok` value or `err` with the `Err` value."""
+        return ok(self._value)
 
     def unwrap(self) -> T:
         """Return an Ok result, or throw an error if an Err."""
@@ -269,20 +652,40 @@ class Ok(Result[T, E]):
 
         If the result is `Err`, the iterator will contain no items.
         """
-        yield self._value
+        return iter((self._value,))
 
     def __eq__(self, other: t.Any) -> bool:
         """Compare two results. They are equal if their values are equal."""
-        if not isinstance(other, Result):
-            return False
-        if not other.is_ok():
+        if not isinstance(other, Ok):
             return False
-        eq: bool = self._value == other.unwrap()
+        eq: bool = self._value == other._value
         return eq
 
     def __ne__(self, other: t.Any) -> bool:
         """Compare two results. They are equal if their values are equal."""
-        return not self == other
+        if not isinstance(other, Ok):
+            return True
+        ne: bool = not self._value == other._value
+        return ne
+
+    def __hash__(self) -> int:
+        """Return a hash consistent with equality."""
+        return hash(("Ok", self._value))
+
+    def __copy__(self) -> "Ok[T, E]":
+        """Return `self`, since results are immutable."""
+        return self
+
+    def __deepcopy__(self, memo: t.Dict[int, t.Any]) -> "Ok[T, E]":
+        """Return `self` unless the wrapped value must be copied."""
+        value = deepcopy(self._value, memo)
+        if value is self._value:
+            return self
+        return self.__class__(value)
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        """Pickle as a call to the constructor."""
+        return (self.__class__, (self._value,))
 
     def __str__(self) -> str:
         """Return string value of result."""
@@ -290,21 +693,34 @@ class Ok(Result[T, E]):
 
     def __repr__(self) -> str:
         """Return repr for result."""
-        return self.__str__()
+        return f"{self.__class__.__name__}({repr(self._value)})"
 
 
 class Err(Result[T, E]):
     """Standard wrapper for results."""
 
     __slots__ = ("_value",)
+    __match_args__ = ("value",)
+
+    _value: E
 
     def __init__(self, result: E) -> None:
         """Wrap a result."""
-        self._value = result
+        _set_err_value(self, result)
+
+    @classmethod
+    def of_const(cls, value: U) -> "Result[t.Any, U]":
+        """Return a shared `Err()` wrapping `value` if it is interned."""
+        try:
+            const = _CONSTS[cls].get(_const_key(value))
+        except KeyError:
+            # A subclass, which has no interned instances
+            const = None
+        return cls(value) if const is None else const  # type: ignore
 
     def and_(self, res: "Result[U, E]") -> "Result[U, E]":
         """Return `res` if the result is `Ok`, otherwise return `self`."""
-        return t.cast(Result[U, E], self)
+        return self  # type: ignore
 
     def or_(self, res: "Result[T, F]") -> "Result[T, F]":
         """Return `res` if the result is `Err`, otherwise `self`."""
@@ -315,14 +731,14 @@ class Err(Result[T, E]):
 
         This can be used to chain functions that return results.
         """
-        return t.cast(Result[U, E], self)
+        return self  # type: ignore
 
     def flatmap(self, fn: t.Callable[[T], "Result[U, E]"]) -> "Result[U, E]":
         """Call `fn` if Ok, or ignore an error.
 
         This can be used to chain functions that return results.
         """
-        return t.cast(Result[U, E], self.and_then(fn))
+        return self  # type: ignore
 
     def or_else(self, fn: t.Callable[[E], "Result[T, F]"]) -> "Result[T, F]":
         """Return `self` if `Ok`, or call `fn` with `self` if `Err`."""
@@ -334,7 +750,7 @@ class Err(Result[T, E]):
 
     def ok(self) -> Option[T]:
         """Return OK value if result is Ok."""
-        return Nothing()
+        return NOTHING
 
     def expect(self, msg: str, exc_cls: t.Type[Exception] = RuntimeError) -> T:
         """Return `Ok` value or raise an error with the specified message.
@@ -358,7 +774,11 @@ class Err(Result[T, E]):
 
         Alias for `Err.expect`.
         """
-        return self.expect(msg, exc_cls=exc_cls)
+        raise exc_cls(f"{msg}: {self._value}")
+        # Hack: pylint will warn that you're assigning from a function
+        # that doesn't return if there isn't at least one return statement
+        # in a function
+        return self._value  # pylint: disable=unreachable
 
     def expect_err(
         self, msg: str, exc_cls: t.Type[Exception] = RuntimeError
@@ -383,16 +803,20 @@ class Err(Result[T, E]):
 
         If the result is `Err`, the iterator will contain no items.
         """
-        return iter(self)
+        return iter(())
 
     def map(self, fn: t.Callable[[T], U]) -> "Result[U, E]":
         """Map a function onto an okay result, or ignore an error."""
-        return t.cast(Result[U, E], self)
+        return self  # type: ignore
 
     def map_err(self, fn: t.Callable[[E], F]) -> "Result[T, F]":
         """Map a function onto an error, or ignore a success."""
         return Err(fn(self._value))
 
+    def match(self, ok: t.Callable[[T], U], err: t.Callable[[E], U]) -> U:
+        """Call `ok` with the `Ok` value or `err` with the `Err` value."""
+        return err(self._value)
+
     def unwrap(self) -> T:
         """Return an Ok result, or throw an error if an Err."""
         raise RuntimeError(f"Tried to unwrap {self}!")
@@ -418,21 +842,40 @@ class Err(Result[T, E]):
 
         If the result is `Err`, the iterator will contain no items.
         """
-        _: t.Tuple[T, ...] = ()
-        yield from _
+        return iter(())
 
     def __eq__(self, other: t.Any) -> bool:
         """Compare two results. They are equal if their values are equal."""
-        if not isinstance(other, Result):
+        if not isinstance(other, Err):
             return False
-        if not other.is_err():
-            return False
-        eq: bool = self._value == other.unwrap_err()
+        eq: bool = self._value == other._value
         return eq
 
     def __ne__(self, other: t.Any) -> bool:
         """Compare two results. They are equal if their values are equal."""
-        return not self == other
+        if not isinstance(other, Err):
+            return True
+        ne: bool = not self._value == other._value
+        return ne
+
+    def __hash__(self) -> int:
+        """Return a hash consistent with equality."""
+        return hash(("Err", self._value))
+
+    def __copy__(self) -> "Err[T, E]":
+        """Return `self`, since results are immutable."""
+        return self
+
+    def __deepcopy__(self, memo: t.Dict[int, t.Any]) -> "Err[T, E]":
+        """Return `self` unless the wrapped value must be copied."""
+        value = deepcopy(self._value, memo)
+        if value is self._value:
+            return self
+        return self.__class__(value)
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        """Pickle as a call to the constructor."""
+        return (self.__class__, (self._value,))
 
     def __str__(self) -> str:
         """Return string value of result."""
@@ -440,18 +883,30 @@ class Err(Result[T, E]):
 
     def __repr__(self) -> str:
         """Return repr for result."""
-        return self.__str__()
+        return f"{self.__class__.__name__}({repr(self._value)})"
 
 
 class Some(Option[T]):
     """A value that may be `Some` or `Nothing`."""
 
     __slots__ = ("_value",)
+    __match_args__ = ("value",)
+
+    _value: T
 
     def __init__(self, value: T) -> None:
         """Wrap value in a `Some()`."""
-        # not sure why pylint things _value is not in __slots__
-        self._value = value  # pylint: disable=assigning-non-slot
+        _set_some_value(self, value)
+
+    @classmethod
+    def of_const(cls, value: U) -> Option[U]:
+        """Return a shared `Some()` wrapping `value` if it is interned."""
+        try:
+            const = _CONSTS[cls].get(_const_key(value))
+        except KeyError:
+            # A subclass, which has no interned instances
+            const = None
+        return cls(value) if const is None else const  # type: ignore
 
     def and_(self, alternative: Option[U]) -> Option[U]:
         """Return `Nothing` if `self` is `Nothing`, or the `alternative`."""
@@ -463,9 +918,9 @@ class Some(Option[T]):
 
     def xor(self, alternative: Option[T]) -> Option[T]:
         """Return Some IFF exactly one of `self`, `alternative` is `Some`."""
-        return (
-            t.cast(Option[T], self) if alternative.is_nothing() else Nothing()
-        )
+        if alternative is NOTHING or alternative.is_nothing():
+            return self
+        return NOTHING
 
     def and_then(self, fn: t.Callable[[T], Option[U]]) -> Option[U]:
         """Return `Nothing`, or call `fn` with the `Some` value."""
@@ -473,7 +928,7 @@ class Some(Option[T]):
 
     def flatmap(self, fn: t.Callable[[T], Option[U]]) -> Option[U]:
         """Return `Nothing`, or call `fn` with the `Some` value."""
-        return t.cast(Option[U], self.and_then(fn))
+        return fn(self._value)
 
     def or_else(self, fn: t.Callable[[], Option[T]]) -> Option[T]:
         """Return option if it is `Some`, or calculate an alternative."""
@@ -504,7 +959,7 @@ class Some(Option[T]):
             "Use raise_if_nothing() or expect() instead",
             DeprecationWarning,
         )
-        return self.expect(msg, exc_cls=exc_cls)
+        return self._value
 
     def raise_if_nothing(
         self, msg: str, exc_cls: t.Type[Exception] = RuntimeError
@@ -516,7 +971,7 @@ class Some(Option[T]):
 
         Alias of `Some.expect`.
         """
-        return self.expect(msg, exc_cls=exc_cls)
+        return self._value
 
     def filter(self, predicate: t.Callable[[T], bool]) -> Option[T]:
         """Return `Nothing`, or an option determined by the predicate.
@@ -530,7 +985,7 @@ class Some(Option[T]):
         """
         if predicate(self._value):
             return self
-        return Nothing()
+        return NOTHING
 
     def is_nothing(self) -> bool:
         """Return whether the option is `Nothing`."""
@@ -542,7 +997,7 @@ class Some(Option[T]):
 
     def iter(self) -> t.Iterator[T]:
         """Return an iterator over the possibly contained value."""
-        return iter(self)
+        return iter((self._value,))
 
     def map(self, fn: t.Callable[[T], U]) -> Option[U]:
         """Apply `fn` to the contained value if any."""
@@ -558,6 +1013,10 @@ class Some(Option[T]):
         """Apply `fn` to contained value, or compute a default."""
         return fn(self._value)
 
+    def match(self, some: t.Callable[[T], U], nothing: t.Callable[[], U]) -> U:
+        """Call `some` with the contained value, or call `nothing`."""
+        return some(self._value)
+
     def ok_or(self, err: F) -> Result[T, F]:
         """Transform an option into a `Result`.
 
@@ -588,18 +1047,40 @@ class Some(Option[T]):
 
     def __iter__(self) -> t.Iterator[T]:
         """Iterate over the contained value if present."""
-        yield self._value
+        return iter((self._value,))
 
     def __eq__(self, other: t.Any) -> bool:
         """Options are equal if their values are equal."""
         if not isinstance(other, Some):
             return False
-        eq: bool = self._value == other.unwrap()
+        eq: bool = self._value == other._value
         return eq
 
     def __ne__(self, other: t.Any) -> bool:
         """Options are equal if their values are equal."""
-        return not self == other
+        if not isinstance(other, Some):
+            return True
+        ne: bool = not self._value == other._value
+        return ne
+
+    def __hash__(self) -> int:
+        """Return a hash consistent with equality."""
+        return hash(("Some", self._value))
+
+    def __copy__(self) -> "Some[T]":
+        """Return `self`, since options are immutable."""
+        return self
+
+    def __deepcopy__(self, memo: t.Dict[int, t.Any]) -> "Some[T]":
+        """Return `self` unless the wrapped value must be copied."""
+        value = deepcopy(self._value, memo)
+        if value is self._value:
+            return self
+        return self.__class__(value)
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        """Pickle as a call to the constructor."""
+        return (self.__class__, (self._value,))
 
     def __str__(self) -> str:
         """Represent the Some() as a string."""
@@ -607,38 +1088,51 @@ class Some(Option[T]):
 
     def __repr__(self) -> str:
         """Return a string representation of the Some()."""
-        return self.__str__()
+        return f"Some({repr(self._value)})"
 
 
 class Nothing(Option[T]):
     """A value that may be `Some` or `Nothing`."""
 
     __slots__ = ("_value",)
+    __match_args__ = ()
 
-    _instance = None
+    _value: None
 
-    def __init__(self, _: None = None) -> None:
-        """Create a Nothing()."""
-        if self._instance is None:
-            # The singleton is being instantiated the first time
-            # not sure why pylint things _value is not in __slots__
-            self._value = None  # pylint: disable=assigning-non-slot
+    # Each class's singleton, created as soon as the class is, so that
+    # constructing `Nothing()` is a single attribute lookup and there is no
+    # first-use race between threads
+    _instance: t.ClassVar["Nothing[t.Any]"]
 
     def __new__(cls, _: None = None) -> "Nothing[T]":
-        """Ensure we are a singleton."""
-        if cls._instance is None:
-            # Create the instance
-            inst = super().__new__(cls)
-            # And instantiate it
-            cls.__init__(inst)
-            # Then assign it to the class' _instance var, so no other
-            # instances can be created
-            cls._instance = inst
-        return t.cast("Nothing[T]", cls._instance)
+        """Return the singleton."""
+        return cls._instance
+
+    # Python calls `__init__()` after `__new__()`. Reusing object's, which
+    # is implemented in C and does nothing here, keeps that call cheap.
+    # Type checkers see a regular signature instead, since they cannot
+    # infer one from the assignment.
+    if t.TYPE_CHECKING:  # pragma: no cover
+
+        def __init__(self, _: None = None) -> None:
+            """Do nothing: the singleton is already initialized."""
+
+    else:
+        __init__ = object.__init__
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        """Give each subclass its own singleton."""
+        super().__init_subclass__(**kwargs)
+        _make_nothing(cls)
+
+    @classmethod
+    def of_const(cls, value: t.Any = None) -> Option[t.Any]:
+        """Return the `Nothing()` singleton."""
+        return cls._instance
 
     def and_(self, alternative: Option[U]) -> Option[U]:
         """Return `Nothing` if `self` is `Nothing`, or the `alternative`."""
-        return t.cast(Option[U], self)
+        return self  # type: ignore
 
     def or_(self, alternative: Option[T]) -> Option[T]:
         """Return option if it is `Some`, or the `alternative`."""
@@ -646,15 +1140,17 @@ class Nothing(Option[T]):
 
     def xor(self, alternative: Option[T]) -> Option[T]:
         """Return Some IFF exactly one of `self`, `alternative` is `Some`."""
-        return alternative if alternative.is_some() else self
+        if alternative is NOTHING or alternative.is_nothing():
+            return self
+        return alternative
 
     def and_then(self, fn: t.Callable[[T], Option[U]]) -> Option[U]:
         """Return `Nothing`, or call `fn` with the `Some` value."""
-        return t.cast(Option[U], self)
+        return self  # type: ignore
 
     def flatmap(self, fn: t.Callable[[T], Option[U]]) -> Option[U]:
         """Return `Nothing`, or call `fn` with the `Some` value."""
-        return t.cast(Option[U], self.and_then(fn))
+        return self  # type: ignore
 
     def or_else(self, fn: t.Callable[[], Option[T]]) -> Option[T]:
         """Return option if it is `Some`, or calculate an alternative."""
@@ -689,7 +1185,11 @@ class Nothing(Option[T]):
             "Use raise_if_nothing() or expect() instead",
             DeprecationWarning,
         )
-        return self.expect(msg, exc_cls=exc_cls)
+        raise exc_cls(msg)
+        # Hack: pylint will warn that you're assigning from a function
+        # that doesn't return if there isn't at least one return statement
+        # in a function
+        return self._value  # pylint: disable=unreachable
 
     def raise_if_nothing(
         self, msg: str, exc_cls: t.Type[Exception] = RuntimeError
@@ -701,7 +1201,11 @@ class Nothing(Option[T]):
 
         Alias of `Nothing.expect`.
         """
-        return self.expect(msg, exc_cls=exc_cls)
+        raise exc_cls(msg)
+        # Hack: pylint will warn that you're assigning from a function
+        # that doesn't return if there isn't at least one return statement
+        # in a function
+        return self._value  # pylint: disable=unreachable
 
     def filter(self, predicate: t.Callable[[T], bool]) -> Option[T]:
         """Return `Nothing`, or an option determined by the predicate.
@@ -725,11 +1229,11 @@ class Nothing(Option[T]):
 
     def iter(self) -> t.Iterator[T]:
         """Return an iterator over the possibly contained value."""
-        return iter(self)
+        return iter(())
 
     def map(self, fn: t.Callable[[T], U]) -> Option[U]:
         """Apply `fn` to the contained value if any."""
-        return t.cast(Option[U], self)
+        return self  # type: ignore
 
     def map_or(self, default: U, fn: t.Callable[[T], U]) -> U:
         """Apply `fn` to contained value, or return the default."""
@@ -741,6 +1245,10 @@ class Nothing(Option[T]):
         """Apply `fn` to contained value, or compute a default."""
         return default()
 
+    def match(self, some: t.Callable[[T], U], nothing: t.Callable[[], U]) -> U:
+        """Call `some` with the contained value, or call `nothing`."""
+        return nothing()
+
     def ok_or(self, err: F) -> Result[T, F]:
         """Transform an option into a `Result`.
 
@@ -775,18 +1283,38 @@ class Nothing(Option[T]):
 
     def __iter__(self) -> t.Iterator[T]:
         """Iterate over the contained value if present."""
-        _: t.Tuple[T, ...] = ()
-        yield from _
+        return iter(())
 
     def __eq__(self, other: t.Any) -> bool:
         """Options are equal if their values are equal."""
-        if not isinstance(other, Nothing):
-            return False
-        return True
+        return other is self or isinstance(other, Nothing)
 
     def __ne__(self, other: t.Any) -> bool:
         """Options are equal if their values are equal."""
-        return not self == other
+        return other is not self and not isinstance(other, Nothing)
+
+    def __hash__(self) -> int:
+        """Return a hash consistent with equality."""
+        return _NOTHING_HASH
+
+    def __copy__(self) -> "Nothing[T]":
+        """Return `self`, since Nothing() is a singleton."""
+        return self
+
+    def __deepcopy__(self, memo: t.Dict[int, t.Any]) -> "Nothing[T]":
+        """Return `self`, since Nothing() is a singleton."""
+        return self
+
+    def __reduce__(self) -> t.Union[str, t.Tuple[t.Any, ...]]:
+        """Pickle as a reference to the singleton, preserving its identity.
+
+        `Nothing()` is pickled by name, as the module's `NOTHING`, so
+        unpickling it calls nothing at all. Subclasses' singletons are
+        looked up on their class.
+        """
+        if self.__class__ is Nothing:
+            return "NOTHING"
+        return (getattr, (self.__class__, "_instance"))
 
     def __str__(self) -> str:
         """Return a string representation of Nothing()."""
@@ -794,4 +1322,129 @@ class Nothing(Option[T]):
 
     def __repr__(self) -> str:
         """Return a string representation of Nothing()."""
-        return self.__str__()
+        return "Nothing()"
+
+
+# Since instances are immutable, the wrapped value is set directly via the
+# slot descriptor, bypassing `__setattr__()`.
+_set_ok_value = Ok.__dict__["_value"].__set__
+_set_err_value = Err.__dict__["_value"].__set__
+_set_some_value = Some.__dict__["_value"].__set__
+_set_nothing_value = Nothing.__dict__["_value"].__set__
+
+# The public, read-only `value` is the slot's own descriptor under another
+# name, so reading it costs exactly as much as reading `_value`. Writes
+# are still rejected by `__setattr__()`.
+Ok.value = Ok.__dict__["_value"]  # type: ignore
+Err.value = Err.__dict__["_value"]  # type: ignore
+Some.value = Some.__dict__["_value"]  # type: ignore
+Nothing.value = Nothing.__dict__["_value"]  # type: ignore
+
+_NOTHING_HASH = hash(("Nothing",))
+
+
+def _make_nothing(cls: t.Type["Nothing[t.Any]"]) -> "Nothing[t.Any]":
+    """Create and store the singleton instance of a Nothing class."""
+    inst: Nothing[t.Any] = object.__new__(cls)
+    _set_nothing_value(inst, None)
+    cls._instance = inst
+    return inst
+
+
+# The `Nothing()` singleton. `Nothing()` always returns this instance, but
+# referring to it directly avoids even the cost of the call.
+NOTHING: "Nothing[t.Any]" = _make_nothing(Nothing)
+
+
+def _exception_group(msg: str, errors: t.Sequence[t.Any]) -> Exception:
+    """Return an ExceptionGroup of `errors`, which must be exceptions.
+
+    ExceptionGroup is builtin from Python 3.11. On earlier versions, the
+    `exceptiongroup` backport is used if it is installed.
+    """
+    group_cls: t.Type[Exception]
+    try:
+        group_cls = ExceptionGroup  # noqa: F821
+    except NameError:
+        try:
+            # pylint: disable=import-outside-toplevel
+            from exceptiongroup import ExceptionGroup as backport
+
+            group_cls = backport
+        except ImportError:
+            raise RuntimeError(
+                "ExceptionGroup requires Python 3.11+ or the exceptiongroup "
+                "package"
+            ) from None
+    group: Exception = group_cls(msg, errors)
+    return group
+
+
+# Interned instances used by `of_const()`, keyed by wrapper class and
+# then by `_const_key()` of the payload.
+_CONSTS: t.Dict[type, t.Dict[t.Hashable, t.Any]] = {
+    Ok: {},
+    Err: {},
+    Some: {},
+}
+
+_DEFAULT_CONSTS: t.Tuple[t.Hashable, ...] = (
+    None,
+    True,
+    False,
+    "",
+    b"",
+    (),
+    *range(-5, 257),
+)
+
+_SCALAR_CONSTS = frozenset((type(None), bool, int, str, bytes))
+_SIGNED_CONSTS = frozenset((float, complex))
+
+
+def _scalar_key(value: t.Any) -> t.Optional[t.Tuple[type, t.Hashable]]:
+    """Return the interning key of a scalar, or None if it is not one."""
+    cls = value.__class__
+    if cls in _SCALAR_CONSTS:
+        return (cls, value)
+    if cls in _SIGNED_CONSTS:
+        # `0.0 == -0.0`, but their reprs differ
+        return (cls, repr(value))
+    return None
+
+
+def _const_key(value: t.Any) -> t.Optional[t.Hashable]:
+    """Return the key under which `value` is interned.
+
+    The key holds the type of the value, or of each item of a flat tuple,
+    so that e.g. `1`, `1.0`, and `True`, or `(1,)` and `(True,)`, do not
+    share an instance. Return None if `value` may not be interned.
+    """
+    if value.__class__ is tuple:
+        keys = tuple(map(_scalar_key, value))
+        return None if None in keys else (tuple, keys)
+    return _scalar_key(value)
+
+
+def intern_consts(*values: t.Hashable) -> None:
+    """Preconstruct shared `Ok`, `Err`, and `Some` instances for `values`.
+
+    Once interned, `Ok.of_const(value)`, `Err.of_const(value)`, and
+    `Some.of_const(value)` return the same instance on every call rather
+    than allocating a new one. None, booleans, integers from -5 to 256,
+    and empty strings, bytes, and tuples are interned by default.
+
+    Only None, booleans, numbers, strings, bytes, and flat tuples of them
+    may be interned; any other value raises a `TypeError`.
+    """
+    keys = tuple(map(_const_key, values))
+    for value, key in zip(values, keys):
+        if key is None:
+            raise TypeError(f"Cannot intern {value!r}")
+    for value, key in zip(values, keys):
+        for cls, cache in _CONSTS.items():
+            if key not in cache:
+                cache[key] = cls(value)
+
+
+intern_consts(*_DEFAULT_CONSTS)
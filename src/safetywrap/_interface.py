@@ -3,7 +3,10 @@
 import typing as t
 
 if t.TYPE_CHECKING:
-    from ._impl import Option, Result  # pylint: disable=unused-import
+    # pylint: disable=unused-import
+    from concurrent.futures import Executor, Future
+    from ._async import AsyncResult
+    from ._impl import Option, Result
 
 # pylint: disable=invalid-name
 
@@ -49,6 +52,67 @@ class _Result(t.Generic[T, E]):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def of_async(
+        fn: t.Callable[..., t.Awaitable[T]],
+        *args: t.Any,
+        catch: t.Type[ExcType] = Exception,  # type: ignore
+        **kwargs: t.Any
+    ) -> "AsyncResult[T, ExcType]":
+        """Await `fn(*args, **kwargs)` and wrap its result in an `Ok()`.
+
+        Return an `AsyncResult`, which resolves to `Ok(value)`, or to
+        `Err(exception)` if an exception of type `catch` is raised.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def of_in_thread(
+        fn: t.Callable[..., T],
+        *args: t.Any,
+        catch: t.Type[ExcType] = Exception,  # type: ignore
+        **kwargs: t.Any
+    ) -> "AsyncResult[T, ExcType]":
+        """Call blocking `fn` in a thread and wrap its result in an `Ok()`.
+
+        Return an `AsyncResult`, which resolves to `Ok(value)`, or to
+        `Err(exception)` if an exception of type `catch` is raised.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def from_future(
+        fut: "Future[T]",
+        timeout: t.Optional[float] = None,
+        *,
+        catch: t.Type[ExcType] = Exception,  # type: ignore
+    ) -> "Result[T, ExcType]":
+        """Wait for a `concurrent.futures.Future`, wrapping its outcome.
+
+        Return `Ok(value)`, or `Err(exception)` if the future raised an
+        exception of type `catch`.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def gather(
+        *awaitables: t.Awaitable["Result[t.Any, t.Any]"],
+        mode: str = "short_circuit",
+    ) -> t.Coroutine[t.Any, t.Any, "Result[t.Any, t.Any]"]:
+        """Run awaitables of Results concurrently, combining their Results.
+
+        Each awaitable is run as a Task. With the default `mode`,
+        "short_circuit", return `Ok` of every value in order, or the first
+        Err to finish, cancelling the remaining Tasks. With "collect_all",
+        wait for every Task, and return as `Result.collect_all()` does.
+        With "first_ok", return the first Ok to finish, cancelling the
+        remaining Tasks, or Err of every error in order.
+
+        No Tasks outlive the call: if it returns early, raises, or is
+        cancelled, all unfinished Tasks are cancelled and waited for.
+        """
+        raise NotImplementedError
+
     @staticmethod
     def collect(
         iterable: t.Iterable["Result[U, F]"],
@@ -62,6 +126,83 @@ class _Result(t.Generic[T, E]):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def collect_parallel(
+        fn: t.Callable[[t.Any], t.Union["Result[U, F]", U]],
+        iterable: t.Iterable[t.Any],
+        *,
+        executor: t.Optional["Executor"] = None,
+        max_workers: t.Optional[int] = None,
+        window: t.Optional[int] = None,
+        catch: t.Type[ExcType] = Exception,  # type: ignore
+    ) -> "Result[t.Tuple[U, ...], t.Union[F, ExcType]]":
+        """Apply `fn` to each item in a pool, collecting the Results.
+
+        Return what `Result.collect()` would for the Results in order,
+        stopping work once an Err is found.
+        """
+        raise NotImplementedError
+
+    @t.overload
+    @staticmethod
+    def collect_all(
+        iterable: t.Iterable["Result[U, F]"],
+        *,
+        max_errors: t.Optional[int] = None,
+        group: None = None,
+    ) -> "Result[t.Tuple[U, ...], t.Tuple[F, ...]]":
+        ...  # pragma: no cover
+
+    @t.overload
+    @staticmethod
+    def collect_all(
+        iterable: t.Iterable["Result[U, F]"],
+        *,
+        max_errors: t.Optional[int] = None,
+        group: str,
+    ) -> "Result[t.Tuple[U, ...], Exception]":
+        ...  # pragma: no cover
+
+    @staticmethod
+    def collect_all(
+        iterable: t.Iterable["Result[U, F]"],
+        *,
+        max_errors: t.Optional[int] = None,
+        group: t.Optional[str] = None,
+    ) -> "Result[t.Tuple[U, ...], t.Any]":
+        """Convert an iterable of Results into a Result of every value.
+
+        Unlike `collect()`, do not stop at the first Err. If all items are
+        Ok, return Ok of a tuple of their values. Otherwise, return Err of
+        a tuple of every error, in order. If `max_errors` is given, stop
+        once that many errors have been found. If `group` is given, the
+        errors must be exceptions, and are returned as an ExceptionGroup
+        with `group` as its message.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def partition(
+        iterable: t.Iterable["Result[U, F]"],
+    ) -> t.Tuple[t.Tuple[U, ...], t.Tuple[F, ...]]:
+        """Split an iterable of Results into its Ok and Err values.
+
+        Return a tuple of `(ok_values, err_values)`, each in their
+        original order.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def partition_indexed(
+        iterable: t.Iterable["Result[U, F]"],
+    ) -> t.Tuple[t.Tuple[t.Tuple[int, U], ...], t.Tuple[t.Tuple[int, F], ...]]:
+        """Split an iterable of Results, keeping each value's index.
+
+        Like `partition()`, but each value is an `(index, value)` pair,
+        where `index` is the Result's position in the iterable.
+        """
+        raise NotImplementedError
+
     @staticmethod
     def err_if(predicate: t.Callable[[U], bool], value: U) -> "Result[U, U]":
         """Return Err(val) if predicate(val) is True, otherwise Ok(val)."""
@@ -72,6 +213,16 @@ class _Result(t.Generic[T, E]):
         """Return Ok(val) if predicate(val) is True, otherwise Err(val)."""
         raise NotImplementedError
 
+    @classmethod
+    def of_const(cls, value: U) -> "Result[t.Any, t.Any]":
+        """Return a shared, preconstructed instance wrapping `value`.
+
+        Call on a concrete type, e.g. `Ok.of_const(None)`. Only interned
+        constants are shared; see `safetywrap.intern_consts()`. Any other
+        value is wrapped in a new instance.
+        """
+        raise NotImplementedError
+
     # ------------------------------------------------------------------
     # Methods
     # ------------------------------------------------------------------
@@ -172,6 +323,10 @@ class _Result(t.Generic[T, E]):
         """Map a function onto an error, or ignore a success."""
         raise NotImplementedError
 
+    def match(self, ok: t.Callable[[T], U], err: t.Callable[[E], U]) -> U:
+        """Call `ok` with the `Ok` value or `err` with the `Err` value."""
+        raise NotImplementedError
+
     def unwrap(self) -> T:
         """Return an Ok result, or throw an error if an Err."""
         raise NotImplementedError
@@ -188,6 +343,17 @@ class _Result(t.Generic[T, E]):
         """Return the `Ok` value, or the return from `fn`."""
         raise NotImplementedError
 
+    @property
+    def value(self) -> t.Union[T, E]:
+        """The wrapped value, whether `Ok` or `Err`. Read-only.
+
+        Reading `value` is as fast as attribute access gets, with no
+        method call involved, which can matter in very hot loops. Prefer
+        `unwrap()` and friends elsewhere, since they check which variant
+        you have.
+        """
+        raise NotImplementedError
+
     def __iter__(self) -> t.Iterator[T]:
         """Return a one-item iterator whose sole member is the result if `Ok`.
 
@@ -233,6 +399,17 @@ class _Option(t.Generic[T]):
         """Construct an _Option[T] from an Optional[T]."""
         raise NotImplementedError
 
+    @staticmethod
+    def from_future(
+        fut: "Future[T]", timeout: t.Optional[float] = None
+    ) -> "Option[T]":
+        """Wait for a `concurrent.futures.Future`, without raising on timeout.
+
+        Return `Some(value)` if the future finishes within `timeout`
+        seconds, or `Nothing()` if it does not.
+        """
+        raise NotImplementedError
+
     @staticmethod
     def nothing_if(predicate: t.Callable[[U], bool], value: U) -> "Option[U]":
         """Return Nothing() if predicate(val) is True, else Some(val)."""
@@ -252,6 +429,39 @@ class _Option(t.Generic[T]):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def partition(
+        options: t.Iterable["Option[T]"],
+    ) -> t.Tuple[t.Tuple[T, ...], int]:
+        """Split an iterable of Options into its Some values and Nothings.
+
+        Return a tuple of `(some_values, nothing_count)`, with the values
+        in their original order.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def partition_indexed(
+        options: t.Iterable["Option[T]"],
+    ) -> t.Tuple[t.Tuple[t.Tuple[int, T], ...], t.Tuple[int, ...]]:
+        """Split an iterable of Options, keeping each item's index.
+
+        Return a tuple of `(some_pairs, nothing_indices)`, where each of
+        `some_pairs` is an `(index, value)` pair, and `index` is always
+        the Option's position in the iterable.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def of_const(cls, value: U) -> "Option[U]":
+        """Return a shared, preconstructed instance wrapping `value`.
+
+        Call on a concrete type, e.g. `Some.of_const(0)`. Only interned
+        constants are shared; see `safetywrap.intern_consts()`. Any other
+        value is wrapped in a new instance.
+        """
+        raise NotImplementedError
+
     # ------------------------------------------------------------------
     # Methods
     # ------------------------------------------------------------------
@@ -352,6 +562,10 @@ class _Option(t.Generic[T]):
         """Apply `fn` to contained value, or compute a default."""
         raise NotImplementedError
 
+    def match(self, some: t.Callable[[T], U], nothing: t.Callable[[], U]) -> U:
+        """Call `some` with the contained value, or call `nothing`."""
+        raise NotImplementedError
+
     def ok_or(self, err: F) -> "Result[T, F]":
         """Transform an option into a `Result`.
 
@@ -378,6 +592,17 @@ class _Option(t.Generic[T]):
         """Return the contained value or calculate a default."""
         raise NotImplementedError
 
+    @property
+    def value(self) -> t.Optional[T]:
+        """The wrapped value if `Some`, or None if `Nothing`. Read-only.
+
+        Reading `value` is as fast as attribute access gets, with no
+        method call involved, which can matter in very hot loops. Prefer
+        `unwrap()` and friends elsewhere, since they check which variant
+        you have.
+        """
+        raise NotImplementedError
+
     def __iter__(self) -> t.Iterator[T]:
         """Iterate over the contained value if present."""
         raise NotImplementedError
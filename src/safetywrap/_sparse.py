@@ -0,0 +1,249 @@
+"""A sparse vector of Options, storing only the Some entries."""
+
+import operator
+import typing as t
+from heapq import merge as merge_sorted
+
+from ._impl import NOTHING, Option, Some
+
+
+T = t.TypeVar("T", covariant=True)
+U = t.TypeVar("U")
+
+
+class SparseOptionVector(t.Generic[T]):
+    """A fixed-length vector of Options, storing only its `Some` entries.
+
+    Entries are kept in a dict from index to value, held in ascending
+    index order, so that lookups are O(1) and iterating over the present
+    entries is already sorted. Absent indices are `Nothing()`.
+
+    Vectors are immutable: every operation returns a new vector.
+
+    Example:
+    ```py
+
+    >>> vec = SparseOptionVector(5, {3: "c", 0: "a"})
+    >>> vec[0], vec[1]
+    (Some('a'), Nothing())
+    >>> list(vec.items())
+    [(0, 'a'), (3, 'c')]
+    >>> vec.to_options()
+    [Some('a'), Nothing(), Nothing(), Some('c'), Nothing()]
+
+    ```
+    """
+
+    __slots__ = ("_length", "_entries")
+
+    def __init__(
+        self,
+        length: int,
+        entries: t.Union[t.Mapping[int, T], t.Iterable[t.Tuple[int, T]]] = (),
+    ) -> None:
+        """Create a vector of `length` slots, with `Some` at `entries`.
+
+        `entries` may be a mapping or an iterable of `(index, value)`
+        pairs, in any order. Negative indices count from the end. Giving
+        the same slot twice, e.g. as both `-1` and `length - 1`, raises a
+        `ValueError`.
+        """
+        if length < 0:
+            raise ValueError("length must not be negative")
+        pairs = entries.items() if isinstance(entries, t.Mapping) else entries
+        normalized: t.Dict[int, T] = {}
+        for idx, val in pairs:
+            slot = _normalize(idx, length)
+            if slot in normalized:
+                raise ValueError(f"Duplicate entry for index {slot}")
+            normalized[slot] = val
+        keys = list(normalized)
+        if any(map(operator.gt, keys, keys[1:])):
+            normalized = {idx: normalized[idx] for idx in sorted(keys)}
+        self._length = length
+        self._entries = normalized
+
+    @classmethod
+    def _from_sorted(
+        cls, length: int, entries: t.Dict[int, U]
+    ) -> "SparseOptionVector[U]":
+        """Create a vector from an index-ordered dict, without copying."""
+        # `cls` is generic in the vector's own type, not in `U`
+        vec: SparseOptionVector[U] = cls.__new__(cls)  # type: ignore
+        vec._length = length
+        vec._entries = entries
+        return vec
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_options(
+        cls, options: t.Iterable[Option[U]]
+    ) -> "SparseOptionVector[U]":
+        """Create a vector from a dense iterable of Options."""
+        entries: t.Dict[int, U] = {}
+        length = 0
+        for length, option in enumerate(options, 1):
+            if option.__class__ is Some or isinstance(option, Some):
+                entries[length - 1] = option.value  # type: ignore
+        return cls._from_sorted(length, entries)
+
+    @classmethod
+    def of(cls, values: t.Iterable[t.Optional[U]]) -> "SparseOptionVector[U]":
+        """Create a vector from a dense iterable, where None is `Nothing()`.
+
+        The vector version of `Option.of()`.
+        """
+        entries: t.Dict[int, U] = {}
+        length = 0
+        for length, val in enumerate(values, 1):
+            if val is not None:
+                entries[length - 1] = val
+        return cls._from_sorted(length, entries)
+
+    # ------------------------------------------------------------------
+    # Methods
+    # ------------------------------------------------------------------
+
+    def collect(self) -> Option[t.Tuple[T, ...]]:
+        """Return `Some` of all values, or `Nothing()` if any are `Nothing`.
+
+        Equivalent to `Option.collect()` on the dense vector.
+        """
+        if len(self._entries) < self._length:
+            return NOTHING
+        return Some(tuple(self._entries.values()))
+
+    def count_some(self) -> int:
+        """Return the number of `Some` entries."""
+        return len(self._entries)
+
+    def filter(
+        self, predicate: t.Callable[[T], bool]
+    ) -> "SparseOptionVector[T]":
+        """Drop every entry for which `predicate` is False."""
+        return self._from_sorted(
+            self._length,
+            {idx: val for idx, val in self._entries.items() if predicate(val)},
+        )
+
+    def get(self, idx: int) -> Option[T]:
+        """Return the entry at `idx`, or `Nothing()`.
+
+        Unlike `vec[idx]`, indices outside the vector return `Nothing()`
+        rather than raising an `IndexError`. Negative indices are not
+        treated specially.
+        """
+        if idx in self._entries:
+            return Some(self._entries[idx])
+        return NOTHING
+
+    def indices(self) -> t.KeysView[int]:
+        """Return the indices of the `Some` entries, in ascending order."""
+        return self._entries.keys()
+
+    def items(self) -> t.ItemsView[int, T]:
+        """Return `(index, value)` pairs for the `Some` entries, in order."""
+        return self._entries.items()
+
+    def map(self, fn: t.Callable[[T], U]) -> "SparseOptionVector[U]":
+        """Apply `fn` to every `Some` value."""
+        return self._from_sorted(
+            self._length,
+            {idx: fn(val) for idx, val in self._entries.items()},
+        )
+
+    def merge(
+        self,
+        other: "SparseOptionVector[T]",
+        combine: t.Optional[t.Callable[[T, T], T]] = None,
+    ) -> "SparseOptionVector[T]":
+        """Combine the entries of two vectors of the same length.
+
+        An index present in either vector is present in the result. Where
+        both vectors have an entry, the result is `combine(ours, theirs)`
+        if `combine` is given, or else our entry, as in `Option.or_()`.
+        """
+        if self._length != other._length:
+            raise ValueError(
+                f"Cannot merge vectors of length {self._length} "
+                f"and {other._length}"
+            )
+        ours = self._entries
+        theirs = other._entries
+        entries = {}
+        for idx in merge_sorted(ours, theirs):
+            if idx in entries:
+                # Present in both; the first occurrence came from either
+                if combine is not None:
+                    entries[idx] = combine(ours[idx], theirs[idx])
+                else:
+                    entries[idx] = ours[idx]
+            else:
+                entries[idx] = ours[idx] if idx in ours else theirs[idx]
+        return self._from_sorted(self._length, entries)
+
+    def to_options(self) -> t.List[Option[T]]:
+        """Return a dense list of Options."""
+        return list(self)
+
+    def values(self) -> t.ValuesView[T]:
+        """Return the values of the `Some` entries, in index order."""
+        return self._entries.values()
+
+    def __len__(self) -> int:
+        """Return the length of the vector, including `Nothing` entries."""
+        return self._length
+
+    def __iter__(self) -> t.Iterator[Option[T]]:
+        """Iterate densely over every slot, as `Some` and `Nothing`."""
+        nothing: Option[T] = NOTHING
+        last = -1
+        for idx, val in self._entries.items():
+            for _ in range(idx - last - 1):
+                yield nothing
+            yield Some(val)
+            last = idx
+        for _ in range(self._length - last - 1):
+            yield nothing
+
+    def __getitem__(self, idx: int) -> Option[T]:
+        """Return the entry at `idx` as a `Some`, or `Nothing()`."""
+        idx = _normalize(idx, self._length)
+        if idx in self._entries:
+            return Some(self._entries[idx])
+        return NOTHING
+
+    def __eq__(self, other: t.Any) -> bool:
+        """Vectors are equal if their lengths and entries are equal."""
+        if not isinstance(other, SparseOptionVector):
+            return False
+        eq: bool = (
+            self._length == other._length and self._entries == other._entries
+        )
+        return eq
+
+    def __ne__(self, other: t.Any) -> bool:
+        """Vectors are equal if their lengths and entries are equal."""
+        return not self == other
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        """Pickle as the length and entries, which are already in order."""
+        return (self._from_sorted, (self._length, self._entries))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the vector."""
+        return f"{self.__class__.__name__}({self._length}, {self._entries!r})"
+
+
+def _normalize(idx: int, length: int) -> int:
+    """Return `idx` as a non-negative index, or raise an IndexError."""
+    # Accept any integer-like index, such as a NumPy integer, as an int
+    idx = operator.index(idx)
+    if idx < 0:
+        idx += length
+    if not 0 <= idx < length:
+        raise IndexError("SparseOptionVector index out of range")
+    return idx
@@ -0,0 +1,368 @@
+"""Numeric Results and Options as Arrow-style buffers.
+
+A `ResultBuffers` or `OptionBuffers` holds its items in flat, fixed-width
+buffers, as Apache Arrow does for a primitive array:
+
+- a validity bitmap of one bit per item, least significant bit first, set
+  for `Ok` or `Some`. Bits past the last item are 0.
+- a typed buffer of values, which are 0 where not valid
+- for Results, a typed buffer of error codes, which are 0 for `Ok` items
+
+Types are given as `array` module typecodes, such as "d" for floats or "q"
+for 64-bit integers. Each buffer is exposed as a read-only `memoryview`,
+so columnar consumers may read it without copying or unwrapping items one
+at a time, e.g. with `numpy.frombuffer()` or `pyarrow.py_buffer()`.
+Conversely, `from_buffers()` wraps existing buffers without copying them.
+
+Neither NumPy nor pyarrow is required.
+"""
+
+import typing as t
+
+from ._batch import OptionBatch, ResultBatch
+from ._columns import cast, readonly, readonly_copy, split_options
+from ._columns import split_results
+from ._impl import NOTHING, Err, Ok, Option, Result, Some
+
+
+__all__ = ("OptionBuffers", "ResultBuffers", "pack_bitmap", "unpack_bitmap")
+
+T = t.TypeVar("T", covariant=True)
+E = t.TypeVar("E", covariant=True)
+
+# Tag bytes to and from the digits of a binary string
+_TAGS_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_DIGITS_TO_TAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def pack_bitmap(tags: bytes) -> bytes:
+    r"""Pack a tag byte per item into a bitmap, least significant bit first.
+
+    Example:
+    ```py
+
+    >>> pack_bitmap(bytes([1, 0, 1, 1, 0, 0, 0, 0, 1]))
+    b'\r\x01'
+
+    ```
+    """
+    if not tags:
+        return b""
+    # The first item is the last, least significant, digit
+    bits = int(tags.translate(_TAGS_TO_DIGITS)[::-1], 2)
+    return bits.to_bytes((len(tags) + 7) // 8, "little")
+
+
+def unpack_bitmap(bitmap: t.Any, length: int) -> bytes:
+    """Unpack the first `length` bits of a bitmap into a tag byte per item.
+
+    The inverse of `pack_bitmap()`. Bits past `length` are ignored.
+    """
+    if not length:
+        return b""
+    bits = int.from_bytes(bitmap, "little") & ((1 << length) - 1)
+    digits = format(bits, f"0{length}b").encode()
+    return digits[::-1].translate(_DIGITS_TO_TAGS)
+
+
+def _typed(buf: t.Any, typecode: str, length: int, what: str) -> memoryview:
+    """Return a read-only view of the first `length` typed items of `buf`."""
+    view = cast(buf, typecode)
+    if len(view) < length:
+        raise ValueError(
+            f"{what} buffer holds {len(view)} items, expected {length}"
+        )
+    return readonly(view[:length])
+
+
+class _Buffers:
+    """The buffers common to both kinds of item."""
+
+    __slots__ = ("_length", "_validity", "_values", "_errors")
+
+    _length: int
+    _validity: memoryview
+    # Typed views, whose items are ints or floats
+    _values: "memoryview[t.Any]"
+    _errors: "t.Optional[memoryview[t.Any]]"
+
+    def __init__(self) -> None:
+        """Buffers are created with their constructors."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} may not be instantiated directly. "
+            "Please use one of its constructors instead."
+        )
+
+    @classmethod
+    def _create(
+        cls,
+        length: int,
+        validity: t.Any,
+        values: memoryview,
+        errors: t.Optional[memoryview],
+    ) -> t.Any:
+        """Create an instance directly from its buffers."""
+        if validity is None:
+            validity = pack_bitmap(b"\x01" * length)
+        bitmap = memoryview(validity).cast("B")
+        if len(bitmap) * 8 < length:
+            raise ValueError(
+                f"validity bitmap holds {len(bitmap) * 8} bits, "
+                f"expected {length}"
+            )
+        size = (length + 7) // 8
+        bitmap = bitmap[:size]
+        # Bits past the last item are cleared, copying the bitmap only if
+        # any are set
+        tail = length & 7
+        if tail and bitmap[-1] >> tail:
+            masked = bytearray(bitmap)
+            masked[-1] &= (1 << tail) - 1
+            bitmap = memoryview(masked)
+        buffers = object.__new__(cls)
+        buffers._length = length
+        buffers._validity = readonly(bitmap)
+        buffers._values = values
+        buffers._errors = errors
+        return buffers
+
+    @property
+    def validity(self) -> memoryview:
+        """The validity bitmap, with a bit set for each `Ok` or `Some`."""
+        return self._validity
+
+    @property
+    def values(self) -> "memoryview[t.Any]":
+        """A typed view of the values, which are 0 where not valid."""
+        return self._values
+
+    def tags(self) -> bytes:
+        """Return the validity of each item as a byte, 1 if valid."""
+        return unpack_bitmap(self._validity, self._length)
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return self._length
+
+    def _is_valid(self, idx: int) -> int:
+        """Return the validity bit of the item at `idx`."""
+        if idx < 0:
+            idx += self._length
+        if not 0 <= idx < self._length:
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+        return (self._validity[idx >> 3] >> (idx & 7)) & 1
+
+    def _copies(self) -> t.Tuple[int, bytes, bytes]:
+        """Return the length, and copies of the validity and values."""
+        return (
+            self._length,
+            self._validity.tobytes(),
+            self._values.tobytes(),
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the buffers."""
+        return (
+            f"{self.__class__.__name__}(length={self._length}, "
+            f"value_type={self._values.format!r})"
+        )
+
+
+class ResultBuffers(_Buffers, t.Generic[T, E]):
+    r"""Numeric Results, as a validity bitmap, values, and error codes.
+
+    Example:
+    ```py
+
+    >>> buffers = ResultBuffers.from_results([Ok(1.5), Err(404), Ok(2.0)])
+    >>> bytes(buffers.validity)
+    b'\x05'
+    >>> buffers.values.tolist()
+    [1.5, 0.0, 2.0]
+    >>> buffers.errors.tolist()
+    [0, 404, 0]
+    >>> list(buffers)
+    [Ok(1.5), Err(404), Ok(2.0)]
+
+    ```
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_results(
+        cls,
+        results: t.Iterable[Result[t.Any, t.Any]],
+        value_type: str = "d",
+        error_type: str = "q",
+    ) -> "ResultBuffers[t.Any, t.Any]":
+        """Pack Results, or a `ResultBatch`, into new buffers.
+
+        `value_type` and `error_type` are the `array` typecodes of the
+        values of `Ok` and `Err` items, respectively.
+        """
+        tags, values, errors = split_results(results, value_type, error_type)
+        return cls._create(  # type: ignore
+            len(tags),
+            pack_bitmap(tags),
+            readonly_copy(values),
+            readonly_copy(errors),
+        )
+
+    @classmethod
+    def from_buffers(
+        cls,
+        length: int,
+        validity: t.Any,
+        values: t.Any,
+        errors: t.Any,
+        value_type: str = "d",
+        error_type: str = "q",
+    ) -> "ResultBuffers[t.Any, t.Any]":
+        """Wrap existing buffers of `length` Results, without copying them.
+
+        The buffers may be any objects supporting the buffer protocol, such
+        as `bytes`, `array.array`, or NumPy arrays, and are read as
+        `value_type` and `error_type` items, respectively. As in Arrow,
+        a `validity` of None means every item is `Ok`. The buffers must
+        not be modified while in use. `validity` is copied only if bits
+        past the last item are set, to clear them.
+        """
+        return cls._create(  # type: ignore
+            length,
+            validity,
+            _typed(values, value_type, length, "values"),
+            _typed(errors, error_type, length, "errors"),
+        )
+
+    @property
+    def errors(self) -> "memoryview[t.Any]":
+        """A typed view of the error codes, which are 0 for `Ok` items."""
+        return self._errors  # type: ignore
+
+    def to_batch(self) -> "ResultBatch[T, E]":
+        """Return the items as a `ResultBatch`."""
+        tags = self.tags()
+        values = [
+            val if ok else err
+            for ok, val, err in zip(tags, self._values, self.errors)
+        ]
+        return ResultBatch._from_columns(tags, values)
+
+    def __iter__(self) -> t.Iterator[Result[T, E]]:
+        """Iterate over the items as Results."""
+        for ok, val, err in zip(self.tags(), self._values, self.errors):
+            yield Ok(val) if ok else Err(err)
+
+    def __getitem__(self, idx: int) -> Result[T, E]:
+        """Return the item at `idx` as a Result."""
+        if self._is_valid(idx):
+            return Ok(self._values[idx])
+        return Err(self.errors[idx])
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        """Pickle as copies of the buffers."""
+        errors = self.errors
+        args = self._copies() + (
+            errors.tobytes(),
+            self._values.format,
+            errors.format,
+        )
+        return (self.__class__.from_buffers, args)
+
+    def __eq__(self, other: t.Any) -> bool:
+        """Buffers are equal if their items are equal."""
+        if not isinstance(other, ResultBuffers):
+            return False
+        return list(self) == list(other)
+
+    def __ne__(self, other: t.Any) -> bool:
+        """Buffers are equal if their items are equal."""
+        return not self == other
+
+
+class OptionBuffers(_Buffers, t.Generic[T]):
+    r"""Numeric Options, as a validity bitmap and values.
+
+    Example:
+    ```py
+
+    >>> buffers = OptionBuffers.from_options([Some(2), NOTHING], "q")
+    >>> bytes(buffers.validity), buffers.values.tolist()
+    (b'\x01', [2, 0])
+    >>> list(buffers)
+    [Some(2), Nothing()]
+
+    ```
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_options(
+        cls, options: t.Iterable[Option[t.Any]], value_type: str = "d"
+    ) -> "OptionBuffers[t.Any]":
+        """Pack Options, or an `OptionBatch`, into new buffers.
+
+        `value_type` is the `array` typecode of the values of `Some`
+        items.
+        """
+        tags, values = split_options(options, value_type)
+        return cls._create(  # type: ignore
+            len(tags), pack_bitmap(tags), readonly_copy(values), None
+        )
+
+    @classmethod
+    def from_buffers(
+        cls,
+        length: int,
+        validity: t.Any,
+        values: t.Any,
+        value_type: str = "d",
+    ) -> "OptionBuffers[t.Any]":
+        """Wrap existing buffers of `length` Options, without copying them.
+
+        The buffers may be any objects supporting the buffer protocol, and
+        `values` is read as `value_type` items. As in Arrow, a `validity`
+        of None means every item is `Some`. The buffers must not be
+        modified while in use. `validity` is copied only if bits past the
+        last item are set, to clear them.
+        """
+        return cls._create(  # type: ignore
+            length, validity, _typed(values, value_type, length, "values"), None
+        )
+
+    def to_batch(self) -> "OptionBatch[T]":
+        """Return the items as an `OptionBatch`."""
+        tags = self.tags()
+        values = [
+            val if ok else None for ok, val in zip(tags, self._values)
+        ]
+        return OptionBatch._from_columns(tags, values)
+
+    def __iter__(self) -> t.Iterator[Option[T]]:
+        """Iterate over the items as Options."""
+        nothing: Option[T] = NOTHING
+        for ok, val in zip(self.tags(), self._values):
+            yield Some(val) if ok else nothing
+
+    def __getitem__(self, idx: int) -> Option[T]:
+        """Return the item at `idx` as an Option."""
+        if self._is_valid(idx):
+            return Some(self._values[idx])
+        return NOTHING
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        """Pickle as copies of the buffers."""
+        args = self._copies() + (self._values.format,)
+        return (self.__class__.from_buffers, args)
+
+    def __eq__(self, other: t.Any) -> bool:
+        """Buffers are equal if their items are equal."""
+        if not isinstance(other, OptionBuffers):
+            return False
+        return list(self) == list(other)
+
+    def __ne__(self, other: t.Any) -> bool:
+        """Buffers are equal if their items are equal."""
+        return not self == other
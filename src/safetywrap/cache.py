@@ -0,0 +1,249 @@
+"""Memoize functions returning Results and Options.
+
+`functools.lru_cache()` treats every return value alike, so a function
+returning Results caches its Errs forever, and one returning Options
+can't expire its `Nothing()` misses sooner than its hits. The
+`result_cache()` decorator keeps separate policies for each outcome:
+
+- `Ok` and `Some` values, and any other return values, are cached for
+  `ttl` seconds
+- `Nothing()` is cached for `nothing_ttl` seconds
+- `Err` values are only cached if `cache_err` is True, for a time which
+  may depend on the type of the error
+
+Example:
+```py
+
+>>> from safetywrap import Option
+>>> calls = []
+>>> @result_cache(maxsize=2, nothing_ttl=60)
+... def lookup(key: str) -> Option[int]:
+...     calls.append(key)
+...     return Option.of({"a": 1}.get(key))
+>>> lookup("a"), lookup("b"), lookup("a"), lookup("b")
+(Some(1), Nothing(), Some(1), Nothing())
+>>> calls
+['a', 'b']
+>>> info = lookup.cache_info()
+>>> info.hits, info.misses, info.currsize
+(2, 2, 2)
+
+```
+"""
+
+import functools
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+
+from ._impl import Err, Nothing, Ok
+
+
+__all__ = ("ResultCacheInfo", "result_cache")
+
+F = t.TypeVar("F", bound=t.Callable[..., t.Any])
+
+_FOREVER = float("inf")
+
+# The smallest cache to sweep for expired entries
+_SWEEP_MIN = 128
+
+
+class ResultCacheInfo(t.NamedTuple):
+    """Statistics for a function decorated with `result_cache()`."""
+
+    hits: int
+    misses: int
+    maxsize: t.Optional[int]
+    currsize: int
+    evictions: int
+    expirations: int
+
+
+# Types whose instances are their own key when passed alone, as in
+# `functools.lru_cache()`
+_FAST_TYPES = frozenset((int, str))
+
+
+def _make_key(
+    args: t.Tuple[t.Any, ...], kwargs: t.Dict[str, t.Any], typed: bool
+) -> t.Hashable:
+    """Return a hashable key for a call's arguments."""
+    if not kwargs and not typed:
+        if len(args) == 1 and args[0].__class__ in _FAST_TYPES:
+            return args[0]
+        return args
+    key: t.Tuple[t.Any, ...] = args
+    if kwargs:
+        key += (_make_key,) + tuple(kwargs.items())
+    if typed:
+        key += tuple(type(arg) for arg in args)
+        if kwargs:
+            key += tuple(type(arg) for arg in kwargs.values())
+    return key
+
+
+def result_cache(
+    maxsize: t.Optional[int] = 128,
+    ttl: t.Optional[float] = None,
+    *,
+    cache_err: bool = False,
+    err_ttl: t.Optional[float] = None,
+    err_ttls: t.Optional[t.Mapping[type, float]] = None,
+    nothing_ttl: t.Optional[float] = None,
+    typed: bool = False,
+    timer: t.Callable[[], float] = time.monotonic,
+) -> t.Callable[[F], F]:
+    """Memoize a function returning Results or Options, by outcome.
+
+    Up to `maxsize` calls are cached, or any number if it is None, with
+    the least recently used evicted first. Times are in seconds.
+
+    - `ttl` is how long to keep `Ok` and `Some` values, and any other
+      return values, or forever if it is None.
+    - `nothing_ttl` is how long to keep `Nothing()`, by default `ttl`.
+    - `Err` values are only cached if `cache_err` is True, for `err_ttl`,
+      by default `ttl`. `err_ttls` maps error types to their own TTLs,
+      which take precedence, so that e.g. timeouts may be retried sooner
+      than other errors. The error value's type and its base classes are
+      looked up in order.
+
+    A TTL of 0 disables caching of that outcome. Expired entries are
+    discarded when next looked up, or when they are evicted. So that
+    they do not pile up, e.g. when `maxsize` is None, every expired entry
+    is also swept out whenever the cache has doubled in size since the
+    last sweep, which costs amortized constant time per insert.
+
+    As with `functools.lru_cache()`, arguments must be hashable, and if
+    `typed` is True, arguments of different types are cached separately.
+    The decorated function is thread-safe, though concurrent calls with
+    the same arguments may each call the function. It has
+    `cache_info()`, returning a `ResultCacheInfo`; `cache_clear()`; and
+    `cache_invalidate(*args, **kwargs)`, which discards the entry for the
+    given arguments, returning whether there was one.
+    """
+    if maxsize is not None and maxsize < 0:
+        maxsize = 0
+    ok_ttl = _FOREVER if ttl is None else ttl
+    default_err_ttl = ok_ttl if err_ttl is None else err_ttl
+    none_ttl = ok_ttl if nothing_ttl is None else nothing_ttl
+    type_ttls = dict(err_ttls or {})
+    # The timer need not be read at all if nothing expires
+    expiring = any(
+        val != _FOREVER
+        for val in (ok_ttl, none_ttl, *type_ttls.values())
+        + ((default_err_ttl,) if cache_err else ())
+    )
+
+    def _err_ttl(err: t.Any) -> float:
+        """Return how long to cache an Err of `err`."""
+        if not cache_err:
+            return 0
+        for cls in type(err).__mro__:
+            if cls in type_ttls:
+                return type_ttls[cls]
+        return default_err_ttl
+
+    def _ttl_of(value: t.Any) -> float:
+        """Return how long to cache a return value."""
+        cls = value.__class__
+        if cls is Ok:
+            return ok_ttl
+        if cls is not Err and isinstance(value, Nothing):
+            return none_ttl
+        if isinstance(value, Err):
+            return _err_ttl(value._value)
+        return ok_ttl
+
+    def decorator(fn: F) -> F:
+        # Maps keys to (value, expiry time), least recently used first
+        cache: "OrderedDict[t.Hashable, t.Tuple[t.Any, float]]" = (
+            OrderedDict()
+        )
+        lookup = cache.get
+        move_to_end = cache.move_to_end
+        lock = threading.Lock()
+        acquire = lock.acquire
+        release = lock.release
+        hits = misses = evictions = expirations = 0
+        sweep_at = _SWEEP_MIN
+
+        def _sweep(now: float) -> None:
+            """Discard every expired entry. The lock must be held."""
+            nonlocal expirations, sweep_at
+            expired = [key for key, entry in cache.items() if entry[1] <= now]
+            for key in expired:
+                del cache[key]
+            expirations += len(expired)
+            sweep_at = max(2 * len(cache), _SWEEP_MIN)
+
+        @functools.wraps(fn)
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            nonlocal hits, misses, evictions, expirations
+            # The common cases of `_make_key()`, inlined
+            if kwargs or typed:
+                key: t.Hashable = _make_key(args, kwargs, typed)
+            elif len(args) == 1 and args[0].__class__ in _FAST_TYPES:
+                key = args[0]
+            else:
+                key = args
+            now = timer() if expiring else 0.0
+            acquire()
+            try:
+                entry = lookup(key)
+                if entry is not None:
+                    if entry[1] > now:
+                        move_to_end(key)
+                        hits += 1
+                        return entry[0]
+                    del cache[key]
+                    expirations += 1
+                misses += 1
+            finally:
+                release()
+            value = fn(*args, **kwargs)
+            expiry = _ttl_of(value)
+            if expiry <= 0 or maxsize == 0:
+                return value
+            expiry += now
+            acquire()
+            try:
+                cache[key] = (value, expiry)
+                move_to_end(key)
+                if maxsize is not None and len(cache) > maxsize:
+                    cache.popitem(last=False)
+                    evictions += 1
+                elif expiring and len(cache) >= sweep_at:
+                    _sweep(now)
+            finally:
+                release()
+            return value
+
+        def cache_info() -> ResultCacheInfo:
+            """Return statistics for the cache."""
+            with lock:
+                return ResultCacheInfo(
+                    hits, misses, maxsize, len(cache), evictions, expirations
+                )
+
+        def cache_clear() -> None:
+            """Empty the cache, and reset its statistics."""
+            nonlocal hits, misses, evictions, expirations, sweep_at
+            with lock:
+                cache.clear()
+                hits = misses = evictions = expirations = 0
+                sweep_at = _SWEEP_MIN
+
+        def cache_invalidate(*args: t.Any, **kwargs: t.Any) -> bool:
+            """Discard the entry for the given arguments, if any."""
+            key = _make_key(args, kwargs, typed)
+            with lock:
+                return cache.pop(key, None) is not None
+
+        wrapper.cache_info = cache_info  # type: ignore
+        wrapper.cache_clear = cache_clear  # type: ignore
+        wrapper.cache_invalidate = cache_invalidate  # type: ignore
+        return wrapper  # type: ignore
+
+    return decorator
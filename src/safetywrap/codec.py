@@ -0,0 +1,214 @@
+"""Encode Results and Options as JSON, or as a stream of binary frames.
+
+In JSON, each Result or Option is an object with a single tagged key:
+`{"$ok": value}`, `{"$err": value}`, `{"$some": value}`, or
+`{"$nothing": null}`. `json_default()` and `json_object_hook()` plug this
+encoding into the `json` module's `default` and `object_hook` hooks, so
+Results may be nested anywhere in a document, and in each other. Plain
+dicts with a single key of `"$ok"`, `"$err"`, `"$some"`, or `"$nothing"`
+are indistinguishable from this encoding, and decode as Results or
+Options, so they do not round-trip.
+
+For streams, `write_json_lines()` and `read_json_lines()` write and read
+one JSON document per line, and `write_frames()` and `read_frames()` use
+a compact binary framing: a tag byte and a 4-byte little-endian payload
+length per item, followed by the payload, which is the wrapped value as
+JSON by default. Both read and write one item at a time, so streams of
+any length may be processed without loading them into memory.
+
+Example:
+```py
+
+>>> import json
+>>> text = json.dumps([Ok(1), Err("no"), Nothing()], default=json_default)
+>>> text
+'[{"$ok": 1}, {"$err": "no"}, {"$nothing": null}]'
+>>> json.loads(text, object_hook=json_object_hook)
+[Ok(1), Err('no'), Nothing()]
+
+```
+"""
+
+import json
+import struct
+import typing as t
+
+from ._impl import NOTHING, Err, Nothing, Ok, Option, Result, Some
+
+
+__all__ = (
+    "dumps",
+    "json_default",
+    "json_object_hook",
+    "loads",
+    "read_frames",
+    "read_json_lines",
+    "write_frames",
+    "write_json_lines",
+)
+
+Item = t.Union[Result[t.Any, t.Any], Option[t.Any]]
+
+# JSON keys, and binary frame tags, for each type
+_KEYS = {Ok: "$ok", Err: "$err", Some: "$some", Nothing: "$nothing"}
+_DECODERS: t.Dict[str, t.Callable[[t.Any], t.Any]] = {
+    "$ok": Ok,
+    "$err": Err,
+    "$some": Some,
+    "$nothing": lambda _: NOTHING,
+}
+_TAGS = {Err: 0, Ok: 1, Nothing: 2, Some: 3}
+
+# A frame's tag and payload length
+_FRAME = struct.Struct("<BI")
+
+
+def _type_of(obj: t.Any) -> t.Optional[type]:
+    """Return which of Ok, Err, Some, or Nothing `obj` is, if any."""
+    cls: type = obj.__class__
+    if cls in _TAGS:
+        return cls
+    for base in _TAGS:
+        if isinstance(obj, base):
+            return base
+    return None
+
+
+def json_default(obj: t.Any) -> t.Dict[str, t.Any]:
+    """Encode a Result or Option as JSON, for `json.dumps(default=...)`.
+
+    Any other object raises a `TypeError`, as `json.dumps()` does itself.
+    """
+    cls = _type_of(obj)
+    if cls is None:
+        raise TypeError(
+            f"Object of type {obj.__class__.__name__} is not JSON serializable"
+        )
+    return {_KEYS[cls]: obj.value}
+
+
+def json_object_hook(obj: t.Dict[str, t.Any]) -> t.Any:
+    """Decode a Result or Option from JSON, for `json.loads(object_hook=...)`.
+
+    Objects other than those produced by `json_default()` are returned
+    unchanged. The encoding is not escaped, so any object whose only key
+    is `"$ok"`, `"$err"`, `"$some"`, or `"$nothing"` is decoded as a
+    Result or Option, including a plain dict that was encoded with that
+    single key.
+    """
+    if len(obj) == 1:
+        for key, val in obj.items():
+            decode = _DECODERS.get(key)
+            if decode is not None:
+                return decode(val)
+    return obj
+
+
+# Compact encoding and decoding, with Results and Options
+_ENCODER = json.JSONEncoder(default=json_default, separators=(",", ":"))
+_DECODER = json.JSONDecoder(object_hook=json_object_hook)
+
+
+def dumps(obj: t.Any, **kwargs: t.Any) -> str:
+    """Serialize `obj`, which may contain Results and Options, to JSON."""
+    return json.dumps(obj, default=json_default, **kwargs)
+
+
+def loads(text: t.Union[str, bytes], **kwargs: t.Any) -> t.Any:
+    """Deserialize JSON, decoding any Results and Options."""
+    return json.loads(text, object_hook=json_object_hook, **kwargs)
+
+
+def write_json_lines(items: t.Iterable[t.Any], fp: t.TextIO) -> int:
+    """Write each item to a text file as a line of JSON.
+
+    Return the number of items written.
+    """
+    encode = _ENCODER.encode
+    write = fp.write
+    count = 0
+    for count, item in enumerate(items, 1):
+        write(encode(item) + "\n")
+    return count
+
+
+def read_json_lines(fp: t.Iterable[str]) -> t.Iterator[t.Any]:
+    """Lazily read items from a text file of JSON lines.
+
+    Blank lines are skipped.
+    """
+    decode = _DECODER.decode
+    for line in fp:
+        if line.strip():
+            yield decode(line)
+
+
+def _encode_json(val: t.Any) -> bytes:
+    """Encode a value as compact JSON."""
+    return _ENCODER.encode(val).encode()
+
+
+def _decode_json(data: bytes) -> t.Any:
+    """Decode a value from JSON."""
+    return _DECODER.decode(data.decode())
+
+
+def write_frames(
+    items: t.Iterable[Item],
+    fp: t.BinaryIO,
+    encode: t.Callable[[t.Any], bytes] = _encode_json,
+) -> int:
+    """Write Results and Options to a binary file as length-prefixed frames.
+
+    Each frame is a tag byte, the payload's length as a 4-byte
+    little-endian integer, and the payload, which is the wrapped value
+    encoded with `encode`, by default as JSON. `Nothing()` has no
+    payload. Return the number of items written.
+    """
+    pack = _FRAME.pack
+    write = fp.write
+    count = 0
+    for count, item in enumerate(items, 1):
+        cls = _type_of(item)
+        if cls is None:
+            raise TypeError(
+                f"Expected a Result or Option, not {item.__class__.__name__}"
+            )
+        payload = b"" if cls is Nothing else encode(item.value)
+        write(pack(_TAGS[cls], len(payload)) + payload)
+    return count
+
+
+def read_frames(
+    fp: t.BinaryIO,
+    decode: t.Callable[[bytes], t.Any] = _decode_json,
+) -> t.Iterator[Item]:
+    """Lazily read Results and Options from a binary file of frames.
+
+    The inverse of `write_frames()`, where `decode` is the inverse of
+    its `encode`. Raise a `ValueError` if the file ends partway through a
+    frame, or a frame's tag is invalid.
+    """
+    size = _FRAME.size
+    unpack = _FRAME.unpack
+    read = fp.read
+    while True:
+        header = read(size)
+        if not header:
+            return
+        if len(header) < size:
+            raise ValueError("Truncated frame header")
+        tag, length = unpack(header)
+        payload = read(length)
+        if len(payload) < length:
+            raise ValueError("Truncated frame payload")
+        if tag == 1:
+            yield Ok(decode(payload))
+        elif tag == 0:
+            yield Err(decode(payload))
+        elif tag == 3:
+            yield Some(decode(payload))
+        elif tag == 2:
+            yield NOTHING
+        else:
+            raise ValueError(f"Invalid frame tag: {tag}")
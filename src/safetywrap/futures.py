@@ -0,0 +1,25 @@
+"""Results from `concurrent.futures` futures and process pools.
+
+`as_completed_results()` yields the outcome of each future as a Result as
+soon as it finishes, and `process_map()` runs a fallible function over a
+stream of items in worker processes, returning a `ResultBatch` per chunk.
+
+Example:
+```py
+
+>>> from concurrent.futures import ThreadPoolExecutor
+>>> with ThreadPoolExecutor() as pool:
+...     futures = {val: pool.submit(int, val) for val in ("1", "x")}
+...     results = dict(as_completed_results(futures, catch=ValueError))
+>>> results["1"]
+Ok(1)
+>>> results["x"].is_err()
+True
+
+```
+"""
+
+from ._futures import ExceptionRecord, as_completed_results, process_map
+
+
+__all__ = ("as_completed_results", "process_map", "ExceptionRecord")
@@ -0,0 +1,392 @@
+"""Lazy adapters over iterables of Results and Options.
+
+Every function here consumes its input one item at a time and returns an
+iterator, so memory use does not grow with the length of the stream. This
+makes them suitable for unbounded streams, where `Result.collect()` and
+friends, which build a tuple of every value, are not.
+
+The functions prefixed with `a` are their asyncio counterparts, over sync
+or async iterables. `amap()` and `aand_then()` run up to `concurrency`
+calls at once, and read no further ahead in their input than that, so
+memory stays bounded however long the stream is.
+
+Example:
+```py
+
+>>> from safetywrap.iter import map_ok, oks
+>>> parsed = (Result.of(int, val) for val in ("1", "x", "3"))
+>>> list(oks(map_ok(lambda v: v * 10, parsed)))
+[10, 30]
+
+```
+"""
+
+import asyncio
+import typing as t
+from collections import deque
+from inspect import isawaitable
+from itertools import islice
+
+from ._async import _call_async
+from ._impl import NOTHING, Err, Nothing, Ok, Option, Result, Some
+
+
+__all__ = (
+    "aand_then",
+    "acollect",
+    "afilter_ok",
+    "amap",
+    "and_then_each",
+    "errs",
+    "filter_ok",
+    "map_err",
+    "map_ok",
+    "oks",
+    "somes",
+    "take_while_ok",
+    "try_chunks",
+    "try_iter",
+    "TryIter",
+)
+
+T = t.TypeVar("T")
+E = t.TypeVar("E")
+U = t.TypeVar("U")
+F = t.TypeVar("F")
+
+
+def map_ok(
+    fn: t.Callable[[T], U], results: t.Iterable[Result[T, E]]
+) -> t.Iterator[Result[U, E]]:
+    """Lazily apply `Result.map(fn)` to every Result."""
+    for result in results:
+        yield result.map(fn)
+
+
+def map_err(
+    fn: t.Callable[[E], F], results: t.Iterable[Result[T, E]]
+) -> t.Iterator[Result[T, F]]:
+    """Lazily apply `fn` to the error of every Err, leaving Oks as they are."""
+    for result in results:
+        yield result.map_err(fn)
+
+
+def and_then_each(
+    fn: t.Callable[[T], Result[U, E]], results: t.Iterable[Result[T, E]]
+) -> t.Iterator[Result[U, E]]:
+    """Lazily apply `Result.and_then(fn)` to every Result."""
+    for result in results:
+        yield result.and_then(fn)
+
+
+def filter_ok(
+    predicate: t.Callable[[T], bool], results: t.Iterable[Result[T, E]]
+) -> t.Iterator[Result[T, E]]:
+    """Lazily drop every Ok whose value fails `predicate`.
+
+    Errs are passed through unchanged, so that errors are not lost.
+    """
+    for result in results:
+        if result.__class__ is not Ok and isinstance(result, Err):
+            yield result
+        elif predicate(result.value):  # type: ignore
+            yield result
+
+
+def oks(results: t.Iterable[Result[T, E]]) -> t.Iterator[T]:
+    """Lazily yield the value of every Ok, skipping Errs."""
+    for result in results:
+        if result.__class__ is Ok or not isinstance(result, Err):
+            yield result.value  # type: ignore
+
+
+def errs(results: t.Iterable[Result[T, E]]) -> t.Iterator[E]:
+    """Lazily yield the value of every Err, skipping Oks."""
+    for result in results:
+        if result.__class__ is not Ok and isinstance(result, Err):
+            yield result.value
+
+
+def somes(options: t.Iterable[Option[T]]) -> t.Iterator[T]:
+    """Lazily yield the value of every Some, skipping Nothings."""
+    for option in options:
+        if option.__class__ is Some or not isinstance(option, Nothing):
+            yield option.value  # type: ignore
+
+
+def take_while_ok(results: t.Iterable[Result[T, E]]) -> t.Iterator[T]:
+    """Lazily yield Ok values, stopping at the first Err.
+
+    The Err itself is discarded. Use `try_iter()` to find out whether,
+    and why, iteration stopped early.
+    """
+    for result in results:
+        if result.__class__ is not Ok and isinstance(result, Err):
+            return
+        yield result.value  # type: ignore
+
+
+def try_chunks(
+    size: int, results: t.Iterable[Result[T, E]]
+) -> t.Iterator[Result[t.Tuple[T, ...], E]]:
+    """Lazily group Results into chunks of `size`, collecting each chunk.
+
+    Each chunk is the `Result.collect()` of `size` consecutive Results (or
+    fewer, for the last chunk): Ok of their values, or the chunk's first
+    Err. A chunk with an Err is still consumed in full, so the next chunk
+    starts at the same place it would have otherwise.
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    it = iter(results)
+    while True:
+        chunk = tuple(islice(it, size))
+        if not chunk:
+            return
+        yield Result.collect(chunk)
+
+
+class TryIter(t.Iterator[T], t.Generic[T, E]):
+    """An iterator over Ok values that stops at the first Err.
+
+    Returned by `try_iter()`. Once iteration stops, `error` holds
+    `Some(err)` if it stopped at an Err, or `Nothing()` if the input was
+    exhausted.
+    """
+
+    __slots__ = ("_results", "_error")
+
+    def __init__(self, results: t.Iterable[Result[T, E]]) -> None:
+        """Iterate over `results`."""
+        self._results = iter(results)
+        self._error: Option[E] = NOTHING
+
+    @property
+    def error(self) -> Option[E]:
+        """The Err value iteration stopped at, if any."""
+        return self._error
+
+    def result(self) -> Result[None, E]:
+        """Return `Err` of the error iteration stopped at, or `Ok(None)`."""
+        if self._error.is_some():
+            return Err(self._error.unwrap())
+        return Ok(None)
+
+    def __iter__(self) -> "TryIter[T, E]":
+        """Return this iterator."""
+        return self
+
+    def __next__(self) -> T:
+        """Return the next Ok value, or stop at an Err."""
+        if self._error.is_some():
+            raise StopIteration
+        result = next(self._results)
+        if result.__class__ is not Ok and isinstance(result, Err):
+            self._error = Some(result.value)
+            # Release the input, which will not be read again
+            self._results = iter(())
+            raise StopIteration
+        return result.value  # type: ignore
+
+
+def try_iter(results: t.Iterable[Result[T, E]]) -> TryIter[T, E]:
+    """Lazily yield Ok values, stopping at the first Err.
+
+    Unlike `take_while_ok()`, the Err is kept: once iteration stops, check
+    the returned iterator's `error` or `result()`.
+
+    Example:
+    ```py
+
+    >>> values = try_iter([Ok(1), Ok(2), Err("no"), Ok(4)])
+    >>> list(values)
+    [1, 2]
+    >>> values.result()
+    Err('no')
+
+    ```
+    """
+    return TryIter(results)
+
+
+# ----------------------------------------------------------------------
+# Async
+# ----------------------------------------------------------------------
+
+AnyIterable = t.Union[t.Iterable[T], t.AsyncIterable[T]]
+
+
+async def _aiterate(items: AnyIterable[T]) -> t.AsyncGenerator[T, None]:
+    """Iterate asynchronously over a sync or async iterable."""
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def _bounded(
+    call: t.Callable[[T], t.Awaitable[U]],
+    items: AnyIterable[T],
+    concurrency: int,
+    ordered: bool,
+) -> t.AsyncGenerator[U, None]:
+    """Yield `await call(item)` for each item, with bounded concurrency.
+
+    At most `concurrency` calls are in flight, counting those that have
+    finished but are waiting to be yielded in order, and the next item is
+    only read once there is room for it. Unfinished calls are cancelled
+    and waited for when the generator is closed, and `items` is closed if
+    it is an async generator.
+    """
+    source = _aiterate(items)
+    in_flight: t.Deque["asyncio.Future[U]"] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(in_flight) < concurrency:
+                try:
+                    item = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    in_flight.append(asyncio.ensure_future(call(item)))
+            if not in_flight:
+                return
+            if ordered:
+                yield await in_flight.popleft()
+            else:
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Calls finishing together are yielded in input order
+                for task in [task for task in in_flight if task in done]:
+                    in_flight.remove(task)
+                    yield task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.wait(in_flight)
+        await source.aclose()
+        aclose = getattr(items, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def _check_concurrency(concurrency: int) -> None:
+    """Raise a ValueError now, rather than once iteration starts."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+def amap(
+    fn: t.Callable[[T], t.Awaitable[U]],
+    items: AnyIterable[T],
+    *,
+    concurrency: int = 1,
+    ordered: bool = True,
+    catch: t.Type[Exception] = Exception,
+) -> t.AsyncGenerator[Result[U, Exception], None]:
+    """Yield `Result.of_async(fn, item)` for each item, concurrently.
+
+    Up to `concurrency` calls run at once. If `ordered` is True, Results
+    are yielded in the order of `items`, otherwise as soon as each call
+    finishes. Exceptions of type `catch` become Errs, as in `Result.of()`.
+
+    Example:
+    ```py
+
+    >>> async def double(val: int) -> int:
+    ...     return val * 2
+    >>> async def main() -> t.List[Result[int, Exception]]:
+    ...     return [res async for res in amap(double, [1, 2], concurrency=2)]
+    >>> asyncio.run(main())
+    [Ok(2), Ok(4)]
+
+    ```
+    """
+    _check_concurrency(concurrency)
+
+    def _call(item: T) -> t.Awaitable[Result[U, Exception]]:
+        return _call_async(fn, (item,), {}, catch)
+
+    return _bounded(_call, items, concurrency, ordered)
+
+
+def aand_then(
+    fn: t.Callable[[T], t.Union[Result[U, E], t.Awaitable[Result[U, E]]]],
+    results: AnyIterable[Result[T, E]],
+    *,
+    concurrency: int = 1,
+    ordered: bool = True,
+) -> t.AsyncGenerator[Result[U, E], None]:
+    """Yield `Result.and_then(fn)` for each Result, concurrently.
+
+    `fn` may be sync or async. Up to `concurrency` calls run at once, and
+    Results are yielded in order if `ordered` is True. Errs are passed
+    through without calling `fn`.
+    """
+    _check_concurrency(concurrency)
+
+    async def _call(result: Result[T, E]) -> Result[U, E]:
+        if result.__class__ is not Ok and isinstance(result, Err):
+            return result
+        out = fn(result.value)  # type: ignore
+        if isawaitable(out):
+            out = await out
+        return out
+
+    return _bounded(_call, results, concurrency, ordered)
+
+
+async def afilter_ok(
+    predicate: t.Callable[[T], t.Union[bool, t.Awaitable[bool]]],
+    results: AnyIterable[Result[T, E]],
+) -> t.AsyncGenerator[Result[T, E], None]:
+    """Drop every Ok whose value fails `predicate`, which may be async.
+
+    Errs are passed through unchanged, so that errors are not lost. If
+    the input is an async generator, it is closed when this one is.
+    """
+    source = _aiterate(results)
+    try:
+        async for result in source:
+            if result.__class__ is not Ok and isinstance(result, Err):
+                yield result
+                continue
+            keep = predicate(result.value)  # type: ignore
+            if isawaitable(keep):
+                keep = await keep
+            if keep:
+                yield result
+    finally:
+        await source.aclose()
+        aclose = getattr(results, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def acollect(
+    results: AnyIterable[Result[T, E]],
+) -> Result[t.Tuple[T, ...], E]:
+    """Collect Results as `Result.collect()` does, stopping at an Err.
+
+    If the input is an async generator, such as one from `amap()`, it is
+    closed on stopping, cancelling any calls still in flight.
+    """
+    ok_vals: t.List[T] = []
+    append = ok_vals.append
+    source = _aiterate(results)
+    try:
+        async for result in source:
+            if result.__class__ is not Ok and isinstance(result, Err):
+                return result
+            append(result.value)  # type: ignore
+    finally:
+        await source.aclose()
+        aclose = getattr(results, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return Ok(tuple(ok_vals))
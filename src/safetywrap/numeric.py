@@ -0,0 +1,481 @@
+"""NumPy-backed arrays of numeric Options and Results.
+
+This module requires NumPy, which is an optional dependency. Install it
+directly or with `pip install safetywrap[numpy]`. The rest of the package
+does not depend on NumPy, and does not import this module.
+
+An `OptionArray` pairs an array of values with a boolean validity mask,
+where True marks a `Some`. A `ResultArray` adds an array of error codes,
+with the mask marking which items are `Ok`. Operations are applied to the
+whole array at once, rather than calling a function per item.
+"""
+
+import typing as t
+
+import numpy as np
+
+from ._impl import NOTHING, Err, Ok, Option, Result, Some
+
+
+__all__ = ("OptionArray", "ResultArray")
+
+# An elementwise function: a ufunc, or anything built from them
+ArrayFn = t.Callable[[np.ndarray], np.ndarray]
+
+
+def _frozen(arr: np.ndarray) -> np.ndarray:
+    """Return a read-only view of `arr`, leaving `arr` itself writable."""
+    view = arr.view()
+    view.flags.writeable = False
+    return view
+
+
+def _array_equal(left: np.ndarray, right: np.ndarray) -> bool:
+    """Return whether two arrays are equal, treating NaNs as equal."""
+    try:
+        return bool(np.array_equal(left, right, equal_nan=True))
+    except TypeError:
+        # Arrays which cannot hold NaN, e.g. of strings or objects
+        return bool(np.array_equal(left, right))
+
+
+def _apply(fn: ArrayFn, values: np.ndarray) -> np.ndarray:
+    """Apply `fn` to `values`, ignoring floating point warnings.
+
+    Functions are applied to every slot, including invalid ones whose
+    contents are meaningless, so warnings (e.g. division by zero) are
+    suppressed rather than reported for slots that will be masked out.
+    """
+    with np.errstate(all="ignore"):
+        return np.asarray(fn(values))
+
+
+class OptionArray:
+    """An array of numeric Options, as a value array and a validity mask.
+
+    Example:
+    ```py
+
+    >>> arr = OptionArray.of([1.0, None, 3.0])
+    >>> arr.map(np.sqrt).unwrap_or(0.0).tolist()
+    [1.0, 0.0, 1.7320508075688772]
+    >>> arr.sum()
+    4.0
+    >>> list(arr)
+    [Some(1.0), Nothing(), Some(3.0)]
+
+    ```
+    """
+
+    __slots__ = ("_values", "_mask")
+
+    def __init__(self, values: t.Any, mask: t.Any) -> None:
+        """Create an array from `values` and a mask, True for `Some`.
+
+        Neither input is copied if it is already an array of the right
+        shape. The array exposes read-only views of its inputs.
+        """
+        values = np.asarray(values)
+        mask = np.asarray(mask, dtype=bool)
+        if values.ndim != 1 or values.shape != mask.shape:
+            raise ValueError(
+                "values and mask must be one-dimensional and the same shape"
+            )
+        self._values = _frozen(values)
+        self._mask = _frozen(mask)
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def of(
+        cls, values: t.Iterable[t.Optional[t.Any]], dtype: t.Any = float
+    ) -> "OptionArray":
+        """Return an array of `Nothing()` for each None, else `Some(val)`.
+
+        The array version of `Option.of()`.
+        """
+        items = list(values)
+        mask = np.fromiter(
+            (val is not None for val in items), dtype=bool, count=len(items)
+        )
+        filled = np.fromiter(
+            (0 if val is None else val for val in items),
+            dtype=dtype,
+            count=len(items),
+        )
+        return cls(filled, mask)
+
+    @classmethod
+    def from_options(
+        cls, options: t.Iterable[Option[t.Any]], dtype: t.Any = float
+    ) -> "OptionArray":
+        """Return an array from an iterable of `Some` and `Nothing`."""
+        return cls.of(
+            (opt.value if isinstance(opt, Some) else None for opt in options),
+            dtype=dtype,
+        )
+
+    # ------------------------------------------------------------------
+    # Attributes
+    # ------------------------------------------------------------------
+
+    @property
+    def values(self) -> np.ndarray:
+        """The values, as a read-only array. Invalid slots are meaningless."""
+        return self._values
+
+    @property
+    def mask(self) -> np.ndarray:
+        """The validity mask, as a read-only array. True marks a `Some`."""
+        return self._mask
+
+    # ------------------------------------------------------------------
+    # Methods
+    # ------------------------------------------------------------------
+
+    def collect(self) -> Option[np.ndarray]:
+        """Return `Some` of all values, or `Nothing()` if any are `Nothing`."""
+        if self._mask.all():
+            return Some(self._values.copy())
+        return NOTHING
+
+    def count_some(self) -> int:
+        """Return the number of `Some` items."""
+        return int(np.count_nonzero(self._mask))
+
+    def count_nothing(self) -> int:
+        """Return the number of `Nothing` items."""
+        return len(self._mask) - self.count_some()
+
+    def filter(self, predicate: ArrayFn) -> "OptionArray":
+        """Replace every `Some` for which `predicate` is False with Nothing.
+
+        `predicate` is called once, with the whole value array, and must
+        return a boolean array of the same shape.
+        """
+        keep = _apply(predicate, self._values).astype(bool, copy=False)
+        return OptionArray(self._values, self._mask & keep)
+
+    def map(self, fn: ArrayFn) -> "OptionArray":
+        """Apply an elementwise `fn` to every `Some` value.
+
+        `fn` is called once, with the whole value array, e.g. a ufunc like
+        `np.sqrt` or `lambda arr: arr * 2`.
+        """
+        return OptionArray(_apply(fn, self._values), self._mask)
+
+    def somes(self) -> np.ndarray:
+        """Return an array of just the `Some` values."""
+        somes: np.ndarray = self._values[self._mask]
+        return somes
+
+    def unwrap_or(self, default: t.Any) -> np.ndarray:
+        """Return the values, with `default` in place of every `Nothing`."""
+        return np.where(self._mask, self._values, default)
+
+    def reduce(self, ufunc: np.ufunc) -> Option[t.Any]:
+        """Reduce the `Some` values with `ufunc`, or `Nothing()` if none."""
+        somes = self.somes()
+        if not len(somes):
+            return NOTHING
+        return Some(ufunc.reduce(somes).item())
+
+    def sum(self) -> t.Any:
+        """Return the sum of the `Some` values, which is zero if none."""
+        return self.somes().sum().item()
+
+    def min(self) -> Option[t.Any]:
+        """Return the smallest `Some` value, or `Nothing()` if none."""
+        return self.reduce(np.minimum)
+
+    def max(self) -> Option[t.Any]:
+        """Return the largest `Some` value, or `Nothing()` if none."""
+        return self.reduce(np.maximum)
+
+    def mean(self) -> Option[float]:
+        """Return the mean of the `Some` values, or `Nothing()` if none."""
+        somes = self.somes()
+        if not len(somes):
+            return NOTHING
+        return Some(float(somes.mean()))
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self._mask)
+
+    def __iter__(self) -> t.Iterator[Option[t.Any]]:
+        """Iterate over the items as `Some` and `Nothing` instances."""
+        nothing: Option[t.Any] = NOTHING
+        for valid, val in zip(self._mask.tolist(), self._values.tolist()):
+            yield Some(val) if valid else nothing
+
+    def __getitem__(self, idx: t.Any) -> t.Any:
+        """Return an item as a `Some` or `Nothing`, or a sub-array.
+
+        Integer indices return an Option. Slices, index arrays, and
+        boolean arrays return an `OptionArray`.
+        """
+        if isinstance(idx, (int, np.integer)):
+            if self._mask[idx]:
+                return Some(self._values[idx].item())
+            return NOTHING
+        return OptionArray(self._values[idx], self._mask[idx])
+
+    def __eq__(self, other: t.Any) -> bool:
+        """Arrays are equal if their items are equal."""
+        if not isinstance(other, OptionArray):
+            return False
+        return bool(
+            np.array_equal(self._mask, other._mask)
+            and _array_equal(self.somes(), other.somes())
+        )
+
+    def __ne__(self, other: t.Any) -> bool:
+        """Arrays are equal if their items are equal."""
+        return not self == other
+
+    def __repr__(self) -> str:
+        """Return a string representation of the array."""
+        return f"OptionArray({list(self)!r})"
+
+
+class ResultArray:
+    """An array of numeric Results, as value, error, and validity arrays.
+
+    Each item is `Ok` of its entry in the value array if its mask entry is
+    True, or `Err` of its entry in the error array otherwise. Errors are
+    typically integer error codes.
+
+    Example:
+    ```py
+
+    >>> arr = ResultArray.from_results([Ok(1.0), Err(404), Ok(4.0)])
+    >>> arr.map(np.sqrt).oks().tolist()
+    [1.0, 2.0]
+    >>> arr.collect()
+    Err(404)
+    >>> arr.unwrap_or(-1.0).tolist()
+    [1.0, -1.0, 4.0]
+
+    ```
+    """
+
+    __slots__ = ("_values", "_errors", "_mask")
+
+    def __init__(self, values: t.Any, errors: t.Any, mask: t.Any) -> None:
+        """Create an array from values, errors, and a mask, True for `Ok`.
+
+        No input is copied if it is already an array of the right shape.
+        The array exposes read-only views of its inputs.
+        """
+        values = np.asarray(values)
+        errors = np.asarray(errors)
+        mask = np.asarray(mask, dtype=bool)
+        shape = values.shape
+        if values.ndim != 1 or not shape == errors.shape == mask.shape:
+            raise ValueError(
+                "values, errors, and mask must be one-dimensional and the "
+                "same shape"
+            )
+        self._values = _frozen(values)
+        self._errors = _frozen(errors)
+        self._mask = _frozen(mask)
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_results(
+        cls,
+        results: t.Iterable[Result[t.Any, t.Any]],
+        dtype: t.Any = float,
+        err_dtype: t.Any = np.int64,
+    ) -> "ResultArray":
+        """Return an array from an iterable of `Ok` and `Err`.
+
+        Errors are stored as `err_dtype`, by default integer error codes.
+        Pass `err_dtype=object` to hold errors of any type, such as
+        strings or exceptions. A `TypeError` is raised if an error cannot
+        be converted to `err_dtype`.
+        """
+        items = list(results)
+        mask = np.fromiter(
+            map(isinstance, items, (Ok,) * len(items)),
+            dtype=bool,
+            count=len(items),
+        )
+        values = np.fromiter(
+            (res.value if ok else 0 for ok, res in zip(mask, items)),
+            dtype=dtype,
+            count=len(items),
+        )
+        try:
+            errors = np.fromiter(
+                (0 if ok else res.value for ok, res in zip(mask, items)),
+                dtype=err_dtype,
+                count=len(items),
+            )
+        except (TypeError, ValueError, OverflowError) as exc:
+            raise TypeError(
+                f"Err values must be convertible to {np.dtype(err_dtype)}; "
+                "pass err_dtype=object for errors of other types"
+            ) from exc
+        return cls(values, errors, mask)
+
+    @classmethod
+    def ok_if(
+        cls, predicate: ArrayFn, values: t.Any, err: t.Any
+    ) -> "ResultArray":
+        """Return `Ok(val)` where predicate(val) is True, else `Err(err)`.
+
+        `predicate` is called once, with the whole value array.
+        """
+        values = np.asarray(values)
+        mask = _apply(predicate, values).astype(bool, copy=False)
+        return cls(values, np.full(values.shape, err), mask)
+
+    # ------------------------------------------------------------------
+    # Attributes
+    # ------------------------------------------------------------------
+
+    @property
+    def values(self) -> np.ndarray:
+        """The values, as a read-only array. Invalid slots are meaningless."""
+        return self._values
+
+    @property
+    def errors(self) -> np.ndarray:
+        """The errors, as a read-only array. Valid slots are meaningless."""
+        return self._errors
+
+    @property
+    def mask(self) -> np.ndarray:
+        """The validity mask, as a read-only array. True marks an `Ok`."""
+        return self._mask
+
+    # ------------------------------------------------------------------
+    # Methods
+    # ------------------------------------------------------------------
+
+    def collect(self) -> Result[np.ndarray, t.Any]:
+        """Return `Ok` of all values, or the first `Err`."""
+        if self._mask.all():
+            return Ok(self._values.copy())
+        return Err(self._errors[np.argmin(self._mask)].item())
+
+    def count_ok(self) -> int:
+        """Return the number of `Ok` items."""
+        return int(np.count_nonzero(self._mask))
+
+    def count_err(self) -> int:
+        """Return the number of `Err` items."""
+        return len(self._mask) - self.count_ok()
+
+    def err(self) -> OptionArray:
+        """Return an `OptionArray` of the errors, `Some` where `Err`."""
+        return OptionArray(self._errors, ~self._mask)
+
+    def errs(self) -> np.ndarray:
+        """Return an array of just the `Err` values."""
+        errs: np.ndarray = self._errors[~self._mask]
+        return errs
+
+    def filter(self, predicate: ArrayFn, err: t.Any) -> "ResultArray":
+        """Replace every `Ok` for which `predicate` is False with `Err(err)`.
+
+        `predicate` is called once, with the whole value array, and must
+        return a boolean array of the same shape.
+        """
+        keep = _apply(predicate, self._values).astype(bool, copy=False)
+        rejected = self._mask & ~keep
+        errors = np.where(rejected, err, self._errors).astype(
+            self._errors.dtype, copy=False
+        )
+        return ResultArray(self._values, errors, self._mask & keep)
+
+    def map(self, fn: ArrayFn) -> "ResultArray":
+        """Apply an elementwise `fn` to every `Ok` value."""
+        return ResultArray(_apply(fn, self._values), self._errors, self._mask)
+
+    def map_err(self, fn: ArrayFn) -> "ResultArray":
+        """Apply an elementwise `fn` to every `Err` value."""
+        return ResultArray(self._values, _apply(fn, self._errors), self._mask)
+
+    def ok(self) -> OptionArray:
+        """Return an `OptionArray` of the values, `Some` where `Ok`."""
+        return OptionArray(self._values, self._mask)
+
+    def oks(self) -> np.ndarray:
+        """Return an array of just the `Ok` values."""
+        oks: np.ndarray = self._values[self._mask]
+        return oks
+
+    def unwrap_or(self, default: t.Any) -> np.ndarray:
+        """Return the values, with `default` in place of every `Err`."""
+        return np.where(self._mask, self._values, default)
+
+    def reduce(self, ufunc: np.ufunc) -> Option[t.Any]:
+        """Reduce the `Ok` values with `ufunc`, or `Nothing()` if none."""
+        return self.ok().reduce(ufunc)
+
+    def sum(self) -> t.Any:
+        """Return the sum of the `Ok` values, which is zero if none."""
+        return self.ok().sum()
+
+    def min(self) -> Option[t.Any]:
+        """Return the smallest `Ok` value, or `Nothing()` if none."""
+        return self.ok().min()
+
+    def max(self) -> Option[t.Any]:
+        """Return the largest `Ok` value, or `Nothing()` if none."""
+        return self.ok().max()
+
+    def mean(self) -> Option[float]:
+        """Return the mean of the `Ok` values, or `Nothing()` if none."""
+        return self.ok().mean()
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self._mask)
+
+    def __iter__(self) -> t.Iterator[Result[t.Any, t.Any]]:
+        """Iterate over the items as `Ok` and `Err` instances."""
+        for valid, val, err in zip(
+            self._mask.tolist(), self._values.tolist(), self._errors.tolist()
+        ):
+            yield Ok(val) if valid else Err(err)
+
+    def __getitem__(self, idx: t.Any) -> t.Any:
+        """Return an item as an `Ok` or `Err`, or a sub-array.
+
+        Integer indices return a Result. Slices, index arrays, and boolean
+        arrays return a `ResultArray`.
+        """
+        if isinstance(idx, (int, np.integer)):
+            if self._mask[idx]:
+                return Ok(self._values[idx].item())
+            return Err(self._errors[idx].item())
+        return ResultArray(
+            self._values[idx], self._errors[idx], self._mask[idx]
+        )
+
+    def __eq__(self, other: t.Any) -> bool:
+        """Arrays are equal if their items are equal."""
+        if not isinstance(other, ResultArray):
+            return False
+        return bool(
+            np.array_equal(self._mask, other._mask)
+            and _array_equal(self.oks(), other.oks())
+            and _array_equal(self.errs(), other.errs())
+        )
+
+    def __ne__(self, other: t.Any) -> bool:
+        """Arrays are equal if their items are equal."""
+        return not self == other
+
+    def __repr__(self) -> str:
+        """Return a string representation of the array."""
+        return f"ResultArray({list(self)!r})"
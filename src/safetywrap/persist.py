@@ -0,0 +1,554 @@
+"""Memoize expensive functions returning Results, on disk.
+
+A `ResultStore` is a SQLite database of encoded return values, keyed by a
+stable hash of a function's name and arguments, so entries outlive the
+process that computed them: a restarted job finds the results of calls it
+already made. The `persistent_cache()` decorator uses a store to memoize a
+function.
+
+Several processes on one host may share a store. The database is opened
+in write-ahead logging mode, each process opens its own connection, and
+writers wait up to `timeout` seconds for each other.
+
+Values are pickled by default, so that any picklable return value, such
+as an `Err` of an exception caught by `Result.of()`, comes back exactly as
+it was stored. Unpickling can run arbitrary code, so a store must only be
+opened if everyone who can write to its file is trusted.
+
+Example:
+```py
+
+>>> import os, tempfile
+>>> from safetywrap import Result
+>>> path = os.path.join(tempfile.mkdtemp(), "results.db")
+>>> calls = []
+>>> @persistent_cache(path)
+... def parse(text: str) -> Result[int, str]:
+...     calls.append(text)
+...     return Result.of(int, text)
+>>> parse("12"), parse("12")
+(Ok(12), Ok(12))
+>>> parse("x").is_err(), parse("x").is_err()
+(True, True)
+>>> calls
+['12', 'x', 'x']
+>>> parse.store.close()
+
+```
+"""
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from itertools import islice
+
+from ._impl import NOTHING, Err, Ok, Option, Some
+from .codec import json_default
+
+
+__all__ = ("ResultStore", "persistent_cache", "stable_key")
+
+F = t.TypeVar("F", bound=t.Callable[..., t.Any])
+
+PathLike = t.Union[str, "os.PathLike[str]"]
+
+# Keys per query when reading many at once, within SQLite's default limit
+# of 999 parameters. Also the number of reads whose access times are
+# written at once.
+_CHUNK = 500
+
+_FOREVER = float("inf")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS results (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        created REAL NOT NULL,
+        accessed REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)",
+    # Running totals, kept up to date by triggers, so that checking the
+    # size limits does not scan the table
+    """
+    CREATE TABLE IF NOT EXISTS totals (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        entries INTEGER NOT NULL,
+        bytes INTEGER NOT NULL
+    )
+    """,
+    "INSERT OR IGNORE INTO totals VALUES (0, 0, 0)",
+    """
+    CREATE TRIGGER IF NOT EXISTS results_insert AFTER INSERT ON results
+    BEGIN
+        UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS results_delete AFTER DELETE ON results
+    BEGIN
+        UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size;
+    END
+    """,
+)
+
+
+def stable_key(
+    name: str, args: t.Sequence[t.Any], kwargs: t.Mapping[str, t.Any]
+) -> str:
+    """Return a hash of a call, which is the same in every process.
+
+    The name and arguments are encoded as JSON, with keyword arguments
+    sorted, and hashed with SHA-256. Arguments must therefore be JSON
+    serializable, or Results or Options of such values, and tuples are
+    not distinguished from lists. A `TypeError` is raised otherwise.
+
+    Example:
+    ```py
+
+    >>> key = stable_key("f", (1, Ok("a")), {"b": 2})
+    >>> key == stable_key("f", [1, Ok("a")], {"b": 2})
+    True
+    >>> len(key)
+    64
+
+    ```
+    """
+    text = json.dumps(
+        [name, list(args), kwargs],
+        default=json_default,
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _pickle(value: t.Any) -> bytes:
+    """Pickle a value with the highest protocol."""
+    return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
+class ResultStore:
+    """A SQLite database of encoded values, keyed by strings.
+
+    Values are encoded with `encode` and decoded with `decode`, by default
+    by pickling, which round-trips any picklable value exactly. As
+    unpickling can run arbitrary code, only open a store if everyone who
+    can write to the database is trusted, or else pass functions encoding
+    a safer format, such as JSON with `safetywrap.codec`.
+
+    Entries older than `ttl` seconds, if given, are treated as missing.
+    Once the store holds more than `max_entries` entries, or more than
+    `max_bytes` bytes of encoded values, the least recently used entries
+    are evicted. `timer` returns the time in seconds since the epoch, and
+    is shared by every process using the store.
+
+    Reads do not write to the database. The times at which entries were
+    last read, which decide the order of eviction, are kept in memory and
+    written in bulk: with the next `put()`, every few hundred reads, and
+    on closing the store.
+
+    Example:
+    ```py
+
+    >>> import os, tempfile
+    >>> with ResultStore(os.path.join(tempfile.mkdtemp(), "db")) as store:
+    ...     store.put("a", Ok(1))
+    ...     store.get("a"), store.get("b"), len(store)
+    (Some(Ok(1)), Nothing(), 1)
+
+    ```
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        *,
+        ttl: t.Optional[float] = None,
+        max_entries: t.Optional[int] = None,
+        max_bytes: t.Optional[int] = None,
+        timeout: float = 30.0,
+        encode: t.Callable[[t.Any], bytes] = _pickle,
+        decode: t.Callable[[bytes], t.Any] = pickle.loads,
+        timer: t.Callable[[], float] = time.time,
+    ) -> None:
+        """Use the store at `path`, which is opened or created when needed."""
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._encode = encode
+        self._decode = decode
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._conn: t.Optional[sqlite3.Connection] = None
+        self._pid = 0
+        # Access times not yet written to the database
+        self._accessed: t.Dict[str, float] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this process's connection, opening it if need be.
+
+        Connections must not be shared with forked processes, so a child
+        process opens a new one, leaving its parent's untouched.
+        """
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            conn.close()
+            raise
+        conn.execute("COMMIT")
+        self._conn = conn
+        self._pid = os.getpid()
+        return conn
+
+    def _expired(self, created: float, now: float) -> bool:
+        """Return whether an entry created at `created` has expired."""
+        return self.ttl is not None and created + self.ttl <= now
+
+    def _expiry(self, created: float) -> float:
+        """Return when an entry created at `created` expires."""
+        return _FOREVER if self.ttl is None else created + self.ttl
+
+    def _touch(self, conn: sqlite3.Connection, key: str, now: float) -> None:
+        """Record a read of `key`. The lock must be held."""
+        self._accessed[key] = now
+        if len(self._accessed) >= _CHUNK:
+            self._flush(conn)
+
+    def _write_accessed(self, conn: sqlite3.Connection) -> None:
+        """Write the recorded access times, within a transaction."""
+        if self._accessed:
+            conn.executemany(
+                "UPDATE results SET accessed = ? WHERE key = ?",
+                ((now, key) for key, now in self._accessed.items()),
+            )
+            self._accessed.clear()
+
+    def _flush(self, conn: sqlite3.Connection) -> None:
+        """Write the recorded access times. The lock must be held."""
+        if not self._accessed:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._write_accessed(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def get(self, key: str) -> Option[t.Any]:
+        """Return `Some` of the value stored for `key`, or `Nothing()`.
+
+        Expired entries, and those that cannot be decoded, are missing.
+        """
+        now = self._timer()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, created FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or self._expired(row[1], now):
+                return NOTHING
+            self._touch(conn, key, now)
+        try:
+            return Some(self._decode(row[0]))
+        except Exception:  # pylint: disable=broad-except
+            return NOTHING
+
+    def get_many(self, keys: t.Iterable[str]) -> t.Dict[str, t.Any]:
+        """Return the values stored for any of `keys`, in bulk.
+
+        Keys are looked up several hundred per query, rather than one at a
+        time. Missing, expired, and undecodable entries are left out.
+        """
+        return {
+            key: value for key, (value, _, _) in self._read_many(keys).items()
+        }
+
+    def _read_many(
+        self, keys: t.Iterable[str]
+    ) -> t.Dict[str, t.Tuple[t.Any, float, int]]:
+        """Return `(value, expiry, size)` for each of `keys` found."""
+        now = self._timer()
+        found: t.Dict[str, t.Tuple[t.Any, float, int]] = {}
+        rows: t.List[t.Tuple[str, bytes, float]] = []
+        keys = iter(keys)
+        with self._lock:
+            conn = self._connect()
+            while True:
+                chunk = list(islice(keys, _CHUNK))
+                if not chunk:
+                    break
+                marks = ",".join("?" * len(chunk))
+                for key, value, created in conn.execute(
+                    "SELECT key, value, created FROM results "
+                    f"WHERE key IN ({marks})",
+                    chunk,
+                ):
+                    if not self._expired(created, now):
+                        rows.append((key, value, created))
+            for key, _, _ in rows:
+                self._touch(conn, key, now)
+        for key, value, created in rows:
+            try:
+                decoded = self._decode(value)
+            except Exception:  # pylint: disable=broad-except
+                continue
+            found[key] = (decoded, self._expiry(created), len(value))
+        return found
+
+    def put(self, key: str, value: t.Any) -> None:
+        """Store `value` for `key`, evicting old entries if need be."""
+        data = self._encode(value)
+        now = self._timer()
+        with self._lock:
+            conn = self._connect()
+            # The new entry's access time is its creation time
+            self._accessed.pop(key, None)
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                conn.execute(
+                    "INSERT INTO results VALUES (?, ?, ?, ?, ?)",
+                    (key, data, len(data), now, now),
+                )
+                self._write_accessed(conn)
+                self._evict(conn)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used entries until within the limits."""
+        if self.max_entries is None and self.max_bytes is None:
+            return
+        while True:
+            entries, nbytes = conn.execute(
+                "SELECT entries, bytes FROM totals"
+            ).fetchone()
+            excess = 0
+            if self.max_entries is not None:
+                excess = entries - self.max_entries
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                # Byte sizes vary, so evict a few at a time
+                excess = max(excess, 1, entries // 100)
+            if excess <= 0:
+                return
+            conn.execute(
+                "DELETE FROM results WHERE key IN ("
+                "SELECT key FROM results ORDER BY accessed LIMIT ?)",
+                (excess,),
+            )
+
+    def delete(self, key: str) -> bool:
+        """Delete the entry for `key`, returning whether there was one."""
+        with self._lock:
+            cursor = self._connect().execute(
+                "DELETE FROM results WHERE key = ?", (key,)
+            )
+            return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        with self._lock:
+            self._connect().execute("DELETE FROM results")
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the encoded values in the store."""
+        with self._lock:
+            row = self._connect().execute("SELECT bytes FROM totals")
+            return row.fetchone()[0]  # type: ignore
+
+    def __len__(self) -> int:
+        """Return the number of entries, including any expired ones."""
+        with self._lock:
+            row = self._connect().execute("SELECT entries FROM totals")
+            return row.fetchone()[0]  # type: ignore
+
+    def close(self) -> None:
+        """Close this process's connection to the database.
+
+        Access times not yet written are written first. The store
+        reconnects if used again.
+        """
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                try:
+                    self._flush(self._conn)
+                finally:
+                    self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "ResultStore":
+        """Use the store as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *_: t.Any) -> None:
+        """Close the store."""
+        self.close()
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        """Pickle as the path and options, reopening the store on unpickling.
+
+        Its functions, such as `encode`, must be picklable.
+        """
+        options = {
+            "ttl": self.ttl,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "timeout": self.timeout,
+            "encode": self._encode,
+            "decode": self._decode,
+            "timer": self._timer,
+        }
+        return (_reopen, (self.__class__, self.path, options))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the store."""
+        return f"{self.__class__.__name__}({self.path!r})"
+
+
+def _reopen(
+    cls: t.Type[ResultStore], path: str, options: t.Dict[str, t.Any]
+) -> ResultStore:
+    """Reopen a pickled store."""
+    return cls(path, **options)
+
+
+def persistent_cache(
+    store: t.Union[ResultStore, PathLike],
+    *,
+    cache_err: bool = False,
+    name: t.Optional[str] = None,
+    max_warm: t.Optional[int] = 10_000,
+) -> t.Callable[[F], F]:
+    """Memoize a function returning Results in a `ResultStore`.
+
+    `store` is a store, or the path of one to use with its defaults, which
+    like any store is only opened on the first call. Calls are keyed by
+    `stable_key()` of `name`, by default the function's module and
+    qualified name, and the call's arguments, which must therefore be JSON
+    serializable. Change `name` to invalidate entries computed by an older
+    version of the function.
+
+    `Err` values are only stored if `cache_err` is True, so that failed
+    calls are retried by default. Other return values are stored as they
+    are. A value which cannot be stored, e.g. because it cannot be
+    encoded, or the database stays locked for longer than its timeout, is
+    still returned.
+
+    The decorated function has a `store` attribute; `cache_key(*args,
+    **kwargs)`, returning the key for a call; and `warm(calls)`, which
+    reads the stored values for many calls at once, given as tuples of
+    positional arguments, and keeps them in memory, so that those calls
+    need not each query the store. It returns the number found. Warmed
+    values expire with the store's `ttl`, and at most `max_warm` of them
+    are kept, or fewer if the store's `max_entries` or `max_bytes` is
+    smaller, dropping the earliest warmed first.
+    """
+    db = store if isinstance(store, ResultStore) else ResultStore(store)
+
+    def decorator(fn: F) -> F:
+        prefix = name or f"{fn.__module__}.{fn.__qualname__}"
+        # Values read in bulk by `warm()`, as (value, expiry, size), with
+        # the earliest warmed first
+        warmed: "OrderedDict[str, t.Tuple[t.Any, float, int]]" = (
+            OrderedDict()
+        )
+        warmed_bytes = 0
+        lock = threading.Lock()
+
+        def _forget(key: str) -> None:
+            """Drop a warmed value, if any. The lock must be held."""
+            nonlocal warmed_bytes
+            entry = warmed.pop(key, None)
+            if entry is not None:
+                warmed_bytes -= entry[2]
+
+        def cache_key(*args: t.Any, **kwargs: t.Any) -> str:
+            """Return the store's key for a call."""
+            return stable_key(prefix, args, kwargs)
+
+        @functools.wraps(fn)
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            key = stable_key(prefix, args, kwargs)
+            if warmed:
+                entry = warmed.get(key)
+                if entry is not None:
+                    if entry[1] == _FOREVER or entry[1] > db._timer():
+                        return entry[0]
+                    with lock:
+                        _forget(key)
+            stored = db.get(key)
+            if stored.__class__ is Some:
+                return stored._value
+            value = fn(*args, **kwargs)
+            if (
+                cache_err
+                or value.__class__ is Ok
+                or not isinstance(value, Err)
+            ):
+                try:
+                    db.put(key, value)
+                except Exception:  # pylint: disable=broad-except
+                    # Failing to store a value must not lose it
+                    pass
+            return value
+
+        def warm(calls: t.Iterable[t.Sequence[t.Any]]) -> int:
+            """Read the stored values of many calls at once."""
+            nonlocal warmed_bytes
+            keys = [cache_key(*args) for args in calls]
+            found = db._read_many(keys)
+            limits = [
+                lim for lim in (max_warm, db.max_entries) if lim is not None
+            ]
+            max_entries = min(limits) if limits else None
+            max_bytes = db.max_bytes
+            with lock:
+                # In the order of `calls`, so that the latest are kept
+                for key in keys:
+                    entry = found.get(key)
+                    if entry is not None:
+                        _forget(key)
+                        warmed[key] = entry
+                        warmed_bytes += entry[2]
+                while warmed and (
+                    (max_entries is not None and len(warmed) > max_entries)
+                    or (max_bytes is not None and warmed_bytes > max_bytes)
+                ):
+                    warmed_bytes -= warmed.popitem(last=False)[1][2]
+            return len(found)
+
+        wrapper.store = db  # type: ignore
+        wrapper.cache_key = cache_key  # type: ignore
+        wrapper.warm = warm  # type: ignore
+        return wrapper  # type: ignore
+
+    return decorator
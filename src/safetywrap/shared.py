@@ -0,0 +1,346 @@
+"""Batches of numeric Results and Options in shared memory.
+
+This module requires `multiprocessing.shared_memory`, which was added in
+Python 3.8. The rest of the package does not import it.
+
+A shared batch stores its items in a single shared memory segment as a
+tag byte per item, 1 for `Ok` or `Some` and 0 for `Err` or `Nothing`,
+plus typed arrays of values and, for Results, error codes. The types are
+given as `array` module typecodes, such as "d" for floats or "q" for
+64-bit integers.
+
+The process creating a batch owns its segment, and unlinks it when the
+batch is closed, or failing that, when the batch is garbage collected or
+the process exits. Pickling a batch sends only the segment's name, so
+passing one to a worker process, for instance through a
+`ProcessPoolExecutor`, attaches to the same memory rather than copying
+it. Readers should be started by the owner through `multiprocessing`, so
+that they share its resource tracker.
+"""
+
+import struct
+import sys
+import typing as t
+import weakref
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+
+from ._columns import cast, itemsize, split_options, split_results
+from ._impl import NOTHING, Err, Ok, Option, Result, Some
+
+
+__all__ = ("SharedOptionBatch", "SharedResultBatch")
+
+T = t.TypeVar("T", covariant=True)
+E = t.TypeVar("E", covariant=True)
+
+# Magic, length, whether items are Results, value and error typecodes
+_HEADER = struct.Struct("<4sQ?cc")
+_MAGIC = b"SWSB"
+_ALIGN = 8
+
+
+def _aligned(offset: int) -> int:
+    """Round `offset` up to a multiple of `_ALIGN`."""
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _open(name: str) -> SharedMemory:
+    """Attach to an existing segment, leaving its cleanup to its owner."""
+    if sys.version_info >= (3, 13):
+        # pylint: disable=unexpected-keyword-arg
+        return SharedMemory(name, track=False)  # type: ignore
+    return SharedMemory(name)
+
+
+def _release(shm: SharedMemory, owner: bool, *views: memoryview) -> None:
+    """Release the views of a segment and close it, unlinking it if owned.
+
+    Called once, when a batch is closed or garbage collected.
+    """
+    for view in views:
+        view.release()
+    shm.close()
+    if owner:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class _SharedBatch:
+    """The shared memory layout common to both kinds of batch."""
+
+    __slots__ = (
+        "_shm",
+        "_finalizer",
+        "_length",
+        "_tags",
+        "_values",
+        "_errors",
+        "__weakref__",
+    )
+
+    _shm: SharedMemory
+    _finalizer: weakref.finalize
+    _length: int
+    # The views of the columns, or None once the batch is closed. Option
+    # batches have an empty view of error codes.
+    _tags: t.Optional[memoryview]
+    _values: t.Optional[memoryview]
+    _errors: t.Optional[memoryview]
+
+    _is_result = False
+
+    def __init__(self) -> None:
+        """Shared batches are created with their constructors."""
+        raise NotImplementedError(
+            "Shared batches may not be instantiated directly. Please use "
+            f"{self.__class__.__name__}.attach() or a constructor instead."
+        )
+
+    @classmethod
+    def _create(
+        cls,
+        tags: bytes,
+        values: "array[t.Any]",
+        errors: t.Optional["array[t.Any]"],
+    ) -> "_SharedBatch":
+        """Create a new segment holding the given columns, and own it.
+
+        The segment is unlinked if it cannot be filled.
+        """
+        length = len(tags)
+        error_type = errors.typecode if errors is not None else " "
+        error_size = len(errors) * errors.itemsize if errors else 0
+        values_off = _aligned(_aligned(_HEADER.size) + length)
+        errors_off = _aligned(values_off + length * values.itemsize)
+        shm = SharedMemory(create=True, size=errors_off + error_size)
+        try:
+            _HEADER.pack_into(
+                shm.buf,  # type: ignore
+                0,
+                _MAGIC,
+                length,
+                cls._is_result,
+                values.typecode.encode(),
+                error_type.encode(),
+            )
+            batch = cls._map(shm, owner=True)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        try:
+            batch_tags, batch_values, batch_errors = batch._columns()
+            batch_tags[:] = tags
+            batch_values[:] = values
+            if errors is not None:
+                batch_errors[:] = errors
+        except BaseException:
+            batch.close()
+            raise
+        return batch
+
+    @classmethod
+    def _map(cls, shm: SharedMemory, owner: bool) -> "_SharedBatch":
+        """Map the columns of a segment, without copying.
+
+        The segment is closed, and unlinked if `owner` is True, when the
+        batch is closed or garbage collected.
+        """
+        # Only None once the segment is closed
+        buf: memoryview = shm.buf  # type: ignore
+        magic, length, is_result, value_type, error_type = (
+            _HEADER.unpack_from(buf)
+        )
+        if magic != _MAGIC or is_result != cls._is_result:
+            shm.close()
+            raise ValueError(
+                f"Shared memory {shm.name!r} does not hold a {cls.__name__}"
+            )
+        value_type = value_type.decode()
+        error_type = error_type.decode()
+        value_size = itemsize(value_type)
+        tags_off = _aligned(_HEADER.size)
+        tags_end = tags_off + length
+        values_off = _aligned(tags_end)
+        values_end = values_off + length * value_size
+        errors_off = _aligned(values_end)
+        tags = buf[tags_off:tags_end]
+        values = cast(buf[values_off:values_end], value_type)
+        if is_result:
+            errors_end = errors_off + length * itemsize(error_type)
+            errors = cast(buf[errors_off:errors_end], error_type)
+        else:
+            errors = memoryview(b"")
+        batch = object.__new__(cls)
+        batch._shm = shm
+        batch._length = length
+        batch._tags = tags
+        batch._values = values
+        batch._errors = errors
+        batch._finalizer = weakref.finalize(
+            batch, _release, shm, owner, tags, values, errors
+        )
+        return batch
+
+    @classmethod
+    def attach(cls, name: str) -> t.Any:
+        """Attach to the batch in the shared memory segment `name`.
+
+        Closing the returned batch detaches from the segment, but does not
+        unlink it, which is left to the batch's owner.
+        """
+        return cls._map(_open(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory segment."""
+        return self._shm.name
+
+    @property
+    def tags(self) -> memoryview:
+        """A view of the tags: 1 for `Ok` or `Some`, 0 otherwise."""
+        return self._columns()[0]
+
+    @property
+    def values(self) -> memoryview:
+        """A typed view of the values, which are 0 where not present."""
+        return self._columns()[1]
+
+    def _columns(self) -> t.Tuple[memoryview, memoryview, memoryview]:
+        """Return the views of the tags, values, and error codes.
+
+        Raise a ValueError if the batch is closed.
+        """
+        tags, values, errors = self._tags, self._values, self._errors
+        if tags is None or values is None or errors is None:
+            raise ValueError("batch is closed")
+        return tags, values, errors
+
+    def close(self) -> None:
+        """Release the segment, unlinking it if this batch owns it.
+
+        Views returned by `tags`, `values`, and `errors` must be released
+        first. Closing a batch more than once has no effect, but any other
+        use of a closed batch, except `len()`, raises a ValueError.
+        """
+        self._tags = self._values = self._errors = None
+        self._finalizer()
+
+    def __enter__(self) -> t.Any:
+        """Use the batch as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *_: t.Any) -> None:
+        """Close the batch."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return self._length
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        """Pickle as the segment's name, attaching to it on unpickling."""
+        return (self.__class__.attach, (self.name,))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the batch."""
+        return (
+            f"{self.__class__.__name__}({self._shm.name!r}, "
+            f"length={self._length})"
+        )
+
+
+class SharedResultBatch(_SharedBatch, t.Generic[T, E]):
+    """A batch of numeric Results in shared memory.
+
+    Example:
+    ```py
+
+    >>> with SharedResultBatch.from_results([Ok(1.5), Err(404)]) as batch:
+    ...     list(batch)
+    [Ok(1.5), Err(404)]
+
+    ```
+    """
+
+    __slots__ = ()
+
+    _is_result = True
+
+    @classmethod
+    def from_results(
+        cls,
+        results: t.Iterable[Result[t.Any, t.Any]],
+        value_type: str = "d",
+        error_type: str = "q",
+    ) -> "SharedResultBatch[t.Any, t.Any]":
+        """Create a batch of Results, or a `ResultBatch`, in a new segment.
+
+        The segment is owned by this process. `value_type` and
+        `error_type` are the `array` typecodes of the values of `Ok` and
+        `Err` items, respectively.
+        """
+        tags, values, errors = split_results(results, value_type, error_type)
+        return cls._create(tags, values, errors)  # type: ignore
+
+    @property
+    def errors(self) -> memoryview:
+        """A typed view of the error codes, which are 0 for `Ok` items."""
+        return self._columns()[2]
+
+    def __iter__(self) -> t.Iterator[Result[T, E]]:
+        """Iterate over the items as Results."""
+        for tag, val, err in zip(*self._columns()):
+            yield Ok(val) if tag else Err(err)  # type: ignore
+
+    def __getitem__(self, idx: int) -> Result[T, E]:
+        """Return the item at `idx` as a Result."""
+        tags, values, errors = self._columns()
+        if tags[idx]:
+            return Ok(values[idx])  # type: ignore
+        return Err(errors[idx])  # type: ignore
+
+
+class SharedOptionBatch(_SharedBatch, t.Generic[T]):
+    """A batch of numeric Options in shared memory.
+
+    Example:
+    ```py
+
+    >>> with SharedOptionBatch.from_options([Some(2), NOTHING], "q") as b:
+    ...     list(b)
+    [Some(2), Nothing()]
+
+    ```
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_options(
+        cls, options: t.Iterable[Option[t.Any]], value_type: str = "d"
+    ) -> "SharedOptionBatch[t.Any]":
+        """Create a batch of Options, or an `OptionBatch`, in a new segment.
+
+        The segment is owned by this process. `value_type` is the `array`
+        typecode of the values of `Some` items.
+        """
+        tags, values = split_options(options, value_type)
+        return cls._create(tags, values, None)  # type: ignore
+
+    def __iter__(self) -> t.Iterator[Option[T]]:
+        """Iterate over the items as Options."""
+        nothing: Option[T] = NOTHING
+        tags, values, _ = self._columns()
+        for tag, val in zip(tags, values):
+            yield Some(val) if tag else nothing  # type: ignore
+
+    def __getitem__(self, idx: int) -> Option[T]:
+        """Return the item at `idx` as an Option."""
+        tags, values, _ = self._columns()
+        if tags[idx]:
+            return Some(values[idx])  # type: ignore
+        return NOTHING
@@ -0,0 +1,21 @@
+"""Fixtures shared between test modules."""
+
+import pytest
+
+
+class Clock:
+    """A clock which only moves when told to."""
+
+    def __init__(self) -> None:
+        """Start at 0."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    """Return a clock to pass as a timer, starting at 0."""
+    return Clock()
@@ -0,0 +1,228 @@
+"""Test the async adapters in safetywrap.iter."""
+
+import asyncio
+import typing as t
+
+import pytest
+
+from safetywrap import Err, Ok, Result
+from safetywrap import iter as siter
+
+
+T = t.TypeVar("T")
+
+
+def _run(awaitable: t.Awaitable[T]) -> T:
+    """Run an awaitable to completion."""
+
+    async def _main() -> T:
+        return await awaitable
+
+    return asyncio.run(_main())
+
+
+async def _drain(stream: t.AsyncIterable[T]) -> t.List[T]:
+    """Collect every item of an async iterable."""
+    return [item async for item in stream]
+
+
+async def _agen(items: t.Iterable[T]) -> t.AsyncGenerator[T, None]:
+    """Yield each item asynchronously."""
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+class _Tracker:
+    """An async function recording how many calls are in flight."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.started: t.List[int] = []
+
+    async def __call__(self, val: int) -> int:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.started.append(val)
+        try:
+            # Later items finish first
+            await asyncio.sleep(0.001 * (5 - val % 5))
+            if val < 0:
+                raise ValueError(val)
+            return val * 2
+        finally:
+            self.active -= 1
+
+
+class TestAmap:
+    """Test mapping async functions over streams."""
+
+    @pytest.mark.parametrize("concurrency", (1, 3, 10))
+    def test_ordered(self, concurrency: int) -> None:
+        """Results are in input order, with bounded concurrency."""
+        fn = _Tracker()
+        stream = siter.amap(fn, range(10), concurrency=concurrency)
+        assert _run(_drain(stream)) == [Ok(val * 2) for val in range(10)]
+        assert fn.peak == concurrency
+
+    def test_unordered(self) -> None:
+        """Results are yielded as they finish."""
+
+        async def _main() -> t.List[Result[int, Exception]]:
+            release = [asyncio.Event() for _ in range(3)]
+
+            async def _wait(val: int) -> int:
+                await release[val].wait()
+                return val
+
+            stream = siter.amap(_wait, range(3), concurrency=3, ordered=False)
+            results = []
+            for val in (2, 0, 1):
+                release[val].set()
+                results.append(await stream.__anext__())
+            return results
+
+        assert _run(_main()) == [Ok(2), Ok(0), Ok(1)]
+
+    def test_unordered_ties(self) -> None:
+        """Results finishing together are yielded in input order."""
+
+        async def _identity(val: int) -> int:
+            return val
+
+        stream = siter.amap(_identity, [3, 1, 2], concurrency=3, ordered=False)
+        assert _run(_drain(stream)) == [Ok(3), Ok(1), Ok(2)]
+
+    def test_async_iterable(self) -> None:
+        """Async iterables are accepted too."""
+        stream = siter.amap(_Tracker(), _agen(range(4)), concurrency=2)
+        assert _run(_drain(stream)) == [Ok(0), Ok(2), Ok(4), Ok(6)]
+
+    def test_exceptions(self) -> None:
+        """Exceptions are caught as by Result.of()."""
+        results = _run(_drain(siter.amap(_Tracker(), [1, -1], concurrency=2)))
+        assert results[0] == Ok(2)
+        assert isinstance(results[1].unwrap_err(), ValueError)
+
+    def test_uncaught_exceptions(self) -> None:
+        """Exceptions not matching `catch` propagate."""
+        stream = siter.amap(_Tracker(), [-1], catch=TypeError)
+        with pytest.raises(ValueError):
+            _run(_drain(stream))
+
+    def test_reads_ahead_by_concurrency(self) -> None:
+        """The input is read no further than needed."""
+        read: t.List[int] = []
+
+        def _source() -> t.Iterator[int]:
+            for val in range(100):
+                read.append(val)
+                yield val
+
+        async def _first() -> Result[int, Exception]:
+            stream = siter.amap(_Tracker(), _source(), concurrency=3)
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first
+
+        assert _run(_first()) == Ok(0)
+        assert read == [0, 1, 2]
+
+    def test_close_cancels(self) -> None:
+        """Closing the stream cancels calls in flight."""
+        cancelled: t.List[int] = []
+
+        async def _slow(val: int) -> int:
+            try:
+                await asyncio.sleep(0 if val == 0 else 10)
+            except asyncio.CancelledError:
+                cancelled.append(val)
+                raise
+            return val
+
+        async def _first() -> Result[int, Exception]:
+            stream = siter.amap(_slow, range(10), concurrency=4)
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first
+
+        assert _run(_first()) == Ok(0)
+        assert sorted(cancelled) == [1, 2, 3]
+
+    def test_close_closes_input(self) -> None:
+        """Closing the stream closes an async generator input."""
+        source: t.AsyncGenerator[int, None] = _agen(range(10))
+
+        async def _first() -> t.Tuple[Result[int, Exception], bool]:
+            stream = siter.amap(_Tracker(), source, concurrency=2)
+            first = await stream.__anext__()
+            await stream.aclose()
+            # Checked before the event loop closes any leftover generators
+            return first, source.ag_frame is None  # type: ignore
+
+        assert _run(_first()) == (Ok(0), True)
+
+    def test_bad_concurrency(self) -> None:
+        """Concurrency must be positive, which is checked up front."""
+        with pytest.raises(ValueError):
+            siter.amap(_Tracker(), [1], concurrency=0)
+        with pytest.raises(ValueError):
+            siter.aand_then(Ok, [Ok(1)], concurrency=0)
+
+
+class TestAdapters:
+    """Test the other async adapters."""
+
+    def test_aand_then(self) -> None:
+        """Sync and async functions are chained onto Oks."""
+
+        async def _check(val: int) -> Result[int, str]:
+            await asyncio.sleep(0)
+            return Ok(val) if val < 3 else Err("big")
+
+        results = [Ok(1), Err("no"), Ok(5)]
+        stream = siter.aand_then(_check, results, concurrency=3)
+        assert _run(_drain(stream)) == [Ok(1), Err("no"), Err("big")]
+        stream = siter.aand_then(lambda v: Ok(v + 1), _agen(results))
+        assert _run(_drain(stream)) == [Ok(2), Err("no"), Ok(6)]
+
+    def test_afilter_ok(self) -> None:
+        """Oks failing the predicate are dropped, and Errs kept."""
+
+        async def _even(val: int) -> bool:
+            return val % 2 == 0
+
+        results = [Ok(1), Ok(2), Err("no"), Ok(4)]
+        exp = [Ok(2), Err("no"), Ok(4)]
+        assert _run(_drain(siter.afilter_ok(_even, results))) == exp
+        stream = siter.afilter_ok(lambda v: v % 2 == 0, _agen(results))
+        assert _run(_drain(stream)) == exp
+
+    def test_afilter_ok_closes(self) -> None:
+        """Closing the filtered stream closes its input."""
+        source: t.AsyncGenerator[Result[int, str], None]
+        source = _agen([Ok(1), Ok(2), Ok(3)])
+
+        async def _first() -> t.Tuple[Result[int, str], bool]:
+            stream = siter.afilter_ok(lambda v: v > 1, source)
+            first = await stream.__anext__()
+            await stream.aclose()
+            # Checked before the event loop closes any leftover generators
+            return first, source.ag_frame is None  # type: ignore
+
+        assert _run(_first()) == (Ok(2), True)
+
+    def test_acollect(self) -> None:
+        """Results are collected, stopping at the first Err."""
+        assert _run(siter.acollect(_agen([Ok(1), Ok(2)]))) == Ok((1, 2))
+        assert _run(siter.acollect([Ok(1), Err("a"), Err("b")])) == Err("a")
+
+    def test_acollect_closes(self) -> None:
+        """Stopping at an Err cancels calls in flight."""
+        fn = _Tracker()
+        stream = siter.amap(fn, [-1, 1, 2, 3, 4, 5], concurrency=3)
+        result = _run(siter.acollect(stream))
+        assert isinstance(result.unwrap_err(), ValueError)
+        assert fn.active == 0
+        assert fn.started == [-1, 1, 2]
@@ -0,0 +1,256 @@
+"""Test Result.of_async, Result.of_in_thread, and AsyncResult."""
+
+import asyncio
+import threading
+import typing as t
+
+import pytest
+
+from safetywrap import AsyncResult, Err, Ok, Result
+
+
+def _run(awaitable: t.Awaitable[t.Any]) -> t.Any:
+    """Run an awaitable to completion."""
+
+    async def _main() -> t.Any:
+        return await awaitable
+
+    return asyncio.run(_main())
+
+
+async def _fetch(key: str) -> int:
+    """Look up a value asynchronously."""
+    await asyncio.sleep(0)
+    return {"a": 1, "b": 2}[key]
+
+
+async def _double(val: int) -> int:
+    await asyncio.sleep(0)
+    return val * 2
+
+
+async def _checked(val: int) -> Result[int, str]:
+    return Ok(val) if val < 10 else Err("too big")
+
+
+class TestOfAsync:
+    """Test constructing AsyncResults."""
+
+    def test_ok(self) -> None:
+        """The awaited value is wrapped in Ok."""
+        assert _run(Result.of_async(_fetch, "a")) == Ok(1)
+
+    def test_kwargs(self) -> None:
+        """Keyword arguments are passed through."""
+        assert _run(Result.of_async(_fetch, key="b")) == Ok(2)
+
+    def test_err(self) -> None:
+        """Caught exceptions are wrapped in Err."""
+        res = _run(Result.of_async(_fetch, "c"))
+        assert isinstance(res.unwrap_err(), KeyError)
+
+    def test_catch(self) -> None:
+        """Only the given exception type is caught."""
+        res = _run(Result.of_async(_fetch, "c", catch=KeyError))
+        assert res.is_err()
+        with pytest.raises(KeyError):
+            _run(Result.of_async(_fetch, "c", catch=ValueError))
+
+    def test_in_thread(self) -> None:
+        """Blocking functions run in another thread."""
+        main = threading.get_ident()
+        res = _run(Result.of_in_thread(threading.get_ident))
+        assert res.is_ok()
+        assert res.unwrap() != main
+
+    def test_in_thread_err(self) -> None:
+        """Exceptions in the thread are caught."""
+        res = _run(Result.of_in_thread(int, "x", catch=ValueError))
+        assert isinstance(res.unwrap_err(), ValueError)
+
+    def test_from_awaitable(self) -> None:
+        """An AsyncResult may wrap any awaitable of a Result."""
+        assert _run(AsyncResult(_checked(3)).map(str)) == Ok("3")
+
+
+class TestChaining:
+    """Test chaining steps onto an AsyncResult."""
+
+    def test_map(self) -> None:
+        """Sync and async functions may be mapped."""
+        chain: AsyncResult[str, Exception]
+        chain = Result.of_async(_fetch, "b").map(_double).map(str)
+        assert _run(chain) == Ok("4")
+
+    def test_and_then(self) -> None:
+        """Sync and async functions returning Results may be chained."""
+        source: AsyncResult[int, t.Any] = Result.of_async(_fetch, "b")
+        assert _run(source.and_then(_checked)) == Ok(2)
+        source = Result.of_async(_fetch, "b")
+        chain = source.map(lambda v: v * 10).and_then(_checked)
+        assert _run(chain) == Err("too big")
+
+    def test_err_skips_ok_steps(self) -> None:
+        """Steps for Ok values are skipped once there is an Err."""
+        chain = (
+            AsyncResult(_checked(20))
+            .map(_double)
+            .and_then(_checked)
+            .map_err(str.upper)
+        )
+        assert _run(chain) == Err("TOO BIG")
+
+    def test_or_else(self) -> None:
+        """Errors may be recovered from."""
+
+        async def _default(_: Exception) -> Result[int, str]:
+            return Ok(0)
+
+        chain = Result.of_async(_fetch, "c").or_else(_default).map(_double)
+        assert _run(chain) == Ok(0)
+        assert _run(Result.of_async(_fetch, "a").or_else(_default)) == Ok(1)
+
+    def test_chains_are_immutable(self) -> None:
+        """Chaining returns a new AsyncResult."""
+        base: AsyncResult[int, Exception] = Result.of_async(_fetch, "a")
+        chained = base.map(str)
+        assert chained is not base
+        assert _run(chained) == Ok("1")
+
+    def test_single_await(self) -> None:
+        """Steps are run in the awaiting task, without creating tasks."""
+        tasks = set()
+
+        async def _record(val: int) -> int:
+            tasks.add(asyncio.current_task())
+            return val
+
+        async def _main() -> Result[int, Exception]:
+            tasks.add(asyncio.current_task())
+            return await (
+                Result.of_async(_fetch, "a").map(_record).map(_record)
+            )
+
+        assert asyncio.run(_main()) == Ok(1)
+        assert len(tasks) == 1
+
+
+class TestGather:
+    """Test Result.gather."""
+
+    @staticmethod
+    async def _after(
+        delay: float, result: Result[int, str], log: t.List[str]
+    ) -> Result[int, str]:
+        """Return `result` after `delay`, logging if cancelled first."""
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            log.append(f"cancelled {result}")
+            raise
+        return result
+
+    def test_short_circuit_ok(self) -> None:
+        """Values are returned in order, not in order of completion."""
+        log: t.List[str] = []
+        gathered = Result.gather(
+            self._after(0.02, Ok(1), log), self._after(0.0, Ok(2), log)
+        )
+        assert asyncio.run(gathered) == Ok((1, 2))
+
+    def test_short_circuit_cancels(self) -> None:
+        """The first Err is returned, and unfinished tasks cancelled."""
+        log: t.List[str] = []
+        gathered = Result.gather(
+            self._after(1, Ok(1), log),
+            self._after(0.01, Err("late"), log),
+            self._after(0.0, Err("first"), log),
+        )
+        assert asyncio.run(gathered) == Err("first")
+        assert sorted(log) == ["cancelled Err('late')", "cancelled Ok(1)"]
+
+    def test_collect_all(self) -> None:
+        """Every outcome is waited for, and errors kept in order."""
+        log: t.List[str] = []
+        gathered = Result.gather(
+            self._after(0.01, Err("a"), log),
+            self._after(0.0, Ok(1), log),
+            self._after(0.0, Err("b"), log),
+            mode="collect_all",
+        )
+        assert asyncio.run(gathered) == Err(("a", "b"))
+        assert log == []
+
+    def test_first_ok(self) -> None:
+        """The first Ok is returned, and unfinished tasks cancelled."""
+        log: t.List[str] = []
+        gathered = Result.gather(
+            self._after(0.0, Err("a"), log),
+            self._after(0.01, Ok(1), log),
+            self._after(1, Ok(2), log),
+            mode="first_ok",
+        )
+        assert asyncio.run(gathered) == Ok(1)
+        assert log == ["cancelled Ok(2)"]
+
+    def test_first_ok_all_errors(self) -> None:
+        """With no Ok, every error is returned in order."""
+        log: t.List[str] = []
+        gathered = Result.gather(
+            self._after(0.01, Err("a"), log),
+            self._after(0.0, Err("b"), log),
+            mode="first_ok",
+        )
+        assert asyncio.run(gathered) == Err(("a", "b"))
+
+    @pytest.mark.parametrize(
+        "mode, exp",
+        (
+            ("short_circuit", Ok(())),
+            ("collect_all", Ok(())),
+            ("first_ok", Err(())),
+        ),
+    )
+    def test_empty(self, mode: str, exp: Result[t.Any, t.Any]) -> None:
+        """Gathering nothing resolves immediately."""
+        assert asyncio.run(Result.gather(mode=mode)) == exp
+
+    def test_async_results(self) -> None:
+        """AsyncResults may be gathered."""
+        gathered = Result.gather(
+            Result.of_async(_fetch, "a"), Result.of_async(_fetch, "b")
+        )
+        assert asyncio.run(gathered) == Ok((1, 2))
+
+    def test_exception_cancels(self) -> None:
+        """An exception is raised, and unfinished tasks cancelled."""
+        log: t.List[str] = []
+
+        async def _boom() -> Result[int, str]:
+            raise RuntimeError("boom")
+
+        gathered = Result.gather(self._after(1, Ok(1), log), _boom())
+        with pytest.raises(RuntimeError):
+            asyncio.run(gathered)
+        assert log == ["cancelled Ok(1)"]
+
+    def test_cancelled(self) -> None:
+        """Cancelling the gather cancels its tasks."""
+        log: t.List[str] = []
+
+        async def _main() -> None:
+            gathered = asyncio.ensure_future(
+                Result.gather(self._after(1, Ok(1), log))
+            )
+            await asyncio.sleep(0.01)
+            gathered.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await gathered
+
+        asyncio.run(_main())
+        assert log == ["cancelled Ok(1)"]
+
+    def test_bad_mode(self) -> None:
+        """Unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            asyncio.run(Result.gather(mode="fastest"))
@@ -0,0 +1,221 @@
+"""Test the ResultBatch and OptionBatch types."""
+
+import pickle
+import typing as t
+
+import pytest
+
+from safetywrap import (
+    Err,
+    Nothing,
+    Ok,
+    Option,
+    OptionBatch,
+    Result,
+    ResultBatch,
+    Some,
+)
+
+
+RESULTS: t.Tuple[Result[int, str], ...] = (Ok(1), Err("a"), Ok(3), Err("b"))
+OPTIONS: t.Tuple[Option[int], ...] = (Some(1), Nothing(), Some(3), Nothing())
+
+
+class TestResultBatch:
+    """Test the ResultBatch type."""
+
+    def test_round_trip(self) -> None:
+        """Results survive conversion to and from a batch."""
+        batch = ResultBatch(RESULTS)
+        assert tuple(batch) == RESULTS
+        assert len(batch) == 4
+        assert ResultBatch(iter(RESULTS)) == batch
+
+    def test_empty(self) -> None:
+        """An empty batch collects to an empty tuple."""
+        assert ResultBatch().collect() == Ok(())
+        assert len(ResultBatch()) == 0
+
+    def test_getitem(self) -> None:
+        """Items may be retrieved by index or by slice."""
+        batch = ResultBatch(RESULTS)
+        assert batch[0] == Ok(1)
+        assert batch[-1] == Err("b")
+        assert batch[1:3] == ResultBatch(RESULTS[1:3])
+        with pytest.raises(IndexError):
+            batch[4]  # pylint: disable=pointless-statement
+
+    @pytest.mark.parametrize(
+        "pred, exp",
+        (
+            (lambda x: x > 1, ResultBatch([Err(1), Ok(2), Ok(3)])),
+            (lambda x: x > 5, ResultBatch([Err(1), Err(2), Err(3)])),
+        ),
+    )
+    def test_ok_if(
+        self, pred: t.Callable[[int], bool], exp: ResultBatch
+    ) -> None:
+        """Values are Ok where the predicate is True."""
+        assert ResultBatch.ok_if(pred, iter([1, 2, 3])) == exp
+        assert tuple(exp) == tuple(Result.ok_if(pred, v) for v in (1, 2, 3))
+
+    def test_err_if(self) -> None:
+        """Values are Err where the predicate is True."""
+        batch = ResultBatch.err_if(lambda x: x > 1, [1, 2, 3])
+        assert tuple(batch) == (Ok(1), Err(2), Err(3))
+
+    def test_map(self) -> None:
+        """Only Ok values are mapped."""
+        batch = ResultBatch(RESULTS).map(lambda x: x * 10)
+        assert tuple(batch) == tuple(r.map(lambda x: x * 10) for r in RESULTS)
+
+    def test_map_err(self) -> None:
+        """Only Err values are mapped."""
+        batch = ResultBatch(RESULTS).map_err(str.upper)
+        assert tuple(batch) == tuple(r.map_err(str.upper) for r in RESULTS)
+
+    def test_and_then(self) -> None:
+        """Ok values are replaced by the result of the function."""
+
+        def _fn(val: int) -> Result[int, str]:
+            return Ok(val * 10) if val > 1 else Err("small")
+
+        batch = ResultBatch(RESULTS).and_then(_fn)
+        assert tuple(batch) == tuple(r.and_then(_fn) for r in RESULTS)
+
+    def test_operations_do_not_modify(self) -> None:
+        """Operations return a new batch."""
+        batch = ResultBatch(RESULTS)
+        batch.map(lambda x: x * 10)
+        batch.and_then(lambda x: Err("no"))
+        assert tuple(batch) == RESULTS
+
+    @pytest.mark.parametrize(
+        "results",
+        (RESULTS, (Ok(1), Ok(2)), (Err("a"),), (Ok(1), Ok(2), Err("c"))),
+    )
+    def test_collect(self, results: t.Tuple[Result[int, str], ...]) -> None:
+        """Collecting matches Result.collect()."""
+        assert ResultBatch(results).collect() == Result.collect(results)
+
+    def test_partition(self) -> None:
+        """Ok and Err values are separated, preserving order."""
+        batch = ResultBatch(RESULTS)
+        assert batch.partition() == ((1, 3), ("a", "b"))
+        assert batch.oks() == (1, 3)
+        assert batch.errs() == ("a", "b")
+        assert batch.count_ok() == batch.count_err() == 2
+
+    def test_equality(self) -> None:
+        """Batches are equal if their items are equal."""
+        assert ResultBatch(RESULTS) == ResultBatch(RESULTS)
+        assert ResultBatch(RESULTS) != ResultBatch(RESULTS[1:])
+        assert ResultBatch([Ok(1)]) != ResultBatch([Err(1)])
+        assert ResultBatch([Ok(1)]) != OptionBatch([Some(1)])
+
+    def test_repr(self) -> None:
+        """The repr shows the items."""
+        assert repr(ResultBatch([Ok(1), Err(2)])) == (
+            "ResultBatch([Ok(1), Err(2)])"
+        )
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol: int) -> None:
+        """Batches survive a pickle round trip."""
+        batch = ResultBatch(RESULTS)
+        copied = pickle.loads(pickle.dumps(batch, protocol))
+        assert copied == batch
+        assert copied.count_err() == 2
+
+    def test_pickle_out_of_band(self) -> None:
+        """With protocol 5, the tags may be passed out-of-band."""
+        buffers: t.List[t.Any] = []
+        batch = ResultBatch(RESULTS)
+        data = pickle.dumps(batch, 5, buffer_callback=buffers.append)
+        assert len(buffers) == 1
+        copied = pickle.loads(data, buffers=buffers)
+        assert copied == batch
+        assert copied.collect() == Err("a")
+
+
+class TestOptionBatch:
+    """Test the OptionBatch type."""
+
+    def test_round_trip(self) -> None:
+        """Options survive conversion to and from a batch."""
+        batch = OptionBatch(OPTIONS)
+        assert tuple(batch) == OPTIONS
+        assert len(batch) == 4
+        assert OptionBatch(iter(OPTIONS)) == batch
+
+    def test_getitem(self) -> None:
+        """Items may be retrieved by index or by slice."""
+        batch = OptionBatch(OPTIONS)
+        assert batch[0] == Some(1)
+        assert batch[1] is Nothing()
+        assert batch[2:] == OptionBatch(OPTIONS[2:])
+
+    def test_of(self) -> None:
+        """None values become Nothing()."""
+        batch = OptionBatch.of([1, None, 0, False])
+        assert tuple(batch) == (Some(1), Nothing(), Some(0), Some(False))
+
+    def test_some_if(self) -> None:
+        """Values are Some where the predicate is True."""
+        batch = OptionBatch.some_if(lambda x: x > 1, iter([1, 2, 3]))
+        assert tuple(batch) == (Nothing(), Some(2), Some(3))
+        assert batch == OptionBatch([Nothing(), Some(2), Some(3)])
+
+    def test_nothing_if(self) -> None:
+        """Values are Nothing where the predicate is True."""
+        batch = OptionBatch.nothing_if(lambda x: x > 1, [1, 2, 3])
+        assert tuple(batch) == (Some(1), Nothing(), Nothing())
+        assert batch == OptionBatch([Some(1), Nothing(), Nothing()])
+
+    def test_map(self) -> None:
+        """Only Some values are mapped."""
+        batch = OptionBatch(OPTIONS).map(lambda x: x * 10)
+        assert tuple(batch) == tuple(o.map(lambda x: x * 10) for o in OPTIONS)
+
+    def test_and_then(self) -> None:
+        """Some values are replaced by the result of the function."""
+
+        def _fn(val: int) -> Option[int]:
+            return Some(val * 10) if val > 1 else Nothing()
+
+        batch = OptionBatch(OPTIONS).and_then(_fn)
+        assert tuple(batch) == tuple(o.and_then(_fn) for o in OPTIONS)
+
+    def test_filter(self) -> None:
+        """Some values failing the predicate become Nothing."""
+        batch = OptionBatch(OPTIONS).filter(lambda x: x > 1)
+        assert tuple(batch) == tuple(o.filter(lambda x: x > 1) for o in OPTIONS)
+        assert batch == OptionBatch(o.filter(lambda x: x > 1) for o in OPTIONS)
+
+    @pytest.mark.parametrize(
+        "options", (OPTIONS, (Some(1), Some(2)), (Nothing(),), ())
+    )
+    def test_collect(self, options: t.Tuple[Option[int], ...]) -> None:
+        """Collecting matches Option.collect()."""
+        assert OptionBatch(options).collect() == Option.collect(options)
+
+    def test_partition(self) -> None:
+        """Some values are separated and Nothings counted."""
+        batch = OptionBatch(OPTIONS)
+        assert batch.partition() == ((1, 3), 2)
+        assert batch.somes() == (1, 3)
+        assert batch.count_some() == batch.count_nothing() == 2
+
+    def test_repr(self) -> None:
+        """The repr shows the items."""
+        assert repr(OptionBatch([Some(1), Nothing()])) == (
+            "OptionBatch([Some(1), Nothing()])"
+        )
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle(self, protocol: int) -> None:
+        """Batches survive a pickle round trip."""
+        batch = OptionBatch(OPTIONS)
+        copied = pickle.loads(pickle.dumps(batch, protocol))
+        assert copied == batch
+        assert copied[1] is Nothing()
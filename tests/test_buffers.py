@@ -0,0 +1,217 @@
+"""Test Results and Options as Arrow-style buffers."""
+
+import pickle
+import typing as t
+from array import array
+
+import pytest
+
+from safetywrap import (
+    Err,
+    Nothing,
+    Ok,
+    Option,
+    OptionBatch,
+    Result,
+    ResultBatch,
+    Some,
+)
+from safetywrap.buffers import (
+    OptionBuffers,
+    ResultBuffers,
+    pack_bitmap,
+    unpack_bitmap,
+)
+
+
+RESULTS: t.List[Result[float, int]] = [Ok(1.5), Err(404), Ok(-2.0), Err(7)]
+OPTIONS: t.List[Option[int]] = [Some(1), Nothing(), Some(3)]
+
+
+class TestBitmap:
+    """Test packing and unpacking validity bitmaps."""
+
+    @pytest.mark.parametrize("length", [0, 1, 7, 8, 9, 16, 17, 100])
+    def test_round_trip(self, length: int) -> None:
+        """Tags survive packing and unpacking."""
+        tags = bytes(idx % 3 == 0 for idx in range(length))
+        bitmap = pack_bitmap(tags)
+        assert len(bitmap) == (length + 7) // 8
+        assert unpack_bitmap(bitmap, length) == tags
+
+    def test_bit_order(self) -> None:
+        """The first item is the least significant bit of the first byte."""
+        assert pack_bitmap(bytes([1, 0, 0, 0, 0, 0, 0, 0, 0, 1])) == (
+            b"\x01\x02"
+        )
+
+    def test_trailing_bits_ignored(self) -> None:
+        """Bits past the length are ignored when unpacking."""
+        assert unpack_bitmap(b"\xff", 3) == b"\x01\x01\x01"
+
+
+class TestResultBuffers:
+    """Test ResultBuffers."""
+
+    def test_round_trip(self) -> None:
+        """Results survive conversion to and from buffers."""
+        buffers = ResultBuffers.from_results(RESULTS)
+        assert list(buffers) == RESULTS
+        assert len(buffers) == 4
+        assert [buffers[idx] for idx in range(-4, 4)] == RESULTS * 2
+
+    def test_buffers(self) -> None:
+        """Buffers are exposed as read-only typed memoryviews."""
+        buffers = ResultBuffers.from_results(RESULTS, "f", "i")
+        assert bytes(buffers.validity) == b"\x05"
+        assert buffers.tags() == b"\x01\x00\x01\x00"
+        assert buffers.values.format == "f"
+        assert buffers.values.tolist() == [1.5, 0.0, -2.0, 0.0]
+        assert buffers.errors.format == "i"
+        assert buffers.errors.tolist() == [0, 404, 0, 7]
+        assert buffers.values.readonly
+        assert buffers.errors.readonly
+
+    def test_from_batch(self) -> None:
+        """Batches are packed from their columns."""
+        batch = ResultBatch(RESULTS)
+        buffers = ResultBuffers.from_results(batch)
+        assert buffers == ResultBuffers.from_results(RESULTS)
+        assert buffers.to_batch() == batch
+
+    def test_from_buffers(self) -> None:
+        """Existing buffers are wrapped without copying."""
+        values = array("d", [1.5, 0.0, -2.0, 0.0])
+        errors = array("q", [0, 404, 0, 7])
+        buffers = ResultBuffers.from_buffers(4, b"\x05", values, errors)
+        assert list(buffers) == RESULTS
+        values[0] = 9.0
+        assert buffers[0] == Ok(9.0)
+
+    def test_from_raw_bytes(self) -> None:
+        """Untyped buffers are read as the given types."""
+        values = array("i", [3, 0]).tobytes()
+        errors = array("b", [0, -1]).tobytes()
+        buffers = ResultBuffers.from_buffers(
+            2, b"\x01", values, errors, "i", "b"
+        )
+        assert list(buffers) == [Ok(3), Err(-1)]
+
+    def test_no_validity(self) -> None:
+        """A missing validity bitmap means every item is valid."""
+        buffers = ResultBuffers.from_buffers(
+            2, None, array("d", [1, 2]), array("q", [0, 0])
+        )
+        assert list(buffers) == [Ok(1.0), Ok(2.0)]
+
+    def test_short_buffers(self) -> None:
+        """Buffers too short for the length are rejected."""
+        with pytest.raises(ValueError):
+            ResultBuffers.from_buffers(
+                9, b"\xff", array("d", [0] * 9), array("q", [0] * 9)
+            )
+        with pytest.raises(ValueError):
+            ResultBuffers.from_buffers(
+                2, b"\x03", array("d", [0]), array("q", [0, 0])
+            )
+
+    def test_longer_buffers(self) -> None:
+        """Buffers longer than the length are truncated."""
+        buffers = ResultBuffers.from_buffers(
+            1, b"\xff\xff", array("d", [1, 2]), array("q", [0, 0])
+        )
+        assert list(buffers) == [Ok(1.0)]
+        assert len(buffers.validity) == 1
+        assert len(buffers.values) == 1
+
+    def test_trailing_bits_cleared(self) -> None:
+        """Validity bits past the last item are cleared, only if set."""
+        validity = bytearray(b"\xfd")
+        buffers = ResultBuffers.from_buffers(
+            3, validity, array("d", [1, 2, 3]), array("q", [0, 5, 0])
+        )
+        assert bytes(buffers.validity) == b"\x05"
+        assert validity == b"\xfd"
+        assert list(buffers) == [Ok(1.0), Err(5), Ok(3.0)]
+        validity = bytearray(b"\x05")
+        buffers = ResultBuffers.from_buffers(
+            3, validity, array("d", [1, 2, 3]), array("q", [0, 5, 0])
+        )
+        validity[0] = 7
+        assert bytes(buffers.validity) == b"\x07"
+
+    def test_numpy(self) -> None:
+        """Buffers are shared with NumPy arrays in both directions."""
+        np = pytest.importorskip("numpy")
+        buffers = ResultBuffers.from_results(RESULTS)
+        assert np.frombuffer(buffers.values).tolist() == [1.5, 0, -2, 0]
+        values = np.array([1.0, 2.0])
+        wrapped = ResultBuffers.from_buffers(
+            2, b"\x03", values, np.zeros(2, dtype=np.int64)
+        )
+        assert list(wrapped) == [Ok(1.0), Ok(2.0)]
+
+    def test_index_error(self) -> None:
+        """Indexing past either end raises IndexError."""
+        buffers = ResultBuffers.from_results(RESULTS)
+        with pytest.raises(IndexError):
+            buffers[4]  # pylint: disable=pointless-statement
+        with pytest.raises(IndexError):
+            buffers[-5]  # pylint: disable=pointless-statement
+
+    def test_empty(self) -> None:
+        """Empty buffers are supported."""
+        buffers = ResultBuffers.from_results([])
+        assert len(buffers) == 0
+        assert list(buffers) == []
+        assert bytes(buffers.validity) == b""
+
+    def test_pickle(self) -> None:
+        """Buffers are pickled as copies of their contents."""
+        buffers = ResultBuffers.from_results(RESULTS, "f", "i")
+        loaded = pickle.loads(pickle.dumps(buffers))
+        assert loaded == buffers
+        assert loaded.values.format == "f"
+        assert loaded.errors.format == "i"
+
+    def test_not_instantiable(self) -> None:
+        """Buffers may only be created with their constructors."""
+        with pytest.raises(NotImplementedError):
+            ResultBuffers()
+
+    def test_bad_value(self) -> None:
+        """Values that do not fit the type are rejected."""
+        with pytest.raises(TypeError):
+            ResultBuffers.from_results([Ok("a")])
+
+
+class TestOptionBuffers:
+    """Test OptionBuffers."""
+
+    def test_round_trip(self) -> None:
+        """Options survive conversion to and from buffers."""
+        buffers = OptionBuffers.from_options(OPTIONS, "q")
+        assert list(buffers) == OPTIONS
+        assert [buffers[idx] for idx in range(-3, 3)] == OPTIONS * 2
+        assert bytes(buffers.validity) == b"\x05"
+        assert buffers.values.tolist() == [1, 0, 3]
+
+    def test_batch(self) -> None:
+        """Batches are packed from, and unpacked to, their columns."""
+        batch = OptionBatch(OPTIONS)
+        buffers = OptionBuffers.from_options(batch, "q")
+        assert buffers == OptionBuffers.from_options(OPTIONS, "q")
+        assert buffers.to_batch() == batch
+
+    def test_from_buffers(self) -> None:
+        """Existing buffers are wrapped without copying."""
+        buffers = OptionBuffers.from_buffers(
+            3, bytearray(b"\x05"), array("q", [1, 0, 3]), "q"
+        )
+        assert list(buffers) == OPTIONS
+        assert buffers.validity.readonly
+
+    def test_pickle(self) -> None:
+        """Buffers are pickled as copies of their contents."""
+        buffers = OptionBuffers.from_options(OPTIONS, "q")
+        assert pickle.loads(pickle.dumps(buffers)) == buffers
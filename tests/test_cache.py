@@ -0,0 +1,289 @@
+"""Test memoizing functions returning Results and Options."""
+
+import threading
+import typing as t
+
+import pytest
+
+from safetywrap import Err, Nothing, Ok, Option, Result, Some
+from safetywrap.cache import ResultCacheInfo, result_cache
+
+from .conftest import Clock
+
+
+class Backend:
+    """A stand-in for a slow lookup, counting its calls."""
+
+    def __init__(self, values: t.Dict[str, t.Any]) -> None:
+        """Look up `values`. Exceptions are returned as Errs."""
+        self.values = values
+        self.calls: t.List[str] = []
+
+    def get(self, key: str) -> Option[t.Any]:
+        """Return Some value for the key, or Nothing."""
+        self.calls.append(key)
+        return Option.of(self.values.get(key))
+
+    def fetch(self, key: str) -> Result[t.Any, Exception]:
+        """Return Ok of the value for the key, or its exception as an Err."""
+        self.calls.append(key)
+        val = self.values.get(key)
+        if isinstance(val, Exception):
+            return Err(val)
+        return Ok(val)
+
+
+class TestResultCache:
+    """Test result_cache()."""
+
+    def test_ok_cached(self) -> None:
+        """Ok values are cached."""
+        backend = Backend({"a": 1})
+        fetch = result_cache()(backend.fetch)
+        assert fetch("a") == fetch("a") == Ok(1)
+        assert backend.calls == ["a"]
+        assert fetch.cache_info() == ResultCacheInfo(  # type: ignore
+            hits=1,
+            misses=1,
+            maxsize=128,
+            currsize=1,
+            evictions=0,
+            expirations=0,
+        )
+
+    def test_err_not_cached_by_default(self) -> None:
+        """Errs are not cached unless asked for."""
+        backend = Backend({"a": KeyError("a")})
+        fetch = result_cache()(backend.fetch)
+        assert fetch("a").is_err()
+        assert fetch("a").is_err()
+        assert backend.calls == ["a", "a"]
+        assert fetch.cache_info().currsize == 0  # type: ignore
+
+    def test_err_cached(self, clock: Clock) -> None:
+        """Errs are cached for `err_ttl` if `cache_err` is True."""
+        backend = Backend({"a": KeyError("a"), "b": 2})
+        fetch = result_cache(
+            ttl=100, cache_err=True, err_ttl=10, timer=clock
+        )(backend.fetch)
+        fetch("a"), fetch("b")
+        clock.now = 9
+        fetch("a"), fetch("b")
+        assert backend.calls == ["a", "b"]
+        clock.now = 10
+        fetch("a"), fetch("b")
+        assert backend.calls == ["a", "b", "a"]
+        assert fetch.cache_info().expirations == 1  # type: ignore
+
+    def test_err_ttl_defaults_to_ttl(self, clock: Clock) -> None:
+        """Errs are cached for `ttl` if no `err_ttl` is given."""
+        backend = Backend({"a": KeyError("a")})
+        fetch = result_cache(ttl=5, cache_err=True, timer=clock)(
+            backend.fetch
+        )
+        fetch("a")
+        clock.now = 4.9
+        fetch("a")
+        clock.now = 5
+        fetch("a")
+        assert backend.calls == ["a", "a"]
+
+    def test_err_ttls(self, clock: Clock) -> None:
+        """Errs are cached by their type, or their nearest base class."""
+        backend = Backend(
+            {
+                "key": KeyError("key"),
+                "timeout": TimeoutError(),
+                "os": FileNotFoundError(),
+                "value": ValueError(),
+            }
+        )
+        fetch = result_cache(
+            cache_err=True,
+            err_ttl=100,
+            err_ttls={LookupError: 50, TimeoutError: 0, OSError: 10},
+            timer=clock,
+        )(backend.fetch)
+        keys = ("key", "timeout", "os", "value")
+        for key in keys:
+            fetch(key)
+        clock.now = 20
+        for key in keys:
+            fetch(key)
+        # Timeouts are never cached, and FileNotFoundErrors are OSErrors
+        assert backend.calls == ["key", "timeout", "os", "value"] + [
+            "timeout",
+            "os",
+        ]
+        clock.now = 60
+        backend.calls.clear()
+        for key in keys:
+            fetch(key)
+        # OSErrors were refetched at 20, and expired again at 30
+        assert backend.calls == ["key", "timeout", "os"]
+
+    def test_err_ttls_need_cache_err(self) -> None:
+        """Per-type TTLs only apply if Errs are cached."""
+        backend = Backend({"a": KeyError("a")})
+        fetch = result_cache(err_ttls={KeyError: 10})(backend.fetch)
+        fetch("a"), fetch("a")
+        assert backend.calls == ["a", "a"]
+
+    def test_nothing_ttl(self, clock: Clock) -> None:
+        """Nothing is cached for `nothing_ttl`, and Some for `ttl`."""
+        backend = Backend({"a": 1})
+        get = result_cache(ttl=100, nothing_ttl=5, timer=clock)(backend.get)
+        assert get("a") == Some(1)
+        assert get("b") == Nothing()
+        clock.now = 5
+        assert get("a") == Some(1)
+        assert get("b") == Nothing()
+        assert backend.calls == ["a", "b", "b"]
+
+    def test_nothing_not_cached(self) -> None:
+        """A `nothing_ttl` of 0 disables caching Nothing."""
+        backend = Backend({"a": 1})
+        get = result_cache(nothing_ttl=0)(backend.get)
+        get("a"), get("a"), get("b"), get("b")
+        assert backend.calls == ["a", "b", "b"]
+
+    def test_nothing_ttl_defaults_to_ttl(self, clock: Clock) -> None:
+        """Nothing is cached for `ttl` if no `nothing_ttl` is given."""
+        backend = Backend({})
+        get = result_cache(ttl=5, timer=clock)(backend.get)
+        get("a")
+        clock.now = 4
+        get("a")
+        clock.now = 5
+        get("a")
+        assert backend.calls == ["a", "a"]
+
+    def test_other_values(self) -> None:
+        """Values other than Results and Options are cached like Oks."""
+        calls = []
+
+        @result_cache()
+        def double(val: int) -> int:
+            calls.append(val)
+            return val * 2
+
+        assert double(2) == double(2) == 4
+        assert calls == [2]
+
+    def test_lru(self) -> None:
+        """The least recently used entry is evicted first."""
+        backend = Backend({"a": 1, "b": 2, "c": 3})
+        get = result_cache(maxsize=2)(backend.get)
+        get("a"), get("b"), get("a"), get("c")
+        backend.calls.clear()
+        get("a"), get("c"), get("b")
+        assert backend.calls == ["b"]
+        info = get.cache_info()  # type: ignore
+        assert info.currsize == 2
+        assert info.evictions == 2
+
+    def test_maxsize_zero(self) -> None:
+        """A `maxsize` of 0 disables caching."""
+        backend = Backend({"a": 1})
+        get = result_cache(maxsize=0)(backend.get)
+        get("a"), get("a")
+        assert backend.calls == ["a", "a"]
+
+    def test_unbounded(self) -> None:
+        """A `maxsize` of None never evicts."""
+        backend = Backend({})
+        get = result_cache(maxsize=None)(backend.get)
+        for idx in range(1000):
+            get(str(idx))
+        assert get.cache_info().currsize == 1000  # type: ignore
+
+    def test_unbounded_expired_swept(self, clock: Clock) -> None:
+        """Expired entries do not accumulate in an unbounded cache."""
+        backend = Backend({})
+        get = result_cache(maxsize=None, ttl=1, timer=clock)(backend.get)
+        for idx in range(200):
+            get(str(idx))
+        clock.now = 1
+        for idx in range(200, 400):
+            get(str(idx))
+        info = get.cache_info()  # type: ignore
+        assert info.currsize == 200
+        assert info.expirations == 200
+
+    def test_kwargs_and_typed(self) -> None:
+        """Keyword arguments are part of the key, and types if `typed`."""
+        calls = []
+
+        @result_cache(typed=True)
+        def fn(val: t.Any, scale: int = 1) -> Result[t.Any, str]:
+            calls.append((val, scale))
+            return Ok(val * scale)
+
+        fn(1), fn(1), fn(1.0), fn(1, scale=2), fn(1, scale=2), fn(1, 2)
+        assert calls == [(1, 1), (1.0, 1), (1, 2), (1, 2)]
+
+    def test_cache_clear(self) -> None:
+        """Clearing the cache empties it and resets its statistics."""
+        backend = Backend({"a": 1})
+        get = result_cache()(backend.get)
+        get("a"), get("a")
+        get.cache_clear()  # type: ignore
+        assert get.cache_info() == ResultCacheInfo(  # type: ignore
+            0, 0, 128, 0, 0, 0
+        )
+        get("a")
+        assert backend.calls == ["a", "a"]
+
+    def test_cache_invalidate(self) -> None:
+        """A single entry may be discarded."""
+        backend = Backend({"a": 1, "b": 2})
+        get = result_cache()(backend.get)
+        get("a"), get("b")
+        assert get.cache_invalidate("a")  # type: ignore
+        assert not get.cache_invalidate("a")  # type: ignore
+        get("a"), get("b")
+        assert backend.calls == ["a", "b", "a"]
+
+    def test_wraps(self) -> None:
+        """The decorated function keeps its name and docstring."""
+        get = result_cache()(Backend({}).get)
+        assert get.__name__ == "get"
+        assert get.__doc__ == Backend.get.__doc__
+
+    def test_methods(self) -> None:
+        """Methods are cached per instance."""
+
+        class Store(Backend):
+            @result_cache()
+            def get(self, key: str) -> Option[t.Any]:
+                return super().get(key)
+
+        first, second = Store({"a": 1}), Store({"a": 2})
+        assert first.get("a") == first.get("a") == Some(1)
+        assert second.get("a") == Some(2)
+        assert first.calls == ["a"]
+
+    def test_unhashable(self) -> None:
+        """Unhashable arguments raise a TypeError."""
+        get = result_cache()(Backend({}).get)
+        with pytest.raises(TypeError):
+            get([])  # type: ignore
+
+    def test_threads(self) -> None:
+        """Concurrent calls keep the cache consistent."""
+        backend = Backend({str(idx): idx for idx in range(50)})
+        get = result_cache(maxsize=20)(backend.get)
+
+        def work() -> None:
+            for idx in range(1000):
+                assert get(str(idx % 50)) == Some(idx % 50)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = get.cache_info()  # type: ignore
+        assert info.hits + info.misses == 8000
+        assert info.currsize == 20
+        assert info.misses == len(backend.calls)
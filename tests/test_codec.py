@@ -0,0 +1,136 @@
+"""Test the JSON and binary codecs for Results and Options."""
+
+import io
+import json
+import pickle
+import typing as t
+
+import pytest
+
+from safetywrap import Err, Nothing, Ok, Option, Result, Some
+from safetywrap import codec
+
+
+ITEMS: t.List[t.Any] = [
+    Ok(1),
+    Err("no"),
+    Some({"a": [1, 2]}),
+    Nothing(),
+    Ok(Some(Err(None))),
+    Some(None),
+]
+
+
+class TestJson:
+    """Test the tagged JSON encoding."""
+
+    def test_round_trip(self) -> None:
+        """Results and Options survive a round trip, however nested."""
+        assert codec.loads(codec.dumps(ITEMS)) == ITEMS
+        assert codec.loads(codec.dumps({"x": Ok([Nothing()])})) == {
+            "x": Ok([Nothing()])
+        }
+
+    def test_hooks(self) -> None:
+        """The hooks plug into the json module."""
+        text = json.dumps(Ok(1), default=codec.json_default)
+        assert json.loads(text) == {"$ok": 1}
+        decoded = json.loads(text, object_hook=codec.json_object_hook)
+        assert decoded == Ok(1)
+        assert json.loads("{}", object_hook=codec.json_object_hook) == {}
+
+    def test_nothing_singleton(self) -> None:
+        """Nothing() decodes as the singleton."""
+        assert codec.loads(codec.dumps(Nothing())) is Nothing()
+
+    def test_other_objects(self) -> None:
+        """Other objects are rejected, and other dicts left alone."""
+        with pytest.raises(TypeError):
+            codec.dumps(Ok(object()))
+        assert codec.loads('{"$ok": 1, "b": 2}') == {"$ok": 1, "b": 2}
+        assert codec.loads('{"ok": 1}') == {"ok": 1}
+
+    def test_ambiguous_dicts(self) -> None:
+        """Dicts with a single tagged key decode as Results or Options."""
+        assert codec.loads(codec.dumps({"$ok": 1})) == Ok(1)
+        assert codec.loads(codec.dumps({"$nothing": 1})) is Nothing()
+
+    def test_json_lines(self) -> None:
+        """Items are written and read a line at a time."""
+        buf = io.StringIO()
+        assert codec.write_json_lines(ITEMS, buf) == len(ITEMS)
+        assert buf.getvalue().count("\n") == len(ITEMS)
+        buf.seek(0)
+        lines = codec.read_json_lines(buf)
+        assert next(lines) == Ok(1)
+        assert list(lines) == ITEMS[1:]
+
+    def test_json_lines_blank(self) -> None:
+        """Blank lines are skipped."""
+        buf = io.StringIO('{"$ok":1}\n\n{"$nothing":null}\n')
+        assert list(codec.read_json_lines(buf)) == [Ok(1), Nothing()]
+
+
+class TestFrames:
+    """Test the binary framing."""
+
+    def test_round_trip(self) -> None:
+        """Results and Options survive a round trip."""
+        buf = io.BytesIO()
+        assert codec.write_frames(ITEMS, buf) == len(ITEMS)
+        buf.seek(0)
+        assert list(codec.read_frames(buf)) == ITEMS
+
+    def test_layout(self) -> None:
+        """Each frame is a tag, a length, and a payload."""
+        buf = io.BytesIO()
+        codec.write_frames([Ok(12), Nothing()], buf)
+        assert buf.getvalue() == b"\x01\x02\x00\x00\x0012\x02\x00\x00\x00\x00"
+
+    def test_custom_encoding(self) -> None:
+        """Payloads may be encoded in other ways."""
+        items: t.List[Result[bytes, bytes]] = [Ok(b"\x00"), Err(b"")]
+        buf = io.BytesIO()
+        codec.write_frames(items, buf, encode=bytes)
+        buf.seek(0)
+        assert list(codec.read_frames(buf, decode=bytes)) == items
+
+        buf = io.BytesIO()
+        codec.write_frames([Ok(1 + 2j)], buf, encode=pickle.dumps)
+        buf.seek(0)
+        assert list(codec.read_frames(buf, decode=pickle.loads)) == [
+            Ok(1 + 2j)
+        ]
+
+    def test_lazy(self) -> None:
+        """Frames are read one at a time."""
+        buf = io.BytesIO()
+        codec.write_frames(ITEMS, buf)
+        buf.seek(0)
+        frames = codec.read_frames(buf)
+        assert next(frames) == Ok(1)
+        assert buf.tell() == 6
+
+    @pytest.mark.parametrize(
+        "data",
+        (b"\x01\x00", b"\x01\x05\x00\x00\x00123", b"\x09\x00\x00\x00\x00"),
+    )
+    def test_invalid(self, data: bytes) -> None:
+        """Truncated frames and invalid tags raise a ValueError."""
+        with pytest.raises(ValueError):
+            list(codec.read_frames(io.BytesIO(data)))
+
+    def test_not_an_item(self) -> None:
+        """Only Results and Options may be written."""
+        with pytest.raises(TypeError):
+            codec.write_frames([1], io.BytesIO())  # type: ignore
+
+    def test_option_types(self) -> None:
+        """Options decode as Options."""
+        buf = io.BytesIO()
+        options: t.List[Option[int]] = [Some(1), Nothing()]
+        codec.write_frames(options, buf)
+        buf.seek(0)
+        decoded = list(codec.read_frames(buf))
+        assert decoded == options
+        assert decoded[1] is Nothing()
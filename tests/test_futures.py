@@ -0,0 +1,312 @@
+"""Test Results and Options from concurrent.futures Futures."""
+
+import pickle
+import threading
+import time
+import typing as t
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+
+from safetywrap import Err, Nothing, Ok, Option, Result, ResultBatch, Some
+from safetywrap.futures import (
+    ExceptionRecord,
+    as_completed_results,
+    process_map,
+)
+
+
+def _done(val: t.Any = None, exc: t.Optional[Exception] = None) -> Future:
+    """Return a finished future."""
+    fut: Future = Future()
+    if exc is None:
+        fut.set_result(val)
+    else:
+        fut.set_exception(exc)
+    return fut
+
+
+class _Unpicklable(Exception):
+    """An exception which pickles, but fails to unpickle."""
+
+    def __init__(self, code: int, detail: str) -> None:
+        super().__init__(f"{code}: {detail}")
+
+
+def _parse(val: str) -> int:
+    """Parse an integer, failing with an unpicklable exception on "?"."""
+    if val == "?":
+        raise _Unpicklable(1, "unknown")
+    return int(val)
+
+
+class TestResultFromFuture:
+    """Test Result.from_future."""
+
+    def test_ok(self) -> None:
+        """A future's value is wrapped in Ok."""
+        assert Result.from_future(_done(1)) == Ok(1)
+
+    def test_err(self) -> None:
+        """A future's exception is wrapped in Err."""
+        exc = ValueError("no")
+        assert Result.from_future(_done(exc=exc)) == Err(exc)
+
+    def test_uncaught(self) -> None:
+        """Exceptions not matching `catch` are raised."""
+        with pytest.raises(ValueError):
+            Result.from_future(_done(exc=ValueError()), catch=KeyError)
+
+    def test_timeout(self) -> None:
+        """Timing out returns an Err."""
+        result: Result[t.Any, Exception]
+        result = Result.from_future(Future(), timeout=0)
+        assert isinstance(result.unwrap_err(), FutureTimeoutError)
+        with pytest.raises(FutureTimeoutError):
+            Result.from_future(Future(), timeout=0, catch=KeyError)
+
+    def test_cancelled(self) -> None:
+        """A cancelled future returns an Err."""
+        fut: Future = Future()
+        fut.cancel()
+        assert isinstance(Result.from_future(fut).unwrap_err(), CancelledError)
+
+    def test_waits(self) -> None:
+        """With no timeout, the future is waited for."""
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            event = threading.Event()
+            fut = pool.submit(event.wait)
+            event.set()
+            assert Result.from_future(fut) == Ok(True)
+
+
+class TestOptionFromFuture:
+    """Test Option.from_future."""
+
+    def test_some(self) -> None:
+        """A future's value is wrapped in Some."""
+        assert Option.from_future(_done(1), timeout=0) == Some(1)
+
+    def test_timeout(self) -> None:
+        """Timing out returns Nothing."""
+        assert Option.from_future(Future(), timeout=0) is Nothing()
+
+    def test_exception(self) -> None:
+        """A future's exception is raised."""
+        with pytest.raises(ValueError):
+            Option.from_future(_done(exc=ValueError()))
+
+
+class TestAsCompletedResults:
+    """Test as_completed_results."""
+
+    def test_mapping(self) -> None:
+        """Keys of a mapping are yielded with each Result."""
+        exc = ValueError()
+        futures = {"a": _done(1), "b": _done(exc=exc)}
+        assert dict(as_completed_results(futures)) == {
+            "a": Ok(1),
+            "b": Err(exc),
+        }
+
+    def test_iterable(self) -> None:
+        """Positions in an iterable are yielded with each Result."""
+        futures = iter([_done(1), _done(2)])
+        assert sorted(as_completed_results(futures)) == [(0, Ok(1)), (1, Ok(2))]
+
+    def test_completion_order(self) -> None:
+        """Results are yielded as soon as each future finishes."""
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            release = threading.Event()
+            futures: t.List[Future] = [
+                pool.submit(release.wait),
+                pool.submit(int, "2"),
+            ]
+            stream: t.Iterator[t.Tuple[int, Result[t.Any, Exception]]]
+            stream = as_completed_results(futures)
+            assert next(stream) == (1, Ok(2))
+            release.set()
+            assert next(stream) == (0, Ok(True))
+
+    def test_timeout(self) -> None:
+        """An overall timeout is raised."""
+        stream: t.Iterator[t.Tuple[int, Result[t.Any, Exception]]]
+        stream = as_completed_results([_done(1), Future()], timeout=0.01)
+        assert next(stream) == (0, Ok(1))
+        with pytest.raises(FutureTimeoutError):
+            next(stream)
+
+
+class TestCollectParallel:
+    """Test Result.collect_parallel."""
+
+    def test_ok(self) -> None:
+        """Values are collected in input order."""
+
+        def _slow_first(val: int) -> int:
+            time.sleep(0.01 * (5 - val))
+            return val * 2
+
+        result = Result.collect_parallel(_slow_first, range(5), max_workers=5)
+        assert result == Ok((0, 2, 4, 6, 8))
+
+    def test_returns_results(self) -> None:
+        """Functions may return Results."""
+        result: Result[t.Tuple[int, ...], str] = Result.collect_parallel(
+            lambda v: Ok(v) if v > 0 else Err("no"), [1, 2]
+        )
+        assert result == Ok((1, 2))
+
+    def test_caught(self) -> None:
+        """Exceptions of type `catch` become Errs."""
+        result = Result.collect_parallel(int, ["1", "x"], catch=ValueError)
+        assert isinstance(result.unwrap_err(), ValueError)
+        with pytest.raises(ValueError):
+            Result.collect_parallel(int, ["1", "x"], catch=KeyError)
+
+    def test_first_err_in_order(self) -> None:
+        """The first Err in input order is returned, not the fastest."""
+
+        def _check(val: int) -> Result[int, str]:
+            if val == 0:
+                time.sleep(0.05)
+                return Err("first")
+            return Err("second")
+
+        result: Result[t.Tuple[int, ...], str]
+        result = Result.collect_parallel(_check, [0, 1], max_workers=2)
+        assert result == Err("first")
+
+    def test_stops_submitting(self) -> None:
+        """No more items are read or submitted after an Err."""
+        called: t.List[int] = []
+        read: t.List[int] = []
+
+        def _source() -> t.Iterator[int]:
+            for val in range(100):
+                read.append(val)
+                yield val
+
+        def _check(val: int) -> Result[int, str]:
+            called.append(val)
+            return Err("no") if val == 0 else Ok(val)
+
+        result: Result[t.Tuple[int, ...], str]
+        result = Result.collect_parallel(_check, _source(), window=2)
+        assert result == Err("no")
+        assert read == [0, 1]
+        assert set(called) <= {0, 1}
+
+    def test_cancels_pending(self) -> None:
+        """Queued calls for later items are cancelled after an Err."""
+        called: t.List[int] = []
+
+        def _check(val: int) -> Result[int, str]:
+            called.append(val)
+            time.sleep(0.2 if val == 1 else 0)
+            return Err("no") if val == 0 else Ok(val)
+
+        result: Result[t.Tuple[int, ...], str] = Result.collect_parallel(
+            _check, range(3), max_workers=1, window=3
+        )
+        assert result == Err("no")
+        assert 2 not in called
+
+    def test_executor(self) -> None:
+        """A given executor is used, and not shut down."""
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            result = Result.collect_parallel(int, "123", executor=pool)
+            assert result == Ok((1, 2, 3))
+            assert pool.submit(int, "4").result() == 4
+
+    def test_empty(self) -> None:
+        """No items give an empty tuple."""
+        assert Result.collect_parallel(int, []) == Ok(())
+
+    def test_bad_window(self) -> None:
+        """The window must be positive."""
+        with pytest.raises(ValueError):
+            Result.collect_parallel(int, ["1"], window=0)
+
+
+class TestProcessMap:
+    """Test process_map."""
+
+    def test_processes(self) -> None:
+        """Chunks are run in worker processes, and returned in order."""
+        batches: t.List[ResultBatch[int, Exception]] = list(
+            process_map(_parse, ["1", "x", "3", "4", "5"], chunksize=2)
+        )
+        assert all(isinstance(batch, ResultBatch) for batch in batches)
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        results = [res for batch in batches for res in batch]
+        assert results[0] == Ok(1)
+        assert isinstance(results[1].unwrap_err(), ValueError)
+        assert results[2:] == [Ok(3), Ok(4), Ok(5)]
+
+    def test_unpicklable(self) -> None:
+        """Exceptions that cannot be sent back are recorded instead."""
+        batches: t.List[ResultBatch[int, Exception]]
+        batches = list(process_map(_parse, ["?", "2"], max_workers=1))
+        (batch,) = batches
+        err = batch[0].unwrap_err()
+        assert isinstance(err, ExceptionRecord)
+        assert err.type_name.endswith("._Unpicklable")
+        assert err.message == "1: unknown"
+        assert batch[1] == Ok(2)
+
+    def test_exception_record(self) -> None:
+        """Records pickle, and describe the original exception."""
+        record = ExceptionRecord.from_exception(KeyError("a"))
+        assert str(record) == "builtins.KeyError: 'a'"
+        copied = pickle.loads(pickle.dumps(record))
+        assert copied.type_name == "builtins.KeyError"
+        assert copied.message == "'a'"
+
+    def test_stop_on_err(self) -> None:
+        """Iteration stops at the first Err."""
+        batches: t.Iterator[ResultBatch[int, Exception]]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            batches = process_map(
+                int,
+                ["1", "2", "x", "4", "5", "6"],
+                chunksize=2,
+                executor=pool,
+                stop_on_err=True,
+            )
+            results = [res for batch in batches for res in batch]
+        assert results[:2] == [Ok(1), Ok(2)]
+        assert len(results) == 3
+        assert isinstance(results[2].unwrap_err(), ValueError)
+
+    def test_uncaught(self) -> None:
+        """Exceptions not matching `catch` are raised."""
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            batches = process_map(int, ["x"], executor=pool, catch=KeyError)
+            with pytest.raises(ValueError):
+                list(batches)
+
+    def test_window(self) -> None:
+        """The input is read no further ahead than the window."""
+        read: t.List[int] = []
+
+        def _source() -> t.Iterator[str]:
+            for val in range(100):
+                read.append(val)
+                yield str(val)
+
+        batches: t.Iterator[ResultBatch[int, Exception]]
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            batches = process_map(
+                int, _source(), chunksize=3, executor=pool, window=2
+            )
+            assert list(next(batches)) == [Ok(0), Ok(1), Ok(2)]
+            batches.close()  # type: ignore
+        assert len(read) <= 9
+
+    @pytest.mark.parametrize("kwargs", ({"chunksize": 0}, {"window": 0}))
+    def test_bad_args(self, kwargs: t.Dict[str, int]) -> None:
+        """Chunk sizes and windows must be positive, checked up front."""
+        with pytest.raises(ValueError):
+            process_map(int, ["1"], **kwargs)  # type: ignore
@@ -22,5 +22,11 @@ class TestPublicInterface:
             "Err",
             "Some",
             "Nothing",
+            "NOTHING",
+            "ResultBatch",
+            "OptionBatch",
+            "SparseOptionVector",
+            "AsyncResult",
+            "intern_consts",
         )
         assert all(map(lambda attr: bool(getattr(safetywrap, attr)), exp_attrs))
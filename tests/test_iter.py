@@ -0,0 +1,108 @@
+"""Test the lazy iterator adapters."""
+
+import typing as t
+from itertools import count, islice
+
+import pytest
+
+from safetywrap import Err, Nothing, Ok, Option, Result, Some
+from safetywrap import iter as siter
+
+
+RESULTS: t.Tuple[Result[int, str], ...] = (Ok(1), Err("a"), Ok(3), Err("b"))
+
+
+def _endless() -> t.Iterator[Result[int, str]]:
+    """Yield Results forever, with an Err every third item."""
+    for idx in count():
+        yield Err(str(idx)) if idx % 3 == 2 else Ok(idx)
+
+
+class TestAdapters:
+    """Test the per-item adapters."""
+
+    def test_map_ok(self) -> None:
+        """Ok values are mapped."""
+        mapped = siter.map_ok(lambda v: v * 10, RESULTS)
+        assert tuple(mapped) == tuple(r.map(lambda v: v * 10) for r in RESULTS)
+
+    def test_map_err(self) -> None:
+        """Err values are mapped."""
+        mapped = siter.map_err(str.upper, RESULTS)
+        assert tuple(mapped) == tuple(r.map_err(str.upper) for r in RESULTS)
+
+    def test_and_then_each(self) -> None:
+        """Ok values are replaced by the result of the function."""
+
+        def _fn(val: int) -> Result[int, str]:
+            return Ok(val) if val > 1 else Err("small")
+
+        chained = siter.and_then_each(_fn, RESULTS)
+        assert tuple(chained) == tuple(r.and_then(_fn) for r in RESULTS)
+
+    def test_filter_ok(self) -> None:
+        """Oks failing the predicate are dropped, and Errs kept."""
+        filtered = siter.filter_ok(lambda v: v > 1, RESULTS)
+        assert tuple(filtered) == (Err("a"), Ok(3), Err("b"))
+
+    def test_oks_and_errs(self) -> None:
+        """Values of one variant are extracted."""
+        assert tuple(siter.oks(RESULTS)) == (1, 3)
+        assert tuple(siter.errs(RESULTS)) == ("a", "b")
+
+    def test_somes(self) -> None:
+        """Some values are extracted."""
+        options: t.List[Option[int]] = [Some(1), Nothing(), Some(3)]
+        assert tuple(siter.somes(options)) == (1, 3)
+
+    def test_lazy(self) -> None:
+        """Adapters work on endless streams."""
+        stream = siter.oks(siter.map_ok(lambda v: v + 1, _endless()))
+        assert list(islice(stream, 4)) == [1, 2, 4, 5]
+
+
+class TestShortCircuiting:
+    """Test the adapters that stop at an Err."""
+
+    def test_take_while_ok(self) -> None:
+        """Ok values are yielded until the first Err."""
+        assert list(siter.take_while_ok(_endless())) == [0, 1]
+        assert list(siter.take_while_ok([Ok(1), Ok(2)])) == [1, 2]
+
+    def test_try_iter(self) -> None:
+        """The Err iteration stopped at is kept."""
+        values = siter.try_iter(_endless())
+        assert values.error is Nothing()
+        assert list(values) == [0, 1]
+        assert values.error == Some("2")
+        assert values.result() == Err("2")
+        assert list(values) == []
+
+    def test_try_iter_exhausted(self) -> None:
+        """With no Err, the result is Ok."""
+        values: siter.TryIter[int, str] = siter.try_iter(iter([Ok(1), Ok(2)]))
+        assert list(values) == [1, 2]
+        assert values.error is Nothing()
+        assert values.result() == Ok(None)
+
+    @pytest.mark.parametrize(
+        "size, exp",
+        (
+            (2, [Err("a"), Err("b")]),
+            (1, [Ok((1,)), Err("a"), Ok((3,)), Err("b")]),
+            (3, [Err("a"), Err("b")]),
+            (4, [Err("a")]),
+        ),
+    )
+    def test_try_chunks(
+        self, size: int, exp: t.List[Result[t.Tuple[int, ...], str]]
+    ) -> None:
+        """Each chunk is collected, and consumed in full."""
+        assert list(siter.try_chunks(size, iter(RESULTS))) == exp
+
+    def test_try_chunks_ok(self) -> None:
+        """The last chunk may be short."""
+        results: t.List[Result[int, str]] = [Ok(1), Ok(2), Ok(3)]
+        assert list(siter.try_chunks(2, results)) == [Ok((1, 2)), Ok((3,))]
+        with pytest.raises(ValueError):
+            list(siter.try_chunks(0, results))
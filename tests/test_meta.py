@@ -1,11 +1,19 @@
 """Test meta-requirements of the implementations."""
 
+import functools
+import pickle
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy, deepcopy
 
 import pytest
 
 from safetywrap._interface import _Option, _Result
-from safetywrap import Some, Nothing, Option, Ok, Err, Result
+from safetywrap import Some, Nothing, NOTHING, Option, Ok, Err, Result
+
+
+class _CustomNothing(Nothing[t.Any]):
+    """A subclass of Nothing, defined here so it can be pickled."""
 
 
 class TestInterfaceConformance:
@@ -20,16 +28,31 @@ class TestInterfaceConformance:
 
     @staticmethod
     def _public_method_names(obj: object) -> t.Tuple[str, ...]:
-        """Return public method names from an object."""
+        """Return public instance method names from an object.
+
+        Static and class methods are excluded, since they are defined on
+        the shared `Result` and `Option` bases rather than on each
+        implementation, and are checked separately.
+        """
+        return tuple(
+            sorted(
+                name
+                for name, attr in obj.__dict__.items()
+                if not name.startswith("_")
+                and callable(attr)
+                and not isinstance(attr, (staticmethod, classmethod))
+            )
+        )
+
+    @staticmethod
+    def _constructor_names(obj: type) -> t.Tuple[str, ...]:
+        """Return public static and class method names from a class."""
         return tuple(
             sorted(
-                map(
-                    lambda i: i[0],
-                    filter(
-                        lambda i: not i[0].startswith("_") and callable(i[1]),
-                        obj.__dict__.items(),
-                    ),
-                )
+                name
+                for name, attr in obj.__dict__.items()
+                if not name.startswith("_")
+                and isinstance(attr, (staticmethod, classmethod))
             )
         )
 
@@ -57,6 +80,29 @@ class TestInterfaceConformance:
             _Option
         )
 
+    @pytest.mark.parametrize(
+        "interface, base, impls",
+        ((_Result, Result, (Ok, Err)), (_Option, Option, (Some, Nothing))),
+    )
+    def test_constructors(
+        self, interface: type, base: type, impls: t.Tuple[type, ...]
+    ) -> None:
+        """Every constructor in the interface is implemented, and no more."""
+        expected = self._constructor_names(interface)
+        for impl in impls:
+            defined = set(self._constructor_names(base)) | set(
+                self._constructor_names(impl)
+            )
+            assert tuple(sorted(defined)) == expected
+            for name in expected:
+                assert getattr(impl, name) != getattr(interface, name)
+
+    @pytest.mark.parametrize("impl", (Ok, Err, Some, Nothing))
+    def test_match_args(self, impl: type) -> None:
+        """Pattern matching destructures the public value, if any."""
+        exp = () if impl is Nothing else ("value",)
+        assert impl.__match_args__ == exp  # type: ignore
+
 
 class TestNoBaseInstantiations:
     """Base types are not instantiable"""
@@ -138,8 +184,134 @@ class TestImplementationDetails:
     def test_nothing_singleton(self) -> None:
         """Ensure Nothing() is a singleton."""
         assert Nothing() is Nothing() is Nothing()
+        assert Nothing() is Nothing(None) is NOTHING
+        assert Nothing.of_const() is NOTHING
+
+    def test_nothing_singleton_threaded(self) -> None:
+        """Nothing() is the same singleton in every thread."""
+        with ThreadPoolExecutor(8) as pool:
+            results = set(map(id, pool.map(lambda _: Nothing(), range(1000))))
+        assert results == {id(NOTHING)}
+
+    def test_nothing_subclass_singleton(self) -> None:
+        """Each subclass of Nothing has its own singleton."""
+        custom = _CustomNothing()
+        assert custom is _CustomNothing()
+        assert custom is not NOTHING
+        assert isinstance(custom, Nothing)
+        assert custom == NOTHING
+        assert custom.is_nothing()
+        assert pickle.loads(pickle.dumps(custom)) is custom
+
+    def test_nothing_constant_returned(self) -> None:
+        """Methods returning Nothing return the singleton."""
+        assert Ok(1).err() is NOTHING
+        assert Err(1).ok() is NOTHING
+        assert Some(1).filter(lambda _: False) is NOTHING
+        assert Some(1).xor(Some(2)) is NOTHING
+        assert NOTHING.xor(NOTHING) is NOTHING
+        assert Option.of(None) is NOTHING
+        assert Option.collect([Some(1), NOTHING]) is NOTHING
 
     @pytest.mark.parametrize("obj", (Some(1), Nothing(), Ok(1), Err(1)))
     def test_all_slotted(self, obj: t.Any) -> None:
         """All implementations use __slots__."""
         assert not hasattr(obj, "__dict__")
+
+    @pytest.mark.parametrize("obj", (Some(1), Nothing(), Ok(1), Err(1)))
+    def test_immutable(self, obj: t.Any) -> None:
+        """Instances may not be modified after construction."""
+        with pytest.raises(AttributeError):
+            obj._value = 2
+        with pytest.raises(AttributeError):
+            del obj._value
+        with pytest.raises(AttributeError):
+            obj.foo = 2
+
+    @pytest.mark.parametrize(
+        "obj, equal, unequal",
+        (
+            (Ok(1), Ok(1), (Err(1), Some(1), Ok(2))),
+            (Err(1), Err(1), (Ok(1), Some(1), Err(2))),
+            (Some(1), Some(1), (Ok(1), Nothing(), Some(2))),
+            (Nothing(), Nothing(), (Some(None), Ok(None), Err(None))),
+        ),
+    )
+    def test_hashable(
+        self, obj: t.Any, equal: t.Any, unequal: t.Tuple[t.Any, ...]
+    ) -> None:
+        """Instances hash consistently with equality."""
+        assert hash(obj) == hash(equal)
+        lookup = {obj: "found"}
+        assert lookup[equal] == "found"
+        assert all(map(lambda o: o not in lookup, unequal))
+
+    def test_unhashable_payload(self) -> None:
+        """Wrapping an unhashable value makes the wrapper unhashable."""
+        with pytest.raises(TypeError):
+            hash(Ok([1]))
+
+    def test_lru_cache_argument(self) -> None:
+        """Instances may be used as lru_cache arguments."""
+        calls = []
+
+        @functools.lru_cache()
+        def _cached(res: Result[int, str]) -> int:
+            calls.append(res)
+            return res.unwrap_or(0)
+
+        assert _cached(Ok(1)) == _cached(Ok(1)) == 1
+        assert _cached(Err("no")) == 0
+        assert calls == [Ok(1), Err("no")]
+
+    @pytest.mark.parametrize(
+        "obj", (Some(1), Nothing(), Ok("a"), Err((1, "a")), Ok([1]))
+    )
+    def test_copy(self, obj: t.Any) -> None:
+        """Shallow copies return the same instance."""
+        assert copy(obj) is obj
+
+    @pytest.mark.parametrize(
+        "obj", (Some(1), Nothing(), Ok("a"), Err((1, "a")), Ok(None))
+    )
+    def test_deepcopy_immutable(self, obj: t.Any) -> None:
+        """Deep copies of immutable values return the same instance."""
+        assert deepcopy(obj) is obj
+
+    @pytest.mark.parametrize("obj", (Some([1]), Ok({"a": 1}), Err([[]])))
+    def test_deepcopy_mutable(self, obj: t.Any) -> None:
+        """Deep copies of mutable values copy the wrapped value."""
+        copied = deepcopy(obj)
+        assert copied == obj
+        assert copied is not obj
+        assert type(copied) is type(obj)
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    @pytest.mark.parametrize("obj", (Some(1), Ok("a"), Err((1, "a"))))
+    def test_pickle(self, obj: t.Any, protocol: int) -> None:
+        """Instances survive a pickle round trip."""
+        copied = pickle.loads(pickle.dumps(obj, protocol))
+        assert copied == obj
+        assert type(copied) is type(obj)
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle_nothing(self, protocol: int) -> None:
+        """Nothing() is still the singleton after a pickle round trip."""
+        assert pickle.loads(pickle.dumps(Nothing(), protocol)) is Nothing()
+        custom = _CustomNothing()
+        assert pickle.loads(pickle.dumps(custom, protocol)) is custom
+
+    def test_pickle_nothing_by_name(self) -> None:
+        """Nothing() is pickled as a reference, without a constructor call."""
+        data = pickle.dumps(Nothing(), pickle.HIGHEST_PROTOCOL)
+        assert b"NOTHING" in data
+        assert pickle.REDUCE not in data
+
+    def test_pickle_size(self) -> None:
+        """Repeated instances add little more than their values."""
+        results: t.List[t.Any] = [
+            Ok(idx) if idx % 2 else Err(idx) for idx in range(200)
+        ]
+        results += [Nothing()] * 100
+        size = len(pickle.dumps(results, pickle.HIGHEST_PROTOCOL))
+        assert size < 300 * 10
@@ -0,0 +1,212 @@
+"""Test the NumPy-backed OptionArray and ResultArray types."""
+
+import typing as t
+import warnings
+
+import pytest
+
+from safetywrap import Err, Nothing, Ok, Option, Result, Some
+
+np = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from safetywrap.numeric import OptionArray, ResultArray  # noqa: E402
+
+
+OPTIONS: t.List[Option[float]] = [Some(1.0), Nothing(), Some(4.0), Nothing()]
+RESULTS: t.List[Result[float, int]] = [Ok(1.0), Err(7), Ok(4.0), Err(9)]
+
+
+class TestOptionArray:
+    """Test the OptionArray type."""
+
+    def test_round_trip(self) -> None:
+        """Options survive conversion to and from an array."""
+        arr = OptionArray.from_options(OPTIONS)
+        assert list(arr) == OPTIONS
+        assert len(arr) == 4
+        assert arr.mask.tolist() == [True, False, True, False]
+
+    def test_of(self) -> None:
+        """None becomes Nothing()."""
+        assert list(OptionArray.of([1, None, 0], dtype=int)) == [
+            Some(1),
+            Nothing(),
+            Some(0),
+        ]
+
+    def test_no_copy_and_read_only(self) -> None:
+        """Input arrays are viewed, not copied, and may not be modified."""
+        values = np.array([1.0, 2.0])
+        arr = OptionArray(values, [True, False])
+        assert np.shares_memory(arr.values, values)
+        with pytest.raises(ValueError):
+            arr.values[0] = 5.0
+        values[0] = 5.0
+        assert arr[0] == Some(5.0)
+
+    def test_shape_mismatch(self) -> None:
+        """Values and mask must match."""
+        with pytest.raises(ValueError):
+            OptionArray([1.0, 2.0], [True])
+
+    def test_getitem(self) -> None:
+        """Items may be retrieved by index, slice, or mask."""
+        arr = OptionArray.from_options(OPTIONS)
+        assert arr[0] == Some(1.0)
+        assert arr[1] is Nothing()
+        assert arr[np.int64(2)] == Some(4.0)
+        assert list(arr[1:3]) == OPTIONS[1:3]
+        assert list(arr[arr.mask]) == [Some(1.0), Some(4.0)]
+
+    def test_map(self) -> None:
+        """Functions are applied to Some values."""
+        arr = OptionArray.from_options(OPTIONS).map(np.sqrt)
+        assert list(arr) == [o.map(lambda v: v ** 0.5) for o in OPTIONS]
+
+    def test_map_ignores_invalid_slots(self) -> None:
+        """Warnings from invalid slots are not reported."""
+        arr = OptionArray([0.0, 2.0], [False, True])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            mapped = arr.map(lambda v: 1 / v)
+        assert list(mapped) == [Nothing(), Some(0.5)]
+
+    def test_filter(self) -> None:
+        """Some values failing the predicate become Nothing."""
+        arr = OptionArray.from_options(OPTIONS).filter(lambda v: v > 2)
+        assert list(arr) == [o.filter(lambda v: v > 2) for o in OPTIONS]
+
+    def test_unwrap_or(self) -> None:
+        """Nothing is replaced by the default."""
+        arr = OptionArray.from_options(OPTIONS)
+        assert arr.unwrap_or(-1.0).tolist() == [1.0, -1.0, 4.0, -1.0]
+
+    def test_collect(self) -> None:
+        """Collecting matches Option.collect()."""
+        assert OptionArray.from_options(OPTIONS).collect() == Nothing()
+        collected = OptionArray.of([1.0, 2.0]).collect()
+        assert collected.unwrap().tolist() == [1.0, 2.0]
+
+    def test_reductions(self) -> None:
+        """Reductions run over Some values only."""
+        arr = OptionArray.from_options(OPTIONS)
+        assert arr.sum() == 5.0
+        assert arr.min() == Some(1.0)
+        assert arr.max() == Some(4.0)
+        assert arr.mean() == Some(2.5)
+        assert arr.reduce(np.multiply) == Some(4.0)
+        assert arr.count_some() == arr.count_nothing() == 2
+
+    def test_reductions_empty(self) -> None:
+        """Reductions over no Some values return Nothing."""
+        arr = OptionArray.of([None, None])
+        assert arr.sum() == 0
+        assert arr.min() is arr.max() is arr.mean() is Nothing()
+
+    def test_equality(self) -> None:
+        """Invalid slots do not affect equality."""
+        assert OptionArray([1.0, 2.0], [True, False]) == OptionArray(
+            [1.0, 3.0], [True, False]
+        )
+        assert OptionArray([1.0], [True]) != OptionArray([1.0], [False])
+
+    def test_equality_nan(self) -> None:
+        """NaN values are equal to each other."""
+        nan = float("nan")
+        assert OptionArray.of([nan, None]) == OptionArray.of([nan, None])
+        assert OptionArray.of([nan]) != OptionArray.of([1.0])
+
+
+class TestResultArray:
+    """Test the ResultArray type."""
+
+    def test_round_trip(self) -> None:
+        """Results survive conversion to and from an array."""
+        arr = ResultArray.from_results(RESULTS)
+        assert list(arr) == RESULTS
+        assert arr.errors.dtype == np.int64
+        assert len(arr) == 4
+
+    def test_getitem(self) -> None:
+        """Items may be retrieved by index or slice."""
+        arr = ResultArray.from_results(RESULTS)
+        assert arr[0] == Ok(1.0)
+        assert arr[1] == Err(7)
+        assert list(arr[2:]) == RESULTS[2:]
+
+    def test_ok_if(self) -> None:
+        """Values are Ok where the predicate is True."""
+        arr = ResultArray.ok_if(lambda v: v > 0, [1.0, -1.0], err=3)
+        assert list(arr) == [Ok(1.0), Err(3)]
+
+    def test_map_and_map_err(self) -> None:
+        """Functions are applied to the matching variant only."""
+        arr = ResultArray.from_results(RESULTS)
+        assert list(arr.map(lambda v: v * 2)) == [
+            r.map(lambda v: v * 2) for r in RESULTS
+        ]
+        assert list(arr.map_err(lambda e: e + 1)) == [
+            r.map_err(lambda e: e + 1) for r in RESULTS
+        ]
+
+    def test_filter(self) -> None:
+        """Ok values failing the predicate become Err."""
+        arr = ResultArray.from_results(RESULTS).filter(lambda v: v > 2, 0)
+        assert list(arr) == [Err(0), Err(7), Ok(4.0), Err(9)]
+
+    def test_collect(self) -> None:
+        """Collecting returns the first Err."""
+        assert ResultArray.from_results(RESULTS).collect() == Err(7)
+        collected = ResultArray.from_results([Ok(1.0), Ok(2.0)]).collect()
+        assert collected.unwrap().tolist() == [1.0, 2.0]
+
+    def test_ok_and_err(self) -> None:
+        """Each variant may be viewed as an OptionArray."""
+        arr = ResultArray.from_results(RESULTS)
+        assert list(arr.ok()) == [r.ok() for r in RESULTS]
+        assert list(arr.err()) == [r.err() for r in RESULTS]
+        assert arr.oks().tolist() == [1.0, 4.0]
+        assert arr.errs().tolist() == [7, 9]
+
+    def test_reductions(self) -> None:
+        """Reductions run over Ok values only."""
+        arr = ResultArray.from_results(RESULTS)
+        assert arr.sum() == 5.0
+        assert arr.min() == Some(1.0)
+        assert arr.max() == Some(4.0)
+        assert arr.mean() == Some(2.5)
+        assert arr.count_ok() == arr.count_err() == 2
+
+    def test_unwrap_or(self) -> None:
+        """Errors are replaced by the default."""
+        arr = ResultArray.from_results(RESULTS)
+        assert arr.unwrap_or(0.0).tolist() == [1.0, 0.0, 4.0, 0.0]
+
+    def test_equality(self) -> None:
+        """Arrays with the same items are equal."""
+        assert ResultArray.from_results(RESULTS) == ResultArray.from_results(
+            RESULTS
+        )
+        assert ResultArray.from_results(RESULTS) != ResultArray.from_results(
+            RESULTS[:2]
+        )
+
+    def test_equality_nan(self) -> None:
+        """NaN values are equal to each other."""
+        results = [Ok(float("nan")), Err(1)]
+        assert ResultArray.from_results(results) == ResultArray.from_results(
+            results
+        )
+
+    def test_object_errors(self) -> None:
+        """Errors of any type may be held with an object dtype."""
+        results = [Ok(1.0), Err("not found"), Err(ValueError)]
+        arr = ResultArray.from_results(results, err_dtype=object)
+        assert list(arr) == results
+        assert arr == ResultArray.from_results(results, err_dtype=object)
+
+    def test_unconvertible_errors(self) -> None:
+        """Errors which are not integers need another dtype."""
+        with pytest.raises(TypeError, match="err_dtype=object"):
+            ResultArray.from_results([Ok(1.0), Err("not found")])
@@ -79,6 +79,65 @@ class TestOptionConstructors:
         """Test constructing from an iterable of options."""
         assert Option.collect(options) == exp
 
+    def test_collect_short_circuits(self) -> None:
+        """Ensure collect does not iterate after Nothing is reached."""
+        until_nothing: t.List[Option[int]] = [Some(1), Some(2), Nothing()]
+
+        def _iterable() -> t.Iterable[Option[int]]:
+            yield from until_nothing
+            assert False, "Option.collect() did not short circuit!"
+
+        assert Option.collect(_iterable()) == Nothing()
+
+    def test_collect_does_not_swallow_errors(self) -> None:
+        """Errors raised while iterating propagate out of collect."""
+
+        def _iterable() -> t.Iterable[Option[int]]:
+            yield Some(1)
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            Option.collect(_iterable())
+
+    @pytest.mark.parametrize(
+        "options, exp",
+        (
+            ((Some(1), Nothing(), Some(3), Nothing()), ((1, 3), 2)),
+            (iter([Some(1), Some(2)]), ((1, 2), 0)),
+            ((Nothing(),), ((), 1)),
+            ((), ((), 0)),
+        ),
+    )
+    def test_partition(
+        self, options: t.Iterable[Option[int]], exp: t.Tuple[t.Any, int]
+    ) -> None:
+        """Some values are separated and Nothings counted."""
+        assert Option.partition(options) == exp
+
+    def test_partition_indexed(self) -> None:
+        """Some values are paired with their index, and Nothings indexed."""
+        options: t.List[Option[int]] = [Some(1), Nothing(), Some(3)]
+        assert Option.partition_indexed(iter(options)) == (
+            ((0, 1), (2, 3)),
+            (1,),
+        )
+
+    @pytest.mark.parametrize("val", (None, True, False, 0, 256, "", ()))
+    def test_of_const_shared(self, val: t.Any) -> None:
+        """Interned constants return the same instance every time."""
+        assert Some.of_const(val) is Some.of_const(val)
+        assert Some.of_const(val) == Some(val)
+
+    def test_of_const_not_interned(self) -> None:
+        """Other values get a new instance."""
+        assert Some.of_const([1]) == Some([1])
+        assert Some.of_const([1]) is not Some.of_const([1])
+
+    def test_of_const_nothing(self) -> None:
+        """Nothing.of_const() is the singleton."""
+        assert Nothing.of_const() is Nothing()
+        assert Nothing.of_const(None) is Nothing()
+
 
 class TestOption:
     """Test the option type."""
@@ -236,6 +295,12 @@ class TestOption:
         """Maps fn() onto `Some()` & return the value, or return a default."""
         assert opt.map_or_else(lambda: -1, lambda s: len(s)) == exp
 
+    @pytest.mark.parametrize("opt, exp", ((Some("hi"), 2), (Nothing(), -1)))
+    def test_match(self, opt: Option[str], exp: int) -> None:
+        """.match() calls `some` with the value, or calls `nothing`."""
+        assert opt.match(len, lambda: -1) == exp
+        assert opt.match(some=len, nothing=lambda: -1) == exp
+
     @pytest.mark.parametrize(
         "opt, exp", ((Some(2), Ok(2)), (Nothing(), Err("oh no")))
     )
@@ -269,6 +334,17 @@ class TestOption:
         """Unwraps a `Some()` or returns a default."""
         assert opt.unwrap_or_else(lambda: 42) == exp
 
+    @pytest.mark.parametrize("opt, exp", ((Some(2), 2), (Nothing(), None)))
+    def test_value(self, opt: Option[int], exp: t.Optional[int]) -> None:
+        """.value is the wrapped value, or None."""
+        assert opt.value == exp
+
+    @pytest.mark.parametrize("opt", (Some(2), Nothing()))
+    def test_value_read_only(self, opt: Option[int]) -> None:
+        """.value may not be assigned."""
+        with pytest.raises(AttributeError):
+            opt.value = 3  # type: ignore
+
     @pytest.mark.parametrize(
         "inst, other, eq",
         (
@@ -0,0 +1,50 @@
+"""Test structural pattern matching, which requires Python 3.10."""
+
+import typing as t
+
+import pytest
+
+from safetywrap import Err, Nothing, Ok, Option, Result, Some
+
+
+def _describe_result(res: Result[t.Any, t.Any]) -> str:
+    match res:
+        case Ok(0):
+            return "zero"
+        case Ok(val):
+            return f"ok {val}"
+        case Err(err):
+            return f"err {err}"
+    return "unreachable"  # pragma: no cover
+
+
+def _describe_option(opt: Option[t.Any]) -> str:
+    match opt:
+        case Some([first, *_]):
+            return f"starts with {first}"
+        case Some(val):
+            return f"some {val}"
+        case Nothing():
+            return "nothing"
+    return "unreachable"  # pragma: no cover
+
+
+@pytest.mark.parametrize(
+    "res, exp", ((Ok(0), "zero"), (Ok(1), "ok 1"), (Err("x"), "err x"))
+)
+def test_match_result(res: Result[t.Any, t.Any], exp: str) -> None:
+    """Results are destructured by their variant's value."""
+    assert _describe_result(res) == exp
+
+
+@pytest.mark.parametrize(
+    "opt, exp",
+    (
+        (Some([1, 2]), "starts with 1"),
+        (Some(3), "some 3"),
+        (Nothing(), "nothing"),
+    ),
+)
+def test_match_option(opt: Option[t.Any], exp: str) -> None:
+    """Options are destructured by their value, if any."""
+    assert _describe_option(opt) == exp
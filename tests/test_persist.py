@@ -0,0 +1,439 @@
+"""Test memoizing functions returning Results on disk."""
+
+import os
+import pickle
+import sqlite3
+import subprocess
+import sys
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from safetywrap import Err, Nothing, Ok, Result, Some, codec
+from safetywrap.persist import ResultStore, persistent_cache, stable_key
+
+from .conftest import Clock
+
+
+# The type of the cached lambdas
+IntFn = t.Callable[[int], Result[int, t.Any]]
+
+
+def _encode_json(value: t.Any) -> bytes:
+    """Encode a value as JSON."""
+    return codec.dumps(value).encode()
+
+
+def _accessed(path: str, key: str) -> float:
+    """Return the access time of a key, as written to the database."""
+    conn = sqlite3.connect(path)
+    try:
+        row = conn.execute(
+            "SELECT accessed FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0]  # type: ignore
+    finally:
+        conn.close()
+
+
+def _fill(path: str, start: int) -> int:
+    """Store 50 results in the store at `path`, from another process."""
+    with ResultStore(path) as store:
+        for idx in range(start, start + 50):
+            store.put(str(idx), Ok(idx))
+    return start
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> str:
+    """Return the path of a new store."""
+    return str(tmp_path / "results.db")
+
+
+class TestStableKey:
+    """Test stable_key()."""
+
+    def test_kwargs_sorted(self) -> None:
+        """Keyword argument order does not matter."""
+        assert stable_key("f", (), {"a": 1, "b": 2}) == stable_key(
+            "f", (), {"b": 2, "a": 1}
+        )
+
+    def test_distinct(self) -> None:
+        """Different names and arguments have different keys."""
+        keys = {
+            stable_key("f", (1,), {}),
+            stable_key("g", (1,), {}),
+            stable_key("f", ("1",), {}),
+            stable_key("f", (Ok(1),), {}),
+            stable_key("f", (Err(1),), {}),
+            stable_key("f", (), {"x": 1}),
+        }
+        assert len(keys) == 6
+
+    def test_other_processes(self) -> None:
+        """Keys are the same in every process, whatever its hash seed."""
+        code = (
+            "from safetywrap import Some\n"
+            "from safetywrap.persist import stable_key\n"
+            "print(stable_key('f', ('a', {'b': Some(1.5)}), {'c': None}))\n"
+        )
+        env = dict(os.environ, PYTHONHASHSEED="random")
+        env["PYTHONPATH"] = os.pathsep.join(sys.path)
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            check=True,
+            stdout=subprocess.PIPE,
+        ).stdout.decode()
+        expected = stable_key("f", ("a", {"b": Some(1.5)}), {"c": None})
+        assert out.strip() == expected
+
+    def test_unserializable(self) -> None:
+        """Arguments must be JSON serializable."""
+        with pytest.raises(TypeError):
+            stable_key("f", (object(),), {})
+
+
+class TestResultStore:
+    """Test ResultStore."""
+
+    def test_put_get(self, path: str) -> None:
+        """Values are stored and read back."""
+        with ResultStore(path) as store:
+            store.put("ok", Ok({"a": [1, 2]}))
+            store.put("err", Err("no"))
+            store.put("nothing", Nothing())
+            assert store.get("ok") == Some(Ok({"a": [1, 2]}))
+            assert store.get("err") == Some(Err("no"))
+            assert store.get("nothing") == Some(Nothing())
+            assert store.get("missing") == Nothing()
+            assert len(store) == 3
+
+    def test_persists(self, path: str) -> None:
+        """Values outlive the store that wrote them."""
+        with ResultStore(path) as store:
+            store.put("a", Ok(1))
+        with ResultStore(path) as store:
+            assert store.get("a") == Some(Ok(1))
+
+    def test_overwrite(self, path: str) -> None:
+        """Putting a key again replaces its value."""
+        with ResultStore(path) as store:
+            store.put("a", Ok(1))
+            store.put("a", Ok(22))
+            assert store.get("a") == Some(Ok(22))
+            assert len(store) == 1
+            assert store.nbytes == len(
+                pickle.dumps(Ok(22), pickle.HIGHEST_PROTOCOL)
+            )
+
+    def test_delete_clear(self, path: str) -> None:
+        """Entries may be deleted one at a time or all at once."""
+        with ResultStore(path) as store:
+            store.put("a", Ok(1))
+            store.put("b", Ok(2))
+            assert store.delete("a")
+            assert not store.delete("a")
+            assert len(store) == 1
+            store.clear()
+            assert len(store) == 0
+            assert store.nbytes == 0
+
+    def test_ttl(self, path: str, clock: Clock) -> None:
+        """Entries older than the TTL are missing."""
+        with ResultStore(path, ttl=10, timer=clock) as store:
+            store.put("a", Ok(1))
+            clock.now = 9
+            assert store.get("a") == Some(Ok(1))
+            assert store.get_many(["a"]) == {"a": Ok(1)}
+            clock.now = 10
+            assert store.get("a") == Nothing()
+            assert store.get_many(["a"]) == {}
+
+    def test_max_entries(self, path: str, clock: Clock) -> None:
+        """The least recently used entries are evicted first."""
+        with ResultStore(path, max_entries=2, timer=clock) as store:
+            store.put("a", Ok(1))
+            clock.now = 1
+            store.put("b", Ok(2))
+            clock.now = 2
+            store.get("a")
+            clock.now = 3
+            store.put("c", Ok(3))
+            assert store.get("b") == Nothing()
+            assert store.get("a").is_some()
+            assert store.get("c").is_some()
+            assert len(store) == 2
+
+    def test_max_bytes(self, path: str, clock: Clock) -> None:
+        """Entries are evicted to keep the encoded values within a size."""
+        with ResultStore(path, max_bytes=100, timer=clock) as store:
+            for idx in range(20):
+                clock.now = idx
+                store.put(str(idx), Ok("x" * 20))
+            assert store.nbytes <= 100
+            assert store.get("19").is_some()
+            assert store.get("0") == Nothing()
+
+    def test_get_many(self, path: str) -> None:
+        """Many keys are read at once, leaving out missing ones."""
+        with ResultStore(path) as store:
+            for idx in range(0, 1200, 2):
+                store.put(str(idx), Ok(idx))
+            found = store.get_many(str(idx) for idx in range(1200))
+            assert found == {str(idx): Ok(idx) for idx in range(0, 1200, 2)}
+
+    def test_undecodable(self, path: str) -> None:
+        """Entries that cannot be decoded are missing."""
+        with ResultStore(path, encode=lambda val: b"\xff") as store:
+            store.put("a", Ok(1))
+            assert store.get("a") == Nothing()
+            assert store.get_many(["a"]) == {}
+
+    def test_lossless(self, path: str) -> None:
+        """Values come back as they were stored, whatever their types."""
+        with ResultStore(path) as store:
+            store.put("tuple", Ok((1, "a")))
+            store.put("date", Some(date(2020, 1, 2)))
+            store.put("exception", Err(ValueError("bad")))
+            assert store.get("tuple") == Some(Ok((1, "a")))
+            assert store.get("date") == Some(Some(date(2020, 1, 2)))
+            err = store.get("exception").unwrap().unwrap_err()
+            assert isinstance(err, ValueError)
+            assert err.args == ("bad",)
+
+    def test_custom_encoding(self, path: str) -> None:
+        """Values may be encoded in other ways, such as JSON."""
+        with ResultStore(
+            path, encode=_encode_json, decode=codec.loads
+        ) as store:
+            store.put("a", Ok((1, 2)))
+            assert store.get("a") == Some(Ok([1, 2]))
+            assert store.nbytes == len(b'{"$ok": [1, 2]}')
+
+    def test_reads_batched(self, path: str, clock: Clock) -> None:
+        """Access times are written with the next put, or on closing."""
+        with ResultStore(path, timer=clock) as store:
+            store.put("a", Ok(1))
+            clock.now = 5
+            store.get("a")
+            assert _accessed(path, "a") == 0
+            store.put("b", Ok(2))
+            assert _accessed(path, "a") == 5
+            clock.now = 6
+            store.get_many(["a"])
+        assert _accessed(path, "a") == 6
+
+    def test_lazy(self, path: str) -> None:
+        """The database is only opened when first used."""
+        store = ResultStore(path)
+        assert not os.path.exists(path)
+        assert len(store) == 0
+        assert os.path.exists(path)
+        store.close()
+
+    def test_pickle(self, path: str) -> None:
+        """Stores are pickled by their path and options."""
+        with ResultStore(path, max_entries=5) as store:
+            store.put("a", Ok(1))
+            with pickle.loads(pickle.dumps(store)) as other:
+                assert other.max_entries == 5
+                assert other.get("a") == Some(Ok(1))
+
+    def test_reconnect(self, path: str) -> None:
+        """A closed store reconnects when used again."""
+        store = ResultStore(path)
+        store.close()
+        store.put("a", Ok(1))
+        assert store.get("a") == Some(Ok(1))
+        store.close()
+
+    def test_processes(self, path: str) -> None:
+        """Several processes may write to a store at once."""
+        with ResultStore(path) as store:
+            with ProcessPoolExecutor(max_workers=4) as pool:
+                list(pool.map(_fill, [path] * 4, range(0, 200, 50)))
+            assert len(store) == 200
+            assert store.get_many(str(idx) for idx in range(200)) == {
+                str(idx): Ok(idx) for idx in range(200)
+            }
+
+
+class TestPersistentCache:
+    """Test persistent_cache()."""
+
+    def test_cached(self, path: str) -> None:
+        """Calls are cached, including across restarts."""
+        calls = []
+
+        def double(val: int) -> Result[int, str]:
+            calls.append(val)
+            return Ok(val * 2)
+
+        cached = persistent_cache(path)(double)
+        assert cached(2) == cached(2) == Ok(4)
+        assert calls == [2]
+        cached.store.close()  # type: ignore
+        # A new process, with a new store on the same file
+        restarted = persistent_cache(ResultStore(path))(double)
+        assert restarted(2) == Ok(4)
+        assert calls == [2]
+        restarted.store.close()  # type: ignore
+
+    def test_err_not_cached(self, path: str) -> None:
+        """Errs are only cached if asked for."""
+        calls = []
+
+        def fail(val: int) -> Result[int, str]:
+            calls.append(val)
+            return Err("no")
+
+        cached = persistent_cache(path)(fail)
+        cached(1), cached(1)
+        assert calls == [1, 1]
+        cached_err = persistent_cache(path, cache_err=True)(fail)
+        cached_err(1), cached_err(1)
+        assert calls == [1, 1, 1]
+        cached.store.close()  # type: ignore
+        cached_err.store.close()  # type: ignore
+
+    def test_err_exception(self, path: str) -> None:
+        """Errs of exceptions, as from Result.of, may be stored."""
+        calls = []
+
+        def parse(text: str) -> Result[int, Exception]:
+            calls.append(text)
+            return Result.of(int, text)
+
+        cached = persistent_cache(path, cache_err=True)(parse)
+        first, second = cached("x"), cached("x")
+        assert isinstance(second.unwrap_err(), ValueError)
+        assert str(first.unwrap_err()) == str(second.unwrap_err())
+        assert calls == ["x"]
+        cached.store.close()  # type: ignore
+
+    def test_unstorable(self, path: str) -> None:
+        """Values which cannot be stored are still returned."""
+        func = lambda: None  # noqa: E731
+
+        @persistent_cache(path)
+        def make(val: int) -> Result[t.Any, str]:
+            return Ok(func)
+
+        assert make(1) == Ok(func)
+        assert len(make.store) == 0  # type: ignore
+        make.store.close()  # type: ignore
+
+    def test_lazy(self, path: str) -> None:
+        """The store is not opened until the first call."""
+        cached: IntFn = persistent_cache(path)(lambda val: Ok(val))
+        assert not os.path.exists(path)
+        assert cached(1) == Ok(1)
+        assert os.path.exists(path)
+        cached.store.close()  # type: ignore
+
+    def test_name(self, path: str) -> None:
+        """Functions with different names have separate entries."""
+        store = ResultStore(path)
+        first: IntFn = persistent_cache(store, name="v1")(lambda val: Ok(val))
+        second: IntFn = persistent_cache(store, name="v2")(
+            lambda val: Ok(-val)
+        )
+        assert first(1) == Ok(1)
+        assert second(1) == Ok(-1)
+        assert first.cache_key(1) != second.cache_key(1)  # type: ignore
+        store.close()
+
+    def test_kwargs(self, path: str) -> None:
+        """Keyword arguments are part of the key."""
+        calls: t.List[t.Any] = []
+
+        @persistent_cache(path)
+        def scale(val: int, by: int = 1) -> Result[int, str]:
+            calls.append((val, by))
+            return Ok(val * by)
+
+        scale(2), scale(2, by=3), scale(2, by=3)
+        assert calls == [(2, 1), (2, 3)]
+        scale.store.close()  # type: ignore
+
+    def test_warm(self, path: str) -> None:
+        """Stored values are read in bulk and kept in memory."""
+        calls = []
+
+        def square(val: int) -> Result[int, str]:
+            calls.append(val)
+            return Ok(val * val)
+
+        cached = persistent_cache(path)(square)
+        for val in range(10):
+            cached(val)
+        cached.store.close()  # type: ignore
+        restarted = persistent_cache(path)(square)
+        assert restarted.warm((val,) for val in range(20)) == 10  # type: ignore
+        restarted.store.close()  # type: ignore
+        # Warmed values no longer need the store
+        assert [restarted(val) for val in range(10)] == [
+            Ok(val * val) for val in range(10)
+        ]
+        assert calls == list(range(10))
+
+    def test_warm_expires(self, path: str, clock: Clock) -> None:
+        """Warmed values expire with the store's TTL."""
+        calls = []
+
+        def double(val: int) -> Result[int, str]:
+            calls.append(val)
+            return Ok(val * 2)
+
+        cached = persistent_cache(ResultStore(path, ttl=10, timer=clock))(
+            double
+        )
+        cached(1)
+        assert cached.warm([(1,)]) == 1  # type: ignore
+        clock.now = 9
+        cached(1)
+        clock.now = 10
+        cached(1)
+        assert calls == [1, 1]
+        cached.store.close()  # type: ignore
+
+    def test_warm_bounded(self, path: str) -> None:
+        """At most `max_warm` values are kept, the latest warmed."""
+        calls = []
+
+        def double(val: int) -> Result[int, str]:
+            calls.append(val)
+            return Ok(val * 2)
+
+        cached = persistent_cache(path, max_warm=3)(double)
+        for val in range(10):
+            cached(val)
+        assert cached.warm((val,) for val in range(10)) == 10  # type: ignore
+        cached.store.clear()  # type: ignore
+        calls.clear()
+        assert [cached(val) for val in range(10)] == [
+            Ok(val * 2) for val in range(10)
+        ]
+        assert calls == list(range(7))
+        cached.store.close()  # type: ignore
+
+    def test_warm_bounded_by_store(self, path: str) -> None:
+        """Warmed values are bounded by the store's own limits too."""
+        store = ResultStore(path, max_entries=5)
+        cached: IntFn = persistent_cache(store)(lambda val: Ok(val))
+        for val in range(5):
+            cached(val)
+        cached.warm((val,) for val in range(5))  # type: ignore
+        store.max_entries = 2
+        cached.warm([(4,)])  # type: ignore
+        store.clear()
+        # Only the latest two warmed values, of 3 and 4, are still kept
+        assert cached(2) == Ok(2)
+        assert cached(3) == Ok(3)
+        assert len(store) == 1
+        store.close()
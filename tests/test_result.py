@@ -1,10 +1,12 @@
 """Test the Result type."""
 
+import sys
 import typing as t
 
 import pytest
 
-from safetywrap import Ok, Err, Result, Some, Nothing, Option
+from safetywrap import Ok, Err, Result, Some, Nothing, Option, intern_consts
+from safetywrap import _impl
 
 
 def _sq(val: int) -> Result[int, int]:
@@ -80,6 +82,79 @@ class TestResultConstructors:
 
         assert Result.collect(_iterable()) == Err("no")
 
+    def test_collect_returns_first_err(self) -> None:
+        """The first Err encountered is returned as-is."""
+        err: Result[int, str] = Err("no")
+        assert Result.collect([Ok(1), err, Err("other")]) is err
+
+    @pytest.mark.parametrize(
+        "iterable, exp",
+        (
+            ((Ok(1), Ok(2), Ok(3)), Ok((1, 2, 3))),
+            ((Ok(1), Err("a"), Ok(3), Err("b")), Err(("a", "b"))),
+            (iter([Err("a"), Ok(2)]), Err(("a",))),
+            ([], Ok(())),
+        ),
+    )
+    def test_collect_all(
+        self, iterable: t.Iterable[Result[int, str]], exp: Result[int, str]
+    ) -> None:
+        """Every error is collected, not just the first."""
+        assert Result.collect_all(iterable) == exp
+
+    def test_collect_all_max_errors(self) -> None:
+        """Collection stops once max_errors errors have been found."""
+
+        def _iterable() -> t.Iterable[Result[int, str]]:
+            yield from (Ok(1), Err("a"), Ok(2), Err("b"))
+            assert False, "Result.collect_all() did not stop at max_errors"
+
+        assert Result.collect_all(_iterable(), max_errors=2) == Err(("a", "b"))
+        assert Result.collect_all([Err("a")], max_errors=2) == Err(("a",))
+        with pytest.raises(ValueError):
+            Result.collect_all([], max_errors=0)
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 11), reason="ExceptionGroup requires 3.11"
+    )
+    def test_collect_all_group(self) -> None:
+        """Exceptions may be collected into an ExceptionGroup."""
+
+        def _parse(val: str) -> Result[int, ValueError]:
+            return Result.of(int, val, catch=ValueError)
+
+        res = Result.collect_all(map(_parse, ["1", "a", "2", "b"]), group="bad")
+        group = res.unwrap_err()
+        assert isinstance(group, ExceptionGroup)  # noqa: F821
+        assert group.message == "bad"
+        assert len(group.exceptions) == 2
+        assert Result.collect_all(map(_parse, ["1"]), group="bad") == Ok((1,))
+
+    @pytest.mark.parametrize(
+        "iterable, exp",
+        (
+            ((Ok(1), Err("a"), Ok(3), Err("b")), ((1, 3), ("a", "b"))),
+            (iter([Ok(1), Ok(2)]), ((1, 2), ())),
+            ((Err("a"),), ((), ("a",))),
+            ((), ((), ())),
+        ),
+    )
+    def test_partition(
+        self,
+        iterable: t.Iterable[Result[int, str]],
+        exp: t.Tuple[t.Tuple[int, ...], t.Tuple[str, ...]],
+    ) -> None:
+        """Ok and Err values are separated, preserving order."""
+        assert Result.partition(iterable) == exp
+
+    def test_partition_indexed(self) -> None:
+        """Each value is paired with its original index."""
+        results: t.List[Result[int, str]] = [Ok(1), Err("a"), Ok(3)]
+        assert Result.partition_indexed(iter(results)) == (
+            ((0, 1), (2, 3)),
+            ((1, "a"),),
+        )
+
     @pytest.mark.parametrize(
         "predicate, val, exp",
         (
@@ -110,6 +185,66 @@ class TestResultConstructors:
         """Test constructing based on some predicate."""
         assert Result.err_if(predicate, val) == exp
 
+    @pytest.mark.parametrize("kls", (Ok, Err))
+    @pytest.mark.parametrize("val", (None, True, False, 0, 256, "", ()))
+    def test_of_const_shared(self, kls: t.Type[Result], val: t.Any) -> None:
+        """Interned constants return the same instance every time."""
+        first = kls.of_const(val)
+        assert first is kls.of_const(val)
+        assert first == kls(val)
+        inner = first.unwrap() if first.is_ok() else first.unwrap_err()
+        assert type(inner) is type(val)
+
+    @pytest.mark.parametrize("kls", (Ok, Err))
+    @pytest.mark.parametrize("val", (1000, "abc", [1], {"a": 1}))
+    def test_of_const_not_interned(
+        self, kls: t.Type[Result], val: t.Any
+    ) -> None:
+        """Other values get a new instance."""
+        res = kls.of_const(val)
+        assert res == kls(val)
+        assert res is not kls.of_const(val)
+
+    def test_of_const_distinguishes_types(self) -> None:
+        """Equal values of different types are not conflated."""
+        assert Ok.of_const(1).unwrap() is not True
+        assert Ok.of_const(True).unwrap() is True
+        assert isinstance(Ok.of_const(0.0).unwrap(), float)
+        assert Ok.of_const((True,)).unwrap()[0] is True
+        assert Ok.of_const((1,)).unwrap() == (1,)
+
+    def test_of_const_signed_zero(
+        self, monkeypatch: "pytest.MonkeyPatch"
+    ) -> None:
+        """Equal floats with different signs are not conflated."""
+        consts = {cls: dict(cache) for cls, cache in _impl._CONSTS.items()}
+        monkeypatch.setattr(_impl, "_CONSTS", consts)
+        intern_consts(0.0, (0.0,))
+        assert str(Ok.of_const(-0.0).unwrap()) == "-0.0"
+        assert str(Ok.of_const((-0.0,)).unwrap()[0]) == "-0.0"
+        assert Ok.of_const((0.0,)) is Ok.of_const((0.0,))
+
+    def test_intern_consts(self, monkeypatch: "pytest.MonkeyPatch") -> None:
+        """Additional constants may be interned."""
+        # Intern into a copy, so that no other test sees the new constants
+        consts = {cls: dict(cache) for cls, cache in _impl._CONSTS.items()}
+        monkeypatch.setattr(_impl, "_CONSTS", consts)
+        assert Err.of_const("not-found") is not Err.of_const("not-found")
+        intern_consts("not-found")
+        assert Err.of_const("not-found") is Err.of_const("not-found")
+        assert Ok.of_const("not-found") == Ok("not-found")
+
+    @pytest.mark.parametrize("val", ([], frozenset(), ((1,),), (1, [])))
+    def test_intern_consts_unsupported(self, val: t.Any) -> None:
+        """Only scalars and flat tuples of them may be interned."""
+        with pytest.raises(TypeError):
+            intern_consts(val)
+
+    def test_intern_consts_unhashable(self) -> None:
+        """Only hashable values may be interned."""
+        with pytest.raises(TypeError):
+            intern_consts([])  # type: ignore
+
 
 class TestResult:
     """Test the result type."""
@@ -305,6 +440,18 @@ class TestResult:
         """.map_err() will map onto Err() and ignore Ok()."""
         assert start.map_err(str) == exp
 
+    @pytest.mark.parametrize(
+        "start, exp", ((Ok(2), ("ok", 2)), (Err(3), ("err", 3)))
+    )
+    def test_match(
+        self, start: Result[int, int], exp: t.Tuple[str, int]
+    ) -> None:
+        """.match() calls the function for the variant with its value."""
+        assert start.match(lambda v: ("ok", v), lambda e: ("err", e)) == exp
+        assert (
+            start.match(ok=lambda v: ("ok", v), err=lambda e: ("err", e)) == exp
+        )
+
     @pytest.mark.parametrize(
         "start, exp", ((Ok(1), Some(1)), (Err(1), Nothing()))
     )
@@ -370,6 +517,18 @@ class TestResult:
         """Calculates a result from Err() value if present."""
         assert start.unwrap_or_else(fn) == exp
 
+    @pytest.mark.parametrize("start, exp", ((Ok(2), 2), (Err("foo"), "foo")))
+    def test_value(self, start: Result[int, str], exp: t.Any) -> None:
+        """.value is the wrapped value of either variant."""
+        assert start.value == exp
+
+    @pytest.mark.parametrize("start", (Ok(2), Err(2)))
+    def test_value_read_only(self, start: Result[int, int]) -> None:
+        """.value may not be assigned."""
+        with pytest.raises(AttributeError):
+            start.value = 3  # type: ignore
+        assert start.value == 2
+
     @pytest.mark.parametrize(
         "inst, other, eq",
         (
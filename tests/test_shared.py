@@ -0,0 +1,164 @@
+"""Test batches of Results and Options in shared memory."""
+
+import gc
+import pickle
+import typing as t
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from safetywrap import Err, Nothing, Ok, Option, Result, ResultBatch, Some
+
+pytest.importorskip("multiprocessing.shared_memory")
+
+# pylint: disable=wrong-import-position
+from safetywrap import shared  # noqa: E402
+from safetywrap.shared import (  # noqa: E402
+    SharedOptionBatch,
+    SharedResultBatch,
+)
+
+
+RESULTS: t.List[Result[float, int]] = [Ok(1.5), Err(404), Ok(-2.0), Err(7)]
+OPTIONS: t.List[Option[int]] = [Some(1), Nothing(), Some(3)]
+
+
+def _read(batch: SharedResultBatch[float, int]) -> t.List[Result[float, int]]:
+    """Read a batch in another process."""
+    with batch:
+        return list(batch)
+
+
+class TestSharedResultBatch:
+    """Test SharedResultBatch."""
+
+    def test_round_trip(self) -> None:
+        """Results survive conversion to and from shared memory."""
+        with SharedResultBatch.from_results(RESULTS) as batch:
+            assert list(batch) == RESULTS
+            assert len(batch) == 4
+            assert [batch[idx] for idx in range(-4, 4)] == RESULTS * 2
+
+    def test_views(self) -> None:
+        """Columns are exposed as typed memoryviews."""
+        with SharedResultBatch.from_results(RESULTS, "f", "i") as batch:
+            assert batch.tags.tolist() == [1, 0, 1, 0]
+            assert batch.values.format == "f"
+            assert batch.values.tolist() == [1.5, 0.0, -2.0, 0.0]
+            assert batch.errors.format == "i"
+            assert batch.errors.tolist() == [0, 404, 0, 7]
+
+    def test_attach(self) -> None:
+        """Other batches may attach to a segment by name."""
+        with SharedResultBatch.from_results(RESULTS) as batch:
+            with SharedResultBatch.attach(batch.name) as other:
+                assert list(other) == RESULTS
+            # Closing a reader does not unlink the segment
+            with SharedResultBatch.attach(batch.name) as other:
+                assert len(other) == 4
+
+    def test_close_unlinks(self) -> None:
+        """Closing the owner unlinks the segment."""
+        batch = SharedResultBatch.from_results(RESULTS)
+        batch.close()
+        batch.close()
+        with pytest.raises(FileNotFoundError):
+            SharedResultBatch.attach(batch.name)
+
+    @pytest.mark.parametrize(
+        "use",
+        (list, lambda b: b[0], lambda b: b.tags, lambda b: b.errors),
+    )
+    def test_closed(self, use: t.Callable[[t.Any], t.Any]) -> None:
+        """Using a closed batch raises a ValueError."""
+        batch = SharedResultBatch.from_results(RESULTS)
+        batch.close()
+        with pytest.raises(ValueError, match="batch is closed"):
+            use(batch)
+        assert len(batch) == len(RESULTS)
+
+    def test_unclosed_owner(self) -> None:
+        """An owner which is never closed unlinks its segment when freed."""
+        batch = SharedResultBatch.from_results(RESULTS)
+        name = batch.name
+        del batch
+        gc.collect()
+        with pytest.raises(FileNotFoundError):
+            SharedResultBatch.attach(name)
+
+    def test_failed_fill(self, monkeypatch: "pytest.MonkeyPatch") -> None:
+        """A segment which cannot be filled is unlinked."""
+        created = []
+
+        class Recorded(shared.SharedMemory):
+            def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+                super().__init__(*args, **kwargs)
+                created.append(self.name)
+
+        monkeypatch.setattr(shared, "SharedMemory", Recorded)
+        # Fewer values than tags
+        with pytest.raises(ValueError):
+            SharedResultBatch._create(
+                bytes([1, 1]), array("d", [1.0]), array("q", [0, 0])
+            )
+        assert len(created) == 1
+        with pytest.raises(FileNotFoundError):
+            SharedResultBatch.attach(created[0])
+
+    def test_from_batch(self) -> None:
+        """Batches may be created from a ResultBatch."""
+        with SharedResultBatch.from_results(ResultBatch(RESULTS)) as batch:
+            assert list(batch) == RESULTS
+
+    def test_pickle(self) -> None:
+        """Pickling sends only the segment's name."""
+        with SharedResultBatch.from_results([Ok(1.0)] * 10_000) as batch:
+            data = pickle.dumps(batch)
+            assert len(data) < 200
+            with pickle.loads(data) as other:
+                assert other[9_999] == Ok(1.0)
+
+    def test_other_process(self) -> None:
+        """Batches may be read in other processes."""
+        with SharedResultBatch.from_results(RESULTS) as batch:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                assert pool.submit(_read, batch).result() == RESULTS
+
+    def test_empty(self) -> None:
+        """Batches may be empty."""
+        with SharedResultBatch.from_results([]) as batch:
+            assert list(batch) == []
+
+    def test_wrong_kind(self) -> None:
+        """Attaching to an Option batch as a Result batch fails."""
+        with SharedOptionBatch.from_options(OPTIONS, "q") as batch:
+            with pytest.raises(ValueError):
+                SharedResultBatch.attach(batch.name)
+
+    def test_invalid(self) -> None:
+        """Values must match their typecode."""
+        with pytest.raises(TypeError):
+            SharedResultBatch.from_results([Ok("a")])
+        with pytest.raises(ValueError):
+            SharedResultBatch.from_results([Ok(1)], value_type="z")
+        with pytest.raises(NotImplementedError):
+            SharedResultBatch()
+
+
+class TestSharedOptionBatch:
+    """Test SharedOptionBatch."""
+
+    def test_round_trip(self) -> None:
+        """Options survive conversion to and from shared memory."""
+        with SharedOptionBatch.from_options(OPTIONS, "q") as batch:
+            assert list(batch) == OPTIONS
+            assert batch[1] is Nothing()
+            assert batch[-1] == Some(3)
+            assert batch.values.tolist() == [1, 0, 3]
+
+    def test_attach(self) -> None:
+        """Other batches may attach to a segment by name."""
+        with SharedOptionBatch.from_options(OPTIONS, "q") as batch:
+            with SharedOptionBatch.attach(batch.name) as other:
+                assert list(other) == OPTIONS
@@ -0,0 +1,149 @@
+"""Test the SparseOptionVector type."""
+
+import pickle
+import typing as t
+
+import pytest
+
+from safetywrap import Nothing, Option, Some, SparseOptionVector
+
+
+DENSE: t.List[Option[int]] = [
+    Nothing(),
+    Some(1),
+    Nothing(),
+    Nothing(),
+    Some(4),
+    Nothing(),
+]
+
+
+class TestSparseOptionVector:
+    """Test the SparseOptionVector type."""
+
+    def test_round_trip(self) -> None:
+        """Dense options survive conversion to and from a sparse vector."""
+        vec = SparseOptionVector.from_options(DENSE)
+        assert len(vec) == 6
+        assert vec.count_some() == 2
+        assert vec.to_options() == DENSE
+        assert list(vec) == DENSE
+
+    def test_of(self) -> None:
+        """None values are absent."""
+        vec = SparseOptionVector.of([None, 1, None, None, 4, None])
+        assert vec == SparseOptionVector.from_options(DENSE)
+
+    @pytest.mark.parametrize(
+        "entries",
+        ({4: 4, 1: 1}, [(4, 4), (1, 1)], iter([(1, 1), (-2, 4)])),
+    )
+    def test_construct(self, entries: t.Any) -> None:
+        """Entries may be given in any order, as a mapping or pairs."""
+        vec = SparseOptionVector(6, entries)
+        assert list(vec.items()) == [(1, 1), (4, 4)]
+        assert vec.to_options() == DENSE
+
+    def test_construct_numpy_indices(self) -> None:
+        """Indices may be NumPy integers, and are stored as ints."""
+        np = pytest.importorskip("numpy")
+        vec = SparseOptionVector(6, {np.int64(4): 4, np.int64(1): 1})
+        assert list(vec.items()) == [(1, 1), (4, 4)]
+        assert all(type(idx) is int for idx, _ in vec.items())
+
+    def test_construct_out_of_range(self) -> None:
+        """Entries must be within the vector."""
+        with pytest.raises(IndexError):
+            SparseOptionVector(2, {2: 1})
+        with pytest.raises(ValueError):
+            SparseOptionVector(-1)
+
+    @pytest.mark.parametrize(
+        "entries", ([(1, "a"), (-1, "b")], [(0, "a"), (0, "b")])
+    )
+    def test_construct_duplicate(self, entries: t.Any) -> None:
+        """Each slot may be given at most once."""
+        with pytest.raises(ValueError):
+            SparseOptionVector(2, entries)
+
+    def test_getitem(self) -> None:
+        """Indexing returns Some or Nothing."""
+        vec = SparseOptionVector.from_options(DENSE)
+        assert vec[1] == Some(1)
+        assert vec[0] is Nothing()
+        assert vec[-2] == Some(4)
+        with pytest.raises(IndexError):
+            vec[6]  # pylint: disable=pointless-statement
+
+    def test_get(self) -> None:
+        """get() returns Nothing rather than raising."""
+        vec = SparseOptionVector.from_options(DENSE)
+        assert vec.get(4) == Some(4)
+        assert vec.get(2) is Nothing()
+        assert vec.get(100) is Nothing()
+
+    def test_present_entries(self) -> None:
+        """Present entries are iterated in index order."""
+        vec = SparseOptionVector(10, {7: "c", 2: "a", 5: "b"})
+        assert list(vec.indices()) == [2, 5, 7]
+        assert list(vec.values()) == ["a", "b", "c"]
+
+    def test_map(self) -> None:
+        """Only present entries are mapped."""
+        vec = SparseOptionVector.from_options(DENSE).map(lambda x: x * 10)
+        assert vec.to_options() == [o.map(lambda x: x * 10) for o in DENSE]
+
+    def test_filter(self) -> None:
+        """Entries failing the predicate are dropped."""
+        vec = SparseOptionVector.from_options(DENSE).filter(lambda x: x > 1)
+        assert vec.to_options() == [o.filter(lambda x: x > 1) for o in DENSE]
+
+    def test_merge(self) -> None:
+        """Merging takes entries from either, preferring our own."""
+        ours = SparseOptionVector(5, {0: "a", 3: "b"})
+        theirs = SparseOptionVector(5, {1: "x", 3: "y", 4: "z"})
+        merged = ours.merge(theirs)
+        assert list(merged.items()) == [(0, "a"), (1, "x"), (3, "b"), (4, "z")]
+        assert merged.to_options() == [
+            o.or_(p) for o, p in zip(ours.to_options(), theirs.to_options())
+        ]
+
+    def test_merge_combine(self) -> None:
+        """Overlapping entries may be combined."""
+        ours = SparseOptionVector(3, {0: 1, 2: 2})
+        theirs = SparseOptionVector(3, {2: 10})
+        merged = ours.merge(theirs, lambda a, b: a + b)
+        assert list(merged.items()) == [(0, 1), (2, 12)]
+
+    def test_merge_length_mismatch(self) -> None:
+        """Only vectors of the same length may be merged."""
+        with pytest.raises(ValueError):
+            SparseOptionVector(3).merge(SparseOptionVector(4))
+
+    @pytest.mark.parametrize(
+        "dense",
+        (DENSE, [Some(1), Some(2)], [], [Nothing()], [Some(1), Nothing()]),
+    )
+    def test_collect(self, dense: t.List[Option[int]]) -> None:
+        """Collecting matches Option.collect() on the dense options."""
+        vec = SparseOptionVector.from_options(dense)
+        assert vec.collect() == Option.collect(dense)
+
+    def test_equality(self) -> None:
+        """Vectors are equal if their lengths and entries are."""
+        assert SparseOptionVector(3, {1: 1}) == SparseOptionVector(3, {1: 1})
+        assert SparseOptionVector(3, {1: 1}) != SparseOptionVector(4, {1: 1})
+        assert SparseOptionVector(3, {1: 1}) != SparseOptionVector(3, {1: 2})
+
+    def test_pickle(self) -> None:
+        """Vectors survive a pickle round trip."""
+        vec = SparseOptionVector(5, {3: "c", 0: "a"})
+        copied = pickle.loads(pickle.dumps(vec, pickle.HIGHEST_PROTOCOL))
+        assert copied == vec
+        assert list(copied.indices()) == [0, 3]
+
+    def test_repr(self) -> None:
+        """The repr shows the length and entries."""
+        assert repr(SparseOptionVector(3, {1: "a"})) == (
+            "SparseOptionVector(3, {1: 'a'})"
+        )